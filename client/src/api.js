@@ -16,4 +16,82 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// One refresh at a time: parallel 401s all wait for the same rotation,
+// since presenting an already rotated refresh token revokes every session.
+let refreshing = null;
+
+function refreshTokens() {
+  if (!refreshing) {
+    const refreshToken = localStorage.getItem("refresh_token");
+    refreshing = axios
+      .post(`${api.defaults.baseURL}/auth/refresh`, { refresh_token: refreshToken })
+      .then((res) => {
+        const { access_token, refresh_token, roles } = res.data;
+        localStorage.setItem("access_token", access_token);
+        localStorage.setItem("refresh_token", refresh_token);
+        localStorage.setItem("user_roles", JSON.stringify(roles));
+        return access_token;
+      })
+      .catch((error) => {
+        // Another tab rotated the same token a moment earlier: use its result
+        const current = localStorage.getItem("refresh_token");
+        if (current && current !== refreshToken) {
+          return localStorage.getItem("access_token");
+        }
+        throw error;
+      })
+      .finally(() => {
+        refreshing = null;
+      });
+  }
+  return refreshing;
+}
+
+api.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const original = error.config;
+    const isAuthCall = original?.url?.startsWith("/auth/");
+
+    if (
+      error.response?.status !== 401 ||
+      !original ||
+      original._retried ||
+      isAuthCall ||
+      !localStorage.getItem("refresh_token")
+    ) {
+      return Promise.reject(error);
+    }
+
+    original._retried = true;
+    try {
+      const accessToken = await refreshTokens();
+      original.headers.Authorization = `Bearer ${accessToken}`;
+      return api(original);
+    } catch (refreshError) {
+      localStorage.removeItem("access_token");
+      localStorage.removeItem("refresh_token");
+      localStorage.removeItem("user_roles");
+      window.location.href = "/login";
+      return Promise.reject(refreshError);
+    }
+  }
+);
+
+// Meeting point PDF as a Blob. A version that is not rendered yet comes
+// back as 202 with an export job, polled here until the file is ready.
+export async function fetchMeetingPointsPdf(params) {
+  const res = await api.get("/meeting-points/export", { params, responseType: "blob" });
+  if (res.status !== 202) return res.data;
+
+  let job = JSON.parse(await res.data.text());
+  while (job.status === "queued" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+    job = (await api.get(`/meeting-points/export-jobs/${job.job_id}`)).data;
+  }
+  if (job.status !== "done") throw new Error(job.error || "PDF export failed");
+
+  return (await api.get(job.download_url, { responseType: "blob" })).data;
+}
+
 export default api;
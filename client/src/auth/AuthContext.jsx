@@ -44,9 +44,10 @@ export function AuthProvider({ children }) {
       password,
     });
 
-    const { access_token, roles } = res.data;
+    const { access_token, refresh_token, roles } = res.data;
 
     localStorage.setItem("access_token", access_token);
+    localStorage.setItem("refresh_token", refresh_token);
     localStorage.setItem("user_roles", JSON.stringify(roles));
 
     setAccessToken(access_token);
@@ -3,7 +3,7 @@ import { Calendar, momentLocalizer } from "react-big-calendar";
 import moment from "moment";
 import "moment/locale/es";
 import "react-big-calendar/lib/css/react-big-calendar.css";
-import api from "../../api";
+import api, { fetchMeetingPointsPdf } from "../../api";
 import { useAuth } from "../../auth/AuthContext";
 
 moment.locale("es");
@@ -41,10 +41,9 @@ export default function Dashboard() {
   }
 
   function handleExportPDF() {
-    api
-      .get(`/meeting-points/export?month=${month}`, { responseType: "blob" })
-      .then((res) => {
-        const url = window.URL.createObjectURL(new Blob([res.data]));
+    fetchMeetingPointsPdf({ month })
+      .then((pdf) => {
+        const url = window.URL.createObjectURL(pdf);
         const a = document.createElement("a");
         a.href = url;
         a.download = `puntos_encuentro_${month}.pdf`;
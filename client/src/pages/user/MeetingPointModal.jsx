@@ -4,7 +4,7 @@ import api from "../../api";
 export default function MeetingPointModal({ isOpen, onClose, onSaved, editData }) {
   const [isSeries, setIsSeries] = useState(false);
   const [users, setUsers] = useState([]);
-  const [conductorStats, setConductorStats] = useState([]);
+  const [suggestions, setSuggestions] = useState([]);
   const [loading, setLoading] = useState(false);
 
   const [form, setForm] = useState({
@@ -23,11 +23,23 @@ export default function MeetingPointModal({ isOpen, onClose, onSaved, editData }
   useEffect(() => {
     if (isOpen) {
       api.get("/users/bookable-users").then((res) => setUsers(res.data)).catch(() => {});
-      const currentYear = new Date().getFullYear();
-      api.get(`/meeting-points/stats?year=${currentYear}`).then((res) => setConductorStats(res.data)).catch(() => {});
     }
   }, [isOpen]);
 
+  // Ranked conductor shortlist for the chosen date (first date of a series)
+  const suggestionDate = isSeries && !editData ? form.start_date : form.date;
+  useEffect(() => {
+    if (!isOpen || !suggestionDate) {
+      setSuggestions([]);
+      return;
+    }
+    const editing = editData ? `&meeting_point_id=${editData.id}` : "";
+    api
+      .get(`/meeting-points/suggest-conductor?date=${suggestionDate}&limit=5${editing}`)
+      .then((res) => setSuggestions(res.data))
+      .catch(() => setSuggestions([]));
+  }, [isOpen, suggestionDate, editData]);
+
   useEffect(() => {
     if (editData) {
       setIsSeries(false);
@@ -106,14 +118,10 @@ export default function MeetingPointModal({ isOpen, onClose, onSaved, editData }
     }
   }
 
-  const sortedUsers = useMemo(() => {
-    if (conductorStats.length === 0) return users;
-    const statsMap = {};
-    conductorStats.forEach((s) => { statsMap[s.user_id] = s.count; });
-    return users
-      .map((u) => ({ ...u, statsCount: statsMap[u.id] ?? null }))
-      .sort((a, b) => (a.statsCount ?? Infinity) - (b.statsCount ?? Infinity));
-  }, [users, conductorStats]);
+  const otherUsers = useMemo(() => {
+    const suggested = new Set(suggestions.map((s) => s.user_id));
+    return users.filter((u) => !suggested.has(u.id));
+  }, [users, suggestions]);
 
   if (!isOpen) return null;
 
@@ -234,11 +242,22 @@ export default function MeetingPointModal({ isOpen, onClose, onSaved, editData }
               className={inputClass}
             >
               <option value="">— Sin asignar —</option>
-              {sortedUsers.map((u) => (
-                <option key={u.id} value={u.id}>
-                  {u.firstname} {u.lastname}{u.statsCount != null ? ` (${u.statsCount})` : ""}
-                </option>
-              ))}
+              {suggestions.length > 0 && (
+                <optgroup label="Sugeridos">
+                  {suggestions.map((s) => (
+                    <option key={s.user_id} value={s.user_id}>
+                      {s.firstname} {s.lastname} ({s.count}){s.same_day > 0 ? " · ocupado ese día" : ""}
+                    </option>
+                  ))}
+                </optgroup>
+              )}
+              <optgroup label={suggestions.length > 0 ? "Todos" : "Directores"}>
+                {otherUsers.map((u) => (
+                  <option key={u.id} value={u.id}>
+                    {u.firstname} {u.lastname}
+                  </option>
+                ))}
+              </optgroup>
             </select>
           </div>
 
@@ -4,7 +4,7 @@ import { Calendar, momentLocalizer } from "react-big-calendar";
 import moment from "moment";
 import "moment/locale/es";
 import "react-big-calendar/lib/css/react-big-calendar.css";
-import api from "../../api";
+import api, { fetchMeetingPointsPdf } from "../../api";
 import { useAuth } from "../../auth/AuthContext";
 import MeetingPointModal from "./MeetingPointModal";
 
@@ -70,10 +70,9 @@ export default function MeetingPoints() {
   }
 
   function handleExportPDF() {
-    api
-      .get(`/meeting-points/export?month=${month}`, { responseType: "blob" })
-      .then((res) => {
-        const url = window.URL.createObjectURL(new Blob([res.data]));
+    fetchMeetingPointsPdf({ month })
+      .then((pdf) => {
+        const url = window.URL.createObjectURL(pdf);
         const a = document.createElement("a");
         a.href = url;
         a.download = `puntos_encuentro_${month}.pdf`;
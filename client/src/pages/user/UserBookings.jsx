@@ -21,6 +21,38 @@ export default function UserBookings() {
     loadCalendarBookings();
   }, [date, view]);
 
+  // Live updates: apply booking deltas instead of reloading the whole range
+  useEffect(() => {
+    const { start, end } = getDateRange();
+    const params = new URLSearchParams({
+      start_date: start.toISOString(),
+      end_date: end.toISOString(),
+    });
+    const source = new EventSource(`${api.defaults.baseURL}/bookings/stream?${params}`);
+
+    source.addEventListener("booking", (msg) => {
+      const booking = JSON.parse(msg.data);
+
+      setEvents((current) => {
+        const others = current.filter((e) => e.id !== booking.id);
+        if (booking.type === "deleted") return others;
+        return [...others, toCalendarEvent(booking)];
+      });
+    });
+
+    return () => source.close();
+  }, [date, view]);
+
+  function toCalendarEvent(booking) {
+    return {
+      id: booking.id,
+      title: `${booking.cart_name} - ${booking.participant_names.join(", ")}`,
+      start: new Date(booking.start_datetime),
+      end: new Date(booking.end_datetime),
+      resource: booking,
+    };
+  }
+
   async function loadCarts() {
     const res = await api.get("/carts");
     setCarts(res.data);
@@ -44,13 +76,7 @@ export default function UserBookings() {
       });
 
       // Transform API data to calendar events
-      const calendarEvents = res.data.map((booking) => ({
-        id: booking.id,
-        title: `${booking.cart_name} - ${booking.participant_names.join(", ")}`,
-        start: new Date(booking.start_datetime),
-        end: new Date(booking.end_datetime),
-        resource: booking,
-      }));
+      const calendarEvents = res.data.map(toCalendarEvent);
 
       setEvents(calendarEvents);
     } catch (err) {
@@ -16,6 +16,8 @@ from models.booking_participant import BookingParticipant
 from models.event import Event
 from models.refresh_token import RefreshToken
 from models.meeting_point import MeetingPoint
+from models.meeting_point_version import MeetingPointVersion
+from models.conductor_stat import ConductorStat
 
 # this is the Alembic Config object
 config = context.config
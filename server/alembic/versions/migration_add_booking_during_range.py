@@ -0,0 +1,39 @@
+"""Add generated tstzrange column with GiST index to cart_bookings
+
+Revision ID: add_booking_during_range
+Revises: b0554fd4f809
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = "add_booking_during_range"
+down_revision = "b0554fd4f809"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist lets the uuid cart_id live in the same GiST index as the range
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.execute(
+        """
+        ALTER TABLE cart_bookings
+        ADD COLUMN during tstzrange
+        GENERATED ALWAYS AS (tstzrange(start_datetime, end_datetime, '[)')) STORED
+        """
+    )
+
+    op.execute(
+        """
+        CREATE INDEX ix_cart_bookings_cart_id_during
+        ON cart_bookings USING gist (cart_id, during)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_cart_bookings_cart_id_during")
+    op.drop_column("cart_bookings", "during")
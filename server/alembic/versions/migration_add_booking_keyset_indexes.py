@@ -0,0 +1,43 @@
+"""Add indexes for keyset-paginated booking lists
+
+Revision ID: add_booking_keyset_indexes
+Revises: add_booking_during_range
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = "add_booking_keyset_indexes"
+down_revision = "add_booking_during_range"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # /bookings/cart/{id}: WHERE cart_id = ? ORDER BY start_datetime, id
+    op.create_index(
+        "ix_cart_bookings_cart_id_start_id",
+        "cart_bookings",
+        ["cart_id", "start_datetime", "id"],
+    )
+    # /bookings/my-bookings: participant lookup, then ordered by start_datetime, id
+    op.create_index(
+        "ix_cart_bookings_start_id",
+        "cart_bookings",
+        ["start_datetime", "id"],
+    )
+    # Covers the join so participants don't need a heap lookup; replaces the plain user_id index
+    op.create_index(
+        "ix_booking_participants_user_id_booking_id",
+        "booking_participants",
+        ["user_id", "booking_id"],
+    )
+    op.drop_index("ix_booking_participants_user_id", table_name="booking_participants")
+
+
+def downgrade() -> None:
+    op.create_index("ix_booking_participants_user_id", "booking_participants", ["user_id"])
+    op.drop_index("ix_booking_participants_user_id_booking_id", table_name="booking_participants")
+    op.drop_index("ix_cart_bookings_start_id", table_name="cart_bookings")
+    op.drop_index("ix_cart_bookings_cart_id_start_id", table_name="cart_bookings")
@@ -0,0 +1,29 @@
+"""Add series_id to cart_bookings
+
+Revision ID: add_booking_series
+Revises: add_booking_keyset_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision = "add_booking_series"
+down_revision = "add_booking_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cart_bookings",
+        sa.Column("series_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_index("ix_cart_bookings_series_id", "cart_bookings", ["series_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cart_bookings_series_id", table_name="cart_bookings")
+    op.drop_column("cart_bookings", "series_id")
@@ -0,0 +1,58 @@
+"""Add conductor_stats rollup table
+
+Revision ID: add_conductor_stats
+Revises: add_meeting_point_versions
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision = "add_conductor_stats"
+down_revision = "add_meeting_point_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conductor_stats",
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column(
+            "conductor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_date", sa.Date(), nullable=True),
+        sa.PrimaryKeyConstraint("year", "month", "conductor_id"),
+    )
+    op.create_index(
+        "ix_conductor_stats_year_conductor_id",
+        "conductor_stats",
+        ["year", "conductor_id"],
+    )
+
+    # Backfill from existing meeting points
+    op.execute(
+        """
+        INSERT INTO conductor_stats (year, month, conductor_id, count, last_date)
+        SELECT CAST(substr(month, 1, 4) AS integer),
+               CAST(substr(month, 6, 2) AS integer),
+               conductor_id,
+               count(*),
+               max(date)
+        FROM meeting_points
+        WHERE conductor_id IS NOT NULL
+        GROUP BY month, conductor_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conductor_stats_year_conductor_id", table_name="conductor_stats")
+    op.drop_table("conductor_stats")
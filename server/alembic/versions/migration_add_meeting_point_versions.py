@@ -0,0 +1,27 @@
+"""Add meeting_point_versions table
+
+Revision ID: add_meeting_point_versions
+Revises: add_participant_conflict_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = "add_meeting_point_versions"
+down_revision = "add_participant_conflict_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_point_versions",
+        sa.Column("month", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("meeting_point_versions")
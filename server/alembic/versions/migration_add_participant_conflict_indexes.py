@@ -0,0 +1,33 @@
+"""Add indexes for participant double-booking checks
+
+Revision ID: add_participant_conflict_indexes
+Revises: add_booking_series
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = "add_participant_conflict_indexes"
+down_revision = "add_booking_series"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Range scan across all carts: the (cart_id, during) index needs a cart
+    op.execute("CREATE INDEX ix_cart_bookings_during ON cart_bookings USING gist (during)")
+
+    # booking -> participants without a heap lookup; replaces the plain booking_id index
+    op.create_index(
+        "ix_booking_participants_booking_id_user_id",
+        "booking_participants",
+        ["booking_id", "user_id"],
+    )
+    op.drop_index("ix_booking_participants_booking_id", table_name="booking_participants")
+
+
+def downgrade() -> None:
+    op.create_index("ix_booking_participants_booking_id", "booking_participants", ["booking_id"])
+    op.drop_index("ix_booking_participants_booking_id_user_id", table_name="booking_participants")
+    op.execute("DROP INDEX IF EXISTS ix_cart_bookings_during")
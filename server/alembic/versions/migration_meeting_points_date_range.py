@@ -0,0 +1,29 @@
+"""Replace meeting_points.month with a (date, time) index
+
+Revision ID: meeting_points_date_range
+Revises: add_conductor_stats
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = "meeting_points_date_range"
+down_revision = "add_conductor_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_meeting_points_date_time", "meeting_points", ["date", "time"])
+    op.drop_index("ix_meeting_points_month", table_name="meeting_points")
+    op.drop_column("meeting_points", "month")
+
+
+def downgrade() -> None:
+    op.add_column("meeting_points", sa.Column("month", sa.String(), nullable=True))
+    op.execute("UPDATE meeting_points SET month = to_char(date, 'YYYY-MM')")
+    op.alter_column("meeting_points", "month", nullable=False)
+    op.create_index("ix_meeting_points_month", "meeting_points", ["month"])
+    op.drop_index("ix_meeting_points_date_time", table_name="meeting_points")
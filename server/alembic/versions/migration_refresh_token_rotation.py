@@ -0,0 +1,30 @@
+"""Add refresh token revoked_at and (user_id, revoked) index
+
+Revision ID: refresh_token_rotation
+Revises: users_lower_unique
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = "refresh_token_rotation"
+down_revision = "users_lower_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lookups by token already use the unique index on refresh_tokens.token
+    op.add_column("refresh_tokens", sa.Column("revoked_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_refresh_tokens_user_id_revoked",
+        "refresh_tokens",
+        ["user_id", "revoked"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_user_id_revoked", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "revoked_at")
@@ -0,0 +1,36 @@
+"""Add case-insensitive unique indexes on users.username and users.email
+
+Revision ID: users_lower_unique
+Revises: meeting_points_date_range
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = "users_lower_unique"
+down_revision = "meeting_points_date_range"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fails if two existing users differ only by case; merge them first
+    op.create_index(
+        "uq_users_lower_username",
+        "users",
+        [sa.text("lower(username)")],
+        unique=True,
+    )
+    op.create_index(
+        "uq_users_lower_email",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_users_lower_email", table_name="users")
+    op.drop_index("uq_users_lower_username", table_name="users")
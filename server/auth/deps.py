@@ -2,21 +2,43 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt
+from sqlalchemy.orm import Session
 from config import settings
+from db.database import get_db
+from auth.token_cache import VerifiedTokenCache
+from auth.user_status import UserStatusCache
 
 security = HTTPBearer()
 
+verified_tokens = VerifiedTokenCache(
+    max_entries=settings.token_cache_max_entries,
+    ttl_seconds=settings.token_cache_ttl_seconds,
+)
+
+user_status = UserStatusCache(ttl_seconds=settings.user_status_ttl_seconds)
+
 def get_current_user(
     creds: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
 ):
-    try:
-        payload = jwt.decode(
-            creds.credentials,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-        )
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=str(e))
+    payload = verified_tokens.get(creds.credentials)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                creds.credentials,
+                settings.jwt_secret,
+                algorithms=[settings.jwt_algorithm],
+            )
+        except Exception as e:
+            raise HTTPException(status_code=401, detail=str(e))
+
+        verified_tokens.put(creds.credentials, payload)
+
+    # Roles in the token are as of login; the current ones come from the status cache
+    active, roles = user_status.get(db, payload.get("sub"))
+    if not active:
+        raise HTTPException(status_code=401, detail="User is inactive or no longer exists")
+    payload["roles"] = roles
 
     return payload
 
@@ -0,0 +1,37 @@
+# auth/feed_tokens.py
+import base64
+import hashlib
+import hmac
+from uuid import UUID
+
+from config import settings
+
+
+def _signature(user_id: UUID) -> str:
+    digest = hmac.new(
+        settings.jwt_secret.encode(),
+        b"ical-feed:" + user_id.bytes,
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest[:18]).decode()
+
+
+def create_feed_token(user_id: UUID) -> str:
+    """
+    Long-lived token for calendar feed URLs. Calendar apps can't send a
+    bearer header, so the user id is signed into the URL instead.
+    """
+    user_part = base64.urlsafe_b64encode(user_id.bytes).decode().rstrip("=")
+    return f"{user_part}.{_signature(user_id)}"
+
+
+def verify_feed_token(token: str) -> UUID | None:
+    try:
+        user_part, signature = token.split(".", 1)
+        user_id = UUID(bytes=base64.urlsafe_b64decode(user_part + "=" * (-len(user_part) % 4)))
+    except ValueError:
+        return None
+
+    if not hmac.compare_digest(signature, _signature(user_id)):
+        return None
+    return user_id
@@ -0,0 +1,103 @@
+# auth/refresh_tokens.py
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+from db.database import SessionLocal
+from models.refresh_token import RefreshToken
+
+REFRESH_TOKEN_DAYS = 14
+REUSE_DETECTION_DAYS = 1  # rotated tokens are kept this long so a replay is recognised
+ROTATION_GRACE_SECONDS = 10  # a second refresh within this window is a race, not a replay
+PURGE_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def issue_refresh_token(db: Session, user_id) -> uuid.UUID:
+    token = uuid.uuid4()
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            token=token,
+            expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_DAYS),
+            revoked=False,
+        )
+    )
+    return token
+
+
+def revoke_user_tokens(db: Session, user_id):
+    """Revoke every live refresh token of a user (reuse of a rotated token)."""
+    db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.revoked == False,
+    ).update({"revoked": True, "revoked_at": datetime.utcnow()}, synchronize_session=False)
+
+
+def purge_refresh_tokens(db: Session, batch_size: int = PURGE_BATCH_SIZE) -> int:
+    """
+    Delete expired tokens and revoked ones past the reuse window, one
+    committed batch at a time so no long lock is held on the table.
+    Returns the number of deleted rows.
+    """
+    now = datetime.utcnow()
+    stale = or_(
+        RefreshToken.expires_at < now,
+        RefreshToken.revoked_at < now - timedelta(days=REUSE_DETECTION_DAYS),
+    )
+
+    total = 0
+    while True:
+        batch = (
+            select(RefreshToken.id)
+            .where(stale)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        deleted = db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch.scalar_subquery()))
+        ).rowcount
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+class RefreshTokenPurger:
+    """Background thread that purges stale refresh tokens every `interval_minutes`."""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, interval_minutes: int):
+        if interval_minutes <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_minutes * 60,), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, interval_seconds: int):
+        while not self._stop.wait(interval_seconds):
+            db = SessionLocal()
+            try:
+                deleted = purge_refresh_tokens(db)
+                if deleted:
+                    logger.info("Purged %d stale refresh tokens", deleted)
+            except Exception:
+                db.rollback()
+                logger.exception("Refresh token purge failed")
+            finally:
+                db.close()
+
+
+refresh_token_purger = RefreshTokenPurger()
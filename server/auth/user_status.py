@@ -0,0 +1,123 @@
+# auth/user_status.py
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models.user import User
+
+
+CHANNEL = "user_status"
+
+
+class UserStatusCache:
+    """
+    Active flag and roles per user id, read from the database at most once
+    per `ttl_seconds`. Users that do not exist are cached as inactive, so a
+    stale token of a deleted user does not cost a query per request either.
+
+    Changes reach every worker at once: the user admin endpoints `publish()`
+    a pg_notify inside their transaction and each worker's cache listens on
+    CHANNEL through the booking event hub (`follow()`). While that LISTEN
+    connection is down nothing is served from the cache.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user_id -> (expires_at, active, roles)
+        self._loads = {}  # user_id -> [loads in flight, invalidations since they started]
+        self.live = False
+
+    def get(self, db: Session, user_id: str) -> tuple[bool, list[str]]:
+        """(active, roles) of the user, from cache or a single primary key lookup."""
+        user_id = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if self.live and entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                return entry[1], entry[2]
+            load = self._loads.setdefault(user_id, [0, 0])
+            load[0] += 1
+            invalidations = load[1]
+
+        try:
+            active, roles = self._load(db, user_id)
+        except Exception:
+            with self._lock:
+                self._finish_load(user_id)
+            raise
+
+        with self._lock:
+            stale = self._finish_load(user_id) != invalidations
+            if stale or not self.live:
+                # Invalidated while loading: the row read may predate the change
+                return active, roles
+            self._entries[user_id] = (now + self.ttl_seconds, active, roles)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return active, roles
+
+    def _finish_load(self, user_id: str) -> int:
+        """Caller holds the lock. Returns the invalidation count of the user's loads."""
+        load = self._loads[user_id]
+        load[0] -= 1
+        if load[0] == 0:
+            del self._loads[user_id]
+        return load[1]
+
+    @staticmethod
+    def _load(db: Session, user_id: str) -> tuple[bool, list[str]]:
+        try:
+            key = uuid.UUID(user_id)
+        except ValueError:
+            return False, []
+        row = db.query(User.active, User.roles).filter(User.id == key).first()
+        if not row:
+            return False, []
+        return bool(row.active), list(row.roles or [])
+
+    @staticmethod
+    def publish(db: Session, user_id):
+        """Queue an invalidation for every worker; delivered when `db` commits."""
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": json.dumps({"user_id": str(user_id)})},
+        )
+
+    def invalidate(self, user_id):
+        user_id = str(user_id)
+        with self._lock:
+            self._entries.pop(user_id, None)
+            load = self._loads.get(user_id)
+            if load:
+                load[1] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for load in self._loads.values():
+                load[1] += 1
+
+    def follow(self, hub):
+        hub.add_listener(self, channel=CHANNEL)
+
+    # Booking event hub listener
+
+    def listening(self):
+        # Invalidations sent while we were not listening are lost
+        self.clear()
+        self.live = True
+
+    def apply(self, event: dict):
+        self.invalidate(event["user_id"])
+
+    def disconnected(self):
+        self.live = False
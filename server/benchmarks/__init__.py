@@ -0,0 +1,10 @@
+"""
+Benchmarks backing the performance claims of the server code.
+
+Run from the server/ directory, e.g.
+
+    python -m benchmarks.bench_booking_throughput
+
+Scripts that touch the database use DATABASE_URL (like the app) and remove
+everything they create. Numbers are printed, nothing is asserted.
+"""
@@ -0,0 +1,74 @@
+"""
+Overlap count per cart: the in-memory BookingIndex vs. the SQL count that
+POST /bookings runs, on a few tens of thousands of upcoming bookings.
+
+    python -m benchmarks.bench_booking_index [carts] [bookings_per_cart]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from benchmarks.common import report, scratch_data, timed
+from db.database import SessionLocal
+from models.cart_booking import CartBooking
+from routers.bookings import overlaps
+from utils.booking_index import BookingIndex
+
+
+def main(carts: int = 20, per_cart: int = 2500, lookups: int = 2000):
+    db = SessionLocal()
+    try:
+        with scratch_data(db, carts=carts) as (cart_rows, _):
+            now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+            # One two-hour booking every three hours per cart
+            db.execute(
+                text(
+                    "INSERT INTO cart_bookings (id, cart_id, start_datetime, end_datetime) "
+                    "SELECT gen_random_uuid(), c, :now + g * interval '3 hours', "
+                    "       :now + g * interval '3 hours' + interval '2 hours' "
+                    "FROM unnest(CAST(:cart_ids AS uuid[])) AS c, generate_series(1, :per_cart) AS g"
+                ),
+                {"now": now, "cart_ids": [str(c.id) for c in cart_rows], "per_cart": per_cart},
+            )
+            db.commit()
+            db.execute(text("ANALYZE cart_bookings"))
+
+            index = BookingIndex()
+            started = time.perf_counter()
+            index.warm(db)
+            print(f"warm-up: {time.perf_counter() - started:.3f}s")
+
+            rng = random.Random(1)
+            windows = []
+            for _ in range(lookups):
+                start = now + timedelta(minutes=30 * rng.randrange(per_cart * 6))
+                windows.append((rng.choice(cart_rows).id, start, start + timedelta(hours=2)))
+
+            for cart_id, start, end in windows[:100]:
+                sql = db.query(CartBooking).filter(CartBooking.cart_id == cart_id, overlaps(start, end)).count()
+                assert index.overlap_count(cart_id, start, end) == sql
+
+            sql_windows, index_windows = iter(windows), iter(windows)
+
+            def sql_count():
+                cart_id, start, end = next(sql_windows)
+                db.query(CartBooking).filter(CartBooking.cart_id == cart_id, overlaps(start, end)).count()
+
+            report("SQL overlap count", timed(sql_count, lookups), unit="us")
+            report(
+                "BookingIndex.overlap_count",
+                timed(lambda: index.overlap_count(*next(index_windows)), lookups),
+                unit="us",
+            )
+
+            diff = index.diff(db)
+            print(f"consistency check: {len(diff['missing'])} missing, {len(diff['stale'])} stale")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+POST /bookings throughput, all workers booking one cart vs. each worker
+booking its own cart.
+
+The cart row lock serializes bookings of the same cart only, so the
+second scenario should scale with the number of workers while the first
+stays flat.
+
+    python -m benchmarks.bench_booking_throughput [workers] [bookings_per_worker]
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import report, scratch_data
+from db.database import SessionLocal
+from main import app
+
+
+def run(client, cart_for_worker, users, per_worker, base):
+    barrier = threading.Barrier(len(users))
+
+    def worker(n):
+        samples = []
+        barrier.wait()
+        for i in range(per_worker):
+            # Every booking gets its own hour, so none is rejected for overlap
+            start = base + timedelta(hours=n * per_worker + i)
+            started = time.perf_counter()
+            response = client.post("/bookings", json={
+                "cart_id": str(cart_for_worker(n).id),
+                "participant_ids": [str(users[n].id)],
+                "start_datetime": start.isoformat(),
+                "end_datetime": (start + timedelta(minutes=50)).isoformat(),
+            })
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 201, response.text
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(users)) as pool:
+        samples = [s for worker_samples in pool.map(worker, range(len(users))) for s in worker_samples]
+    return samples, time.perf_counter() - started
+
+
+def main(workers: int = 8, per_worker: int = 25):
+    client = TestClient(app)
+    db = SessionLocal()
+    try:
+        with scratch_data(db, carts=workers, users=workers) as (carts, users):
+            base = (datetime.now(timezone.utc) + timedelta(days=30)).replace(minute=0, second=0, microsecond=0)
+            for name, cart_for_worker in [
+                ("same cart", lambda n: carts[0]),
+                ("cart per worker", lambda n: carts[n]),
+            ]:
+                samples, elapsed = run(client, cart_for_worker, users, per_worker, base)
+                base += timedelta(hours=workers * per_worker)  # next scenario starts after this one
+                report(f"{name} ({workers} workers)", samples)
+                print(f"{'':<40} {len(samples) / elapsed:.0f} bookings/s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
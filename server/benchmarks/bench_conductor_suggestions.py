@@ -0,0 +1,57 @@
+"""
+Conductor suggestions with a few hundred eligible conductors: the top-k
+for one date and the greedy plan of a whole month, as the suggest-conductor
+endpoints run them, against sorting every conductor by score.
+
+No database needed, counts and assignments are synthetic:
+
+    python -m benchmarks.bench_conductor_suggestions [conductors] [slots_per_day]
+"""
+import random
+import sys
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.common import report, timed
+from utils.conductor_suggestions import RECENCY_WINDOW_DAYS, ConductorPlanner
+
+
+def make_planner(conductors: int, rng: random.Random) -> ConductorPlanner:
+    ids = [uuid.uuid4() for _ in range(conductors)]
+    names = {c: ("Conductor", str(i)) for i, c in enumerate(ids)}
+    counts = {c: rng.randrange(0, 30) for c in ids}
+    first = date(2026, 6, 1) - timedelta(days=RECENCY_WINDOW_DAYS)
+    assignments = [
+        (rng.choice(ids), first + timedelta(days=rng.randrange(RECENCY_WINDOW_DAYS * 2 + 30)))
+        for _ in range(conductors * 4)
+    ]
+    return ConductorPlanner(names, counts, assignments)
+
+
+def main(conductors: int = 300, slots_per_day: int = 3, limit: int = 3, repeat: int = 50):
+    rng = random.Random(1)
+    planner = make_planner(conductors, rng)
+    day = date(2026, 6, 15)
+
+    report(f"top({limit}) for one date, {conductors} conductors", timed(lambda: planner.top(day, limit), repeat))
+    report(
+        f"full sort for one date, {conductors} conductors",
+        timed(lambda: sorted((planner.score(c, day) for c in planner.conductors), key=lambda s: -s["score"]), repeat),
+    )
+
+    slots = [date(2026, 6, 1) + timedelta(days=d) for d in range(30) for _ in range(slots_per_day)]
+
+    planners = iter([make_planner(conductors, random.Random(1)) for _ in range(repeat // 5 or 1)])
+
+    def plan_month():
+        month_planner = next(planners)
+        for slot in slots:
+            suggestions = month_planner.top(slot, limit)
+            if suggestions:
+                month_planner.assign(suggestions[0]["user_id"], slot)
+
+    report(f"plan a month ({len(slots)} slots)", timed(plan_month, repeat // 5 or 1))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
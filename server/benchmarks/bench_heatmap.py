@@ -0,0 +1,44 @@
+"""
+Occupancy heatmap for a full year: build_occupancy_matrix over all carts
+at 30 minute buckets, from already fetched intervals (the SQL side is a
+plain range scan and not measured here).
+
+No database needed:
+
+    python -m benchmarks.bench_heatmap [carts] [bookings_per_cart_per_day]
+"""
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import report, timed
+from utils.occupancy_heatmap import build_occupancy_matrix, parse_bucket
+
+
+def main(carts: int = 30, per_day: int = 4, repeat: int = 20):
+    rng = random.Random(1)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(days=365)
+    cart_ids = [uuid.uuid4() for _ in range(carts)]
+
+    intervals = []
+    for cart_id in cart_ids:
+        for day in range(365):
+            for _ in range(per_day):
+                booking_start = start + timedelta(days=day, minutes=30 * rng.randrange(14, 40))
+                intervals.append((cart_id, booking_start, booking_start + timedelta(hours=rng.choice([1, 2, 3]))))
+
+    bucket = parse_bucket("30m")
+    matrix = build_occupancy_matrix(intervals, cart_ids, start, end, bucket)
+    print(f"{len(intervals)} bookings -> matrix {matrix.shape[0]} carts x {matrix.shape[1]} buckets")
+
+    report(
+        "build_occupancy_matrix, one year",
+        timed(lambda: build_occupancy_matrix(intervals, cart_ids, start, end, bucket), repeat),
+    )
+    report("  + rows to lists for the response", timed(lambda: matrix.tolist(), repeat))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Login latency under a burst of concurrent logins (a meeting starting).
+
+Fires `logins` POST /auth/login at once against the app in-process and
+reports p50/p99. Meanwhile a probe measures how late the event loop wakes
+up from a 10ms sleep; with bcrypt on the hasher pool that lag should stay
+small, i.e. other requests keep being served during the burst.
+
+    python -m benchmarks.bench_login_burst [logins]
+"""
+import asyncio
+import sys
+import time
+
+import httpx
+
+from auth.security import hash_password
+from benchmarks.common import report, scratch_data
+from config import settings
+from db.database import SessionLocal
+from main import app
+
+PASSWORD = "bench-password"
+
+
+async def loop_lag(stop: asyncio.Event, samples: list[float]):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append(time.perf_counter() - started - 0.01)
+
+
+async def burst(usernames: list[str]):
+    async def login(client, username):
+        started = time.perf_counter()
+        response = await client.post("/auth/login", json={"identifier": username, "password": PASSWORD})
+        assert response.status_code == 200, response.text
+        return time.perf_counter() - started
+
+    stop, lag = asyncio.Event(), []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        probe = asyncio.create_task(loop_lag(stop, lag))
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(login(client, name) for name in usernames))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+    return latencies, lag, elapsed
+
+
+def main(logins: int = 100):
+    db = SessionLocal()
+    try:
+        with scratch_data(db, users=logins) as (_, users):
+            password_hash = hash_password(PASSWORD)
+            for user in users:
+                user.password_hash = password_hash
+            db.commit()
+            usernames = [user.username for user in users]
+
+            latencies, lag, elapsed = asyncio.run(burst(usernames))
+            report(f"login ({logins} concurrent)", latencies)
+            report("event loop lag during burst", lag)
+            print(f"{'':<40} {logins / elapsed:.1f} logins/s, {settings.password_hash_workers} hasher threads")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""
+Multi-month PDF export: a 12-month document should cost about 12x a
+single month (no worse). Sections are built lazily, so peak memory
+grows with the written PDF, not with 12 months of table flowables.
+
+No database needed, rows are synthetic and shaped like stream_sections() rows:
+
+    python -m benchmarks.bench_pdf_export [meeting_points_per_day]
+"""
+import io
+import sys
+import tracemalloc
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+from benchmarks.common import percentile, timed
+from utils.meeting_point_pdf import generate_meeting_points_range_pdf
+
+
+def month_rows(year: int, month: int, per_day: int):
+    day = date(year, month, 1)
+    rows = []
+    while day.month == month:
+        for i in range(per_day):
+            rows.append(SimpleNamespace(
+                date=day,
+                time=time(9 + 3 * i, 30),
+                location=f"Plaza Mayor {i + 1}",
+                conductor=SimpleNamespace(firstname="Ana", lastname="García"),
+                outline="Presentación del folleto y conversación breve",
+                link="https://example.org/meeting",
+            ))
+        day += timedelta(days=1)
+    return rows
+
+
+def sections(months: int, per_day: int):
+    """Lazily, like stream_sections() hands them to the renderer."""
+    for m in range(1, months + 1):
+        yield f"2026-{m:02d}", month_rows(2026, m, per_day)
+
+
+def render(months: int, per_day: int):
+    generate_meeting_points_range_pdf(sections(months, per_day), io.BytesIO())
+
+
+def peak_memory(months: int, per_day: int) -> int:
+    tracemalloc.start()
+    render(months, per_day)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(per_day: int = 3, repeat: int = 5):
+    one = percentile(timed(lambda: render(1, per_day), repeat), 50)
+    twelve = percentile(timed(lambda: render(12, per_day), repeat), 50)
+    print(f"1 month:   {one * 1000:8.1f}ms  peak {peak_memory(1, per_day) / 2**20:6.1f}MiB")
+    print(f"12 months: {twelve * 1000:8.1f}ms  peak {peak_memory(12, per_day) / 2**20:6.1f}MiB")
+    print(f"ratio:     {twelve / one:8.1f}x (expected <= ~12x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+Creating a meeting point series: one multi-row INSERT ... RETURNING (what
+POST /meeting-points/series does) vs. the old add + flush + refresh per
+row. Every run is rolled back, nothing stays in the database.
+
+    python -m benchmarks.bench_series_insert [occurrences]
+"""
+import sys
+import uuid
+from datetime import date, time, timedelta
+from time import perf_counter
+
+from sqlalchemy import insert
+
+from benchmarks.common import report
+from db.database import SessionLocal, engine
+from models.meeting_point import MeetingPoint
+
+
+def series_rows(occurrences: int):
+    series_id = uuid.uuid4()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "date": date(2027, 1, 1) + timedelta(days=i),
+            "time": time(10, 0),
+            "location": "Plaza Mayor",
+            "outline": "Bench",
+            "series_id": series_id,
+        }
+        for i in range(occurrences)
+    ]
+
+
+def bulk(db, rows):
+    db.execute(insert(MeetingPoint).values(rows).returning(*MeetingPoint.__table__.c)).all()
+
+
+def per_row(db, rows):
+    for row in rows:
+        mp = MeetingPoint(**row)
+        db.add(mp)
+        db.flush()
+        db.refresh(mp)
+
+
+def rolled_back(fn, occurrences: int, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        rows = series_rows(occurrences)
+        db = SessionLocal()
+        try:
+            started = perf_counter()
+            fn(db, rows)
+            samples.append(perf_counter() - started)
+        finally:
+            db.rollback()
+            db.close()
+    return samples
+
+
+def main(occurrences: int = 365, repeat: int = 10):
+    engine.echo = False
+    report(f"INSERT ... RETURNING ({occurrences} rows)", rolled_back(bulk, occurrences, repeat))
+    report(f"add + flush + refresh ({occurrences} rows)", rolled_back(per_row, occurrences, repeat))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
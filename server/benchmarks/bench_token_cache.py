@@ -0,0 +1,46 @@
+"""
+Auth cost per request: jwt.decode on every call (the old get_current_user)
+vs. the verified-token cache, on a screen-like workload where each user
+fires a burst of requests with the same token.
+
+No database needed:
+
+    JWT_SECRET=x DATABASE_URL=postgresql://unused/x python -m benchmarks.bench_token_cache
+"""
+import random
+import sys
+
+from jose import jwt
+
+from auth.jwt import create_access_token
+from auth.token_cache import VerifiedTokenCache
+from benchmarks.common import report, timed
+from config import settings
+
+
+def main(users: int = 500, requests_per_user: int = 40):
+    tokens = [create_access_token({"sub": f"user-{i}", "roles": ["publisher"]}) for i in range(users)]
+    workload = [token for token in tokens for _ in range(requests_per_user)]
+    random.Random(1).shuffle(workload)
+    requests = iter(workload * 2)
+
+    def decode():
+        jwt.decode(next(requests), settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+
+    cache = VerifiedTokenCache(
+        max_entries=settings.token_cache_max_entries,
+        ttl_seconds=settings.token_cache_ttl_seconds,
+    )
+
+    def cached():
+        token = next(requests)
+        if cache.get(token) is None:
+            cache.put(token, jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]))
+
+    report("jwt.decode every request", timed(decode, len(workload)), unit="us")
+    report("verified-token cache", timed(cached, len(workload)), unit="us")
+    print(f"cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
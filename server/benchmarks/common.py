@@ -0,0 +1,69 @@
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import delete
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile, p in 0..100."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(name: str, samples: list[float], unit: str = "ms"):
+    scale = 1000 if unit == "ms" else 1_000_000
+    print(
+        f"{name:<40} n={len(samples):<6} "
+        f"p50={percentile(samples, 50) * scale:9.2f}{unit} "
+        f"p99={percentile(samples, 99) * scale:9.2f}{unit} "
+        f"mean={statistics.fmean(samples) * scale:9.2f}{unit}"
+    )
+
+
+def timed(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+@contextmanager
+def scratch_data(db, carts: int = 0, users: int = 0):
+    """
+    Create throwaway carts and users, yield (carts, users) and delete them,
+    their bookings and refresh tokens included, afterwards.
+    """
+    from db.database import engine
+    from models.booking_participant import BookingParticipant
+    from models.cart import Cart
+    from models.cart_booking import CartBooking
+    from models.refresh_token import RefreshToken
+    from models.user import User
+
+    engine.echo = False
+    tag = uuid.uuid4().hex[:8]
+    cart_rows = [Cart(name=f"bench-{tag}-{i}", active=True) for i in range(carts)]
+    user_rows = [
+        User(firstname="Bench", lastname=f"{tag}-{i}", username=f"bench-{tag}-{i}", roles=["publisher"])
+        for i in range(users)
+    ]
+    db.add_all(cart_rows + user_rows)
+    db.commit()
+    cart_ids = [c.id for c in cart_rows]
+    user_ids = [u.id for u in user_rows]
+    try:
+        yield cart_rows, user_rows
+    finally:
+        db.rollback()
+        booking_ids = db.query(CartBooking.id).filter(CartBooking.cart_id.in_(cart_ids)).scalar_subquery()
+        db.execute(delete(BookingParticipant).where(BookingParticipant.booking_id.in_(booking_ids)))
+        db.execute(delete(CartBooking).where(CartBooking.cart_id.in_(cart_ids)))
+        db.execute(delete(Cart).where(Cart.id.in_(cart_ids)))
+        db.execute(delete(RefreshToken).where(RefreshToken.user_id.in_(user_ids)))
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
@@ -15,6 +15,41 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Verified access token claims kept per worker (0 entries disables it)
+    token_cache_max_entries: int = Field(default=10_000, alias="TOKEN_CACHE_MAX_ENTRIES")
+    token_cache_ttl_seconds: int = Field(default=300, alias="TOKEN_CACHE_TTL_SECONDS")
+
+    # How long a worker trusts its cached active flag and roles of a user
+    user_status_ttl_seconds: int = Field(default=30, alias="USER_STATUS_TTL_SECONDS")
+
+    # bcrypt runs on its own thread pool; further logins wait, then get 503
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_pending: int = Field(default=200, alias="PASSWORD_HASH_MAX_PENDING")
+
+    # Expired and revoked refresh tokens are deleted this often (0 disables)
+    refresh_token_purge_minutes: int = Field(default=60, alias="REFRESH_TOKEN_PURGE_MINUTES")
+
+    # -------------------------------------------------
+    # Bookings
+    # -------------------------------------------------
+    # In-memory overlap index for availability lookups, kept in sync across workers via pg_notify
+    booking_index_enabled: bool = Field(
+        default=False, alias="BOOKING_INDEX_ENABLED"
+    )
+
+    # -------------------------------------------------
+    # Meeting points
+    # -------------------------------------------------
+    # Memory bound of the rendered PDF cache (per worker)
+    pdf_cache_max_mb: int = Field(default=32, alias="PDF_CACHE_MAX_MB")
+
+    # Process pool that renders PDFs, and where finished files are kept
+    pdf_render_workers: int = Field(default=2, alias="PDF_RENDER_WORKERS")
+    pdf_render_max_pending: int = Field(default=20, alias="PDF_RENDER_MAX_PENDING")
+    pdf_export_dir: str = Field(default="exports", alias="PDF_EXPORT_DIR")
+    pdf_export_max_age_hours: float = Field(default=24, alias="PDF_EXPORT_MAX_AGE_HOURS")
+    pdf_export_max_files: int = Field(default=200, alias="PDF_EXPORT_MAX_FILES")
+
     # -------------------------------------------------
     # Bootstrap Admin
     # -------------------------------------------------
@@ -2,7 +2,12 @@ from fastapi import FastAPI
 from sqlalchemy import text
 from models.booking_participant import BookingParticipant
 from routers import carts, events
-from db.database import engine
+from db.database import engine, SessionLocal
+from config import settings
+from utils.booking_index import booking_index
+from utils.booking_events import booking_event_hub
+from auth.refresh_tokens import refresh_token_purger
+from auth.deps import user_status
 from db.base import Base
 import models  # wichtig: triggert Model-Imports
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,6 +25,19 @@ app = FastAPI()
 def startup():
     Base.metadata.create_all(bind=engine)
 
+    if settings.booking_index_enabled:
+        # Warmed by the event hub once its LISTEN connection is up, SQL answers until then
+        booking_index.follow(booking_event_hub, SessionLocal)
+
+    # Role changes and deactivations made on any worker reach this one's cache
+    user_status.follow(booking_event_hub)
+    refresh_token_purger.start(settings.refresh_token_purge_minutes)
+
+
+@app.on_event("shutdown")
+def shutdown():
+    refresh_token_purger.stop()
+
 
 @app.get("/")
 def health():
@@ -46,4 +64,5 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
\ No newline at end of file
@@ -5,3 +5,5 @@ from models.booking_participant import BookingParticipant
 from models.cart_booking import CartBooking
 from models.invite_token import InviteToken
 from models.meeting_point import MeetingPoint
+from models.meeting_point_version import MeetingPointVersion
+from models.conductor_stat import ConductorStat
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, ForeignKey, DateTime
+from sqlalchemy import Column, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from db.base import Base
@@ -15,3 +15,8 @@ class BookingParticipant(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_booking_participants_booking_id_user_id", "booking_id", "user_id"),
+        Index("ix_booking_participants_user_id_booking_id", "user_id", "booking_id"),
+    )
@@ -1,6 +1,6 @@
 import uuid
-from sqlalchemy import Column, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Computed, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, TSTZRANGE
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from db.base import Base
@@ -15,10 +15,17 @@ class CartBooking(Base):
     # DEPRECATED: user_id wird durch participants ersetzt
     # Bleibt vorerst für Migration, wird später entfernt
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    series_id = Column(UUID(as_uuid=True), nullable=True)
 
     start_datetime = Column(DateTime(timezone=True), nullable=False)
     end_datetime = Column(DateTime(timezone=True), nullable=False)
 
+    # Half-open [start, end) range, maintained by Postgres; overlap queries use `&&` on it
+    during = Column(
+        TSTZRANGE,
+        Computed("tstzrange(start_datetime, end_datetime, '[)')", persisted=True),
+    )
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -28,3 +35,26 @@ class CartBooking(Base):
         secondary="booking_participants",
         backref="bookings"
     )
+
+    __table_args__ = (
+        Index(
+            "ix_cart_bookings_cart_id_during",
+            "cart_id",
+            "during",
+            postgresql_using="gist",
+        ),
+        # Cross-cart lookups (participant conflicts) filter on the range alone
+        Index("ix_cart_bookings_during", "during", postgresql_using="gist"),
+        # Keyset pagination on (start_datetime, id), per cart and overall
+        Index("ix_cart_bookings_cart_id_start_id", "cart_id", "start_datetime", "id"),
+        Index("ix_cart_bookings_start_id", "start_datetime", "id"),
+        Index("ix_cart_bookings_series_id", "series_id"),
+    )
+
+
+# GiST on (uuid, tstzrange) needs btree_gist when create_all builds the table
+event.listen(
+    CartBooking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from db.base import Base
+
+
+class ConductorStat(Base):
+    """Meeting points conducted per user and month, kept in step with meeting_points"""
+    __tablename__ = "conductor_stats"
+
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)  # 1-12
+    conductor_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    count = Column(Integer, nullable=False, default=0)
+    last_date = Column(Date, nullable=True)
+
+    __table_args__ = (
+        Index("ix_conductor_stats_year_conductor_id", "year", "conductor_id"),
+    )
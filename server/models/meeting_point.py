@@ -17,7 +17,6 @@ class MeetingPoint(Base):
     conductor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     outline = Column(String, nullable=True)
     link = Column(String, nullable=True)
-    month = Column(String, nullable=False)  # "YYYY-MM"
     series_id = Column(UUID(as_uuid=True), nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -29,7 +28,12 @@ class MeetingPoint(Base):
 
     conductor = relationship("User", foreign_keys=[conductor_id], lazy="joined")
 
+    @property
+    def month(self) -> str:
+        """YYYY-MM of date; queries filter on date ranges instead"""
+        return self.date.strftime("%Y-%m")
+
     __table_args__ = (
-        Index("ix_meeting_points_month", "month"),
+        Index("ix_meeting_points_date_time", "date", "time"),
         Index("ix_meeting_points_series_id", "series_id"),
     )
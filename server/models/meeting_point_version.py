@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Integer
+
+from db.base import Base
+
+
+class MeetingPointVersion(Base):
+    """Content version per month, bumped by every meeting point write (PDF cache key)"""
+    __tablename__ = "meeting_point_versions"
+
+    month = Column(String, primary_key=True)  # "YYYY-MM"
+    version = Column(Integer, nullable=False, default=1)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from db.base import Base
@@ -9,7 +9,12 @@ class RefreshToken(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    token = Column(UUID(as_uuid=True), unique=True, nullable=False)
+    token = Column(UUID(as_uuid=True), unique=True, nullable=False)  # unique index serves lookups
     expires_at = Column(DateTime, nullable=False)
     revoked = Column(Boolean, default=False)
+    revoked_at = Column(DateTime, nullable=True)  # kept a while after rotation for reuse detection
     created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_revoked", "user_id", "revoked"),
+    )
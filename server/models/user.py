@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 
@@ -31,3 +31,9 @@ class User(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+    # Case-insensitive uniqueness; also what login probes with lower(...) = :identifier
+    __table_args__ = (
+        Index("uq_users_lower_username", func.lower(username), unique=True),
+        Index("uq_users_lower_email", func.lower(email), unique=True),
+    )
@@ -1,22 +1,22 @@
-import uuid
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func
 from pydantic import BaseModel
 
 from db.database import get_db
 from models.user import User
 from models.refresh_token import RefreshToken
-from auth.security import verify_password
+from auth.security import PasswordHasherBusy, password_hasher
 from auth.jwt import create_access_token
+from auth.deps import require_admin, verified_tokens
+from auth.refresh_tokens import ROTATION_GRACE_SECONDS, issue_refresh_token, revoke_user_tokens
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-REFRESH_TOKEN_DAYS = 14
-
 # ------------------------------------------------------------------
 # Schemas
 # ------------------------------------------------------------------
@@ -28,6 +28,7 @@ class LoginRequest(BaseModel):
 
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: UUID
     token_type: str = "bearer"
     roles: list[str]
 
@@ -38,6 +39,7 @@ class RefreshRequest(BaseModel):
 
 class RefreshResponse(BaseModel):
     access_token: str
+    refresh_token: UUID
     token_type: str = "bearer"
     roles: list[str]
 
@@ -46,27 +48,20 @@ class RefreshResponse(BaseModel):
 # Routes
 # ------------------------------------------------------------------
 
-@router.post("/login", response_model=LoginResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    identifier = data.identifier.strip().lower()
+def _login_user_query(db: Session, identifier: str):
+    # Usernames are slugs and never contain "@", so one lower() index probe decides
+    column = User.email if "@" in identifier else User.username
+    return db.query(User).filter(func.lower(column) == identifier, User.active == True)
 
-    user = (
-        db.query(User)
-        .filter(
-            User.active == True,
-            or_(
-                User.email.ilike(identifier),
-                User.username.ilike(identifier),
-            ),
-        )
-        .first()
-    )
 
-    if not user or not verify_password(data.password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-        )
+def _find_login_user(db: Session, identifier: str):
+    return _login_user_query(db, identifier).first()
+
+
+def _issue_login_tokens(db: Session, user: User, new_hash: str | None):
+    if new_hash:
+        # passlib flagged the stored hash as outdated, store the upgraded one
+        user.password_hash = new_hash
 
     access_token = create_access_token(
         {
@@ -75,42 +70,82 @@ def login(data: LoginRequest, db: Session = Depends(get_db)):
         }
     )
 
-    refresh_token = uuid.uuid4()
-
-    db.add(
-        RefreshToken(
-            user_id=user.id,
-            token=refresh_token,
-            expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_DAYS),
-            revoked=False,
-        )
-    )
+    refresh_token = issue_refresh_token(db, user.id)
     db.commit()
 
     return {
         "access_token": access_token,
+        "refresh_token": refresh_token,
         "roles": user.roles,
     }
 
 
+@router.post("/login", response_model=LoginResponse)
+async def login(data: LoginRequest, db: Session = Depends(get_db)):
+    """
+    Database work runs on the request threadpool, bcrypt on the password
+    hasher's own pool, so a login burst does not tie up every worker thread.
+    """
+    identifier = data.identifier.strip().lower()
+    user = await run_in_threadpool(_find_login_user, db, identifier)
+
+    valid, new_hash = False, None
+    if user:
+        try:
+            valid, new_hash = await password_hasher.verify_and_update(data.password, user.password_hash)
+        except PasswordHasherBusy:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many logins in progress, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+        )
+
+    return await run_in_threadpool(_issue_login_tokens, db, user, new_hash)
+
+
 @router.post("/refresh", response_model=RefreshResponse)
 def refresh(data: RefreshRequest, db: Session = Depends(get_db)):
+    """
+    Exchange a refresh token for a new access token and a new refresh
+    token; the presented one is revoked. Presenting an already rotated
+    token means it leaked, so every session of that user is revoked -
+    unless it was rotated moments ago: then it is another tab that raced
+    this one, and it just gets a 401 (it picks up the new tokens from
+    shared storage).
+    """
+    now = datetime.utcnow()
     rt = (
         db.query(RefreshToken)
-        .filter(
-            RefreshToken.token == data.refresh_token,
-            RefreshToken.revoked == False,
-            RefreshToken.expires_at > datetime.utcnow(),
-        )
+        .filter(RefreshToken.token == data.refresh_token)
+        .with_for_update()
         .first()
     )
 
-    if not rt:
+    if not rt or rt.expires_at <= now:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
         )
 
+    if rt.revoked:
+        if rt.revoked_at and rt.revoked_at > now - timedelta(seconds=ROTATION_GRACE_SECONDS):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token already rotated",
+            )
+        revoke_user_tokens(db, rt.user_id)
+        db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected",
+        )
+
     user = (
         db.query(User)
         .filter(User.id == rt.user_id, User.active == True)
@@ -130,8 +165,14 @@ def refresh(data: RefreshRequest, db: Session = Depends(get_db)):
         }
     )
 
+    rt.revoked = True
+    rt.revoked_at = now
+    new_refresh_token = issue_refresh_token(db, user.id)
+    db.commit()
+
     return {
         "access_token": new_access_token,
+        "refresh_token": new_refresh_token,
         "roles": user.roles,
     }
 
@@ -144,8 +185,14 @@ def logout(data: RefreshRequest, db: Session = Depends(get_db)):
         .first()
     )
 
-    if rt:
+    if rt and not rt.revoked:
         rt.revoked = True
+        rt.revoked_at = datetime.utcnow()
         db.commit()
 
     return {"ok": True}
+
+
+@router.get("/token-cache-stats")
+def get_token_cache_stats(_admin=Depends(require_admin)):
+    return verified_tokens.stats()
@@ -1,22 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import and_, or_, func, true, values, column, insert, select, tuple_, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from email.utils import format_datetime
+import asyncio
+import base64
+import hashlib
+import json
+import uuid
 from uuid import UUID
 
-from db.database import get_db
+from db.database import get_db, SessionLocal
+from auth.deps import require_admin, get_current_user
+from auth.feed_tokens import create_feed_token, verify_feed_token
+from utils.booking_index import booking_index
+from utils.booking_events import booking_event_hub, delete_bookings, publish_booking_events
+from utils.ical import calendar_header, calendar_footer, vevent, format_utc, format_local
 from models.cart_booking import CartBooking
 from models.booking_participant import BookingParticipant
 from models.cart import Cart
+from models.meeting_point import MeetingPoint
 from models.user import User
-from schemas.booking import BookingCreate, BookingOut, CalendarBookingOut
+from schemas.booking import (
+    BookingCreate,
+    BookingBulkCreate,
+    BulkBookingOut,
+    BookingSeriesCreate,
+    BookingRecurrenceType,
+    MAX_BULK_BOOKINGS,
+    BookingOut,
+    BookingConflictOut,
+    CalendarBookingOut,
+    AvailabilityRequest,
+    AvailabilityMatrixOut,
+)
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
+MAX_CONCURRENT_BOOKINGS = 2
 
-def overlaps(a_start, a_end, b_start, b_end):
-    """Check if two time ranges overlap"""
-    return and_(a_start < b_end, a_end > b_start)
+
+def overlaps(start, end):
+    """
+    Bookings whose [start, end) range overlaps the given one.
+    Compiles to `during && tstzrange(...)` so the GiST index on
+    (cart_id, during) can be used.
+    """
+    return CartBooking.during.op("&&")(func.tstzrange(start, end, "[)"))
+
+
+CALENDAR_FIELDS = set(CalendarBookingOut.model_fields)
+
+
+def _parse_fields(fields: str | None) -> set[str]:
+    """Parse a comma-separated fields= projection, always keeping the id."""
+    if not fields:
+        return set(CALENDAR_FIELDS)
+
+    selected = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = selected - CALENDAR_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    selected.add("id")
+    return selected
 
 
 @router.get("/calendar", response_model=list[CalendarBookingOut])
@@ -24,65 +77,350 @@ def get_calendar_bookings(
     start_date: datetime = Query(..., description="Start of date range"),
     end_date: datetime = Query(..., description="End of date range"),
     cart_id: UUID | None = Query(None, description="Filter by specific cart"),
+    fields: str | None = Query(None, description="Comma-separated list of fields to return"),
     db: Session = Depends(get_db)
 ):
     """
     Get all bookings in a date range for calendar views.
     Optionally filter by cart_id.
+
+    Cart and participant names are fetched in the same statement, so the
+    number of queries does not grow with the number of bookings. Columns
+    left out via `fields` are not joined at all.
     """
-    query = db.query(CartBooking).filter(
+    selected = _parse_fields(fields)
+    with_cart = "cart_name" in selected
+    with_participants = "participant_names" in selected
+
+    query = db.query(
+        CartBooking.id,
+        CartBooking.cart_id,
+        CartBooking.start_datetime,
+        CartBooking.end_datetime,
+    )
+
+    if with_cart:
+        query = query.add_columns(Cart.name.label("cart_name")).outerjoin(
+            Cart, Cart.id == CartBooking.cart_id
+        )
+
+    if with_participants:
+        query = (
+            query.add_columns(User.firstname, User.lastname)
+            .outerjoin(BookingParticipant, BookingParticipant.booking_id == CartBooking.id)
+            .outerjoin(User, User.id == BookingParticipant.user_id)
+        )
+
+    query = query.filter(
         overlaps(
-            CartBooking.start_datetime,
-            CartBooking.end_datetime,
             start_date,
-            end_date
+            end_date,
         )
     )
-    
+
     if cart_id:
         query = query.filter(CartBooking.cart_id == cart_id)
-    
-    bookings = query.all()
-    
-    # Transform to calendar format
-    result = []
-    for booking in bookings:
-        cart = db.query(Cart).filter(Cart.id == booking.cart_id).first()
-        participant_names = [
-            f"{p.firstname} {p.lastname}" for p in booking.participants
+
+    order_by = [CartBooking.start_datetime, CartBooking.id]
+    if with_participants:
+        order_by.append(BookingParticipant.created_at)
+
+    # One row per (booking, participant) - fold them back into bookings
+    bookings = {}
+    for row in query.order_by(*order_by).all():
+        booking = bookings.get(row.id)
+        if booking is None:
+            booking = {
+                "id": row.id,
+                "cart_id": row.cart_id,
+                "start_datetime": row.start_datetime,
+                "end_datetime": row.end_datetime,
+            }
+            if with_cart:
+                booking["cart_name"] = row.cart_name or "Unknown"
+            if with_participants:
+                booking["participant_names"] = []
+            bookings[row.id] = booking
+
+        if with_participants and row.firstname is not None:
+            booking["participant_names"].append(f"{row.firstname} {row.lastname}")
+
+    if fields:
+        # Partial rows don't satisfy CalendarBookingOut, so skip the response model
+        projected = [
+            {key: value for key, value in b.items() if key in selected}
+            for b in bookings.values()
         ]
-        
-        result.append(CalendarBookingOut(
-            id=booking.id,
-            cart_id=booking.cart_id,
-            cart_name=cart.name if cart else "Unknown",
-            participant_names=participant_names,
-            start_datetime=booking.start_datetime,
-            end_datetime=booking.end_datetime
-        ))
-    
-    return result
+        return JSONResponse(content=jsonable_encoder(projected))
+
+    return [CalendarBookingOut(**b) for b in bookings.values()]
+
+
+ICAL_PAGE_SIZE = 500
+
+
+def _feed_etag(*parts) -> str:
+    return '"' + hashlib.sha256(repr(parts).encode()).hexdigest()[:32] + '"'
+
+
+def _feed_response(request: Request, etag: str, last_modified, filename: str, body):
+    """
+    304 when the client already has this version of the feed, otherwise
+    stream `body`. Only If-None-Match is honoured: deleted bookings don't
+    move Last-Modified forward, the ETag (which includes the row count) does.
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'inline; filename="{filename}"',
+    }
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+
+def _participant_names():
+    """Correlated "Firstname Lastname, ..." of a booking's participants."""
+    bp = aliased(BookingParticipant)
+    return (
+        select(func.string_agg(User.firstname + " " + User.lastname, ", "))
+        .select_from(bp)
+        .join(User, User.id == bp.user_id)
+        .where(bp.booking_id == CartBooking.id)
+        .correlate(CartBooking)
+        .scalar_subquery()
+        .label("participant_names")
+    )
+
+
+def _booking_feed(name: str, filters, meeting_point_filters=None):
+    """
+    Generate the iCalendar body row by row over a server-side cursor.
+    Uses its own session because the response outlives the request's one.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.now(timezone.utc)
+        yield calendar_header(name)
+
+        bookings = (
+            db.query(
+                CartBooking.id,
+                CartBooking.start_datetime,
+                CartBooking.end_datetime,
+                CartBooking.created_at,
+                Cart.name.label("cart_name"),
+                Cart.location,
+                _participant_names(),
+            )
+            .join(Cart, Cart.id == CartBooking.cart_id)
+            .filter(*filters)
+            .order_by(CartBooking.start_datetime, CartBooking.id)
+            .execution_options(stream_results=True)
+            .yield_per(ICAL_PAGE_SIZE)
+        )
+        for b in bookings:
+            yield vevent(
+                uid=b.id,
+                stamp=b.created_at or now,
+                summary=f"Cart: {b.cart_name}",
+                start=format_utc(b.start_datetime),
+                end=format_utc(b.end_datetime),
+                location=b.location,
+                description=b.participant_names,
+            )
+
+        if meeting_point_filters is not None:
+            meeting_points = (
+                db.query(
+                    MeetingPoint.id,
+                    MeetingPoint.date,
+                    MeetingPoint.time,
+                    MeetingPoint.location,
+                    MeetingPoint.outline,
+                    MeetingPoint.link,
+                    MeetingPoint.updated_at,
+                )
+                .filter(*meeting_point_filters)
+                .order_by(MeetingPoint.date, MeetingPoint.time)
+                .execution_options(stream_results=True)
+                .yield_per(ICAL_PAGE_SIZE)
+            )
+            for mp in meeting_points:
+                yield vevent(
+                    uid=mp.id,
+                    stamp=mp.updated_at or now,
+                    summary="Punto de encuentro",
+                    start=format_local(datetime.combine(mp.date, mp.time)),
+                    duration="PT1H",
+                    location=mp.location,
+                    description=mp.outline,
+                    url=mp.link,
+                )
+
+        yield calendar_footer()
+    finally:
+        db.close()
+
+
+@router.get("/ical-token")
+def get_ical_feed_url(current_user=Depends(get_current_user)):
+    """Personal calendar feed URL (bookings + meeting points the user conducts)"""
+    token = create_feed_token(UUID(current_user["sub"]))
+    return {"url": f"/bookings/ical/{token}.ics"}
+
+
+@router.get("/ical/{user_token}.ics")
+def get_user_ical_feed(user_token: str, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of a user's cart shifts and the meeting points they conduct"""
+    user_id = verify_feed_token(user_token)
+    if not user_id:
+        raise HTTPException(status_code=404, detail="Feed not found")
+
+    user = db.query(User.id).filter(User.id == user_id, User.active == True).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="Feed not found")
+
+    booking_filters = [
+        CartBooking.id.in_(
+            select(BookingParticipant.booking_id).where(BookingParticipant.user_id == user_id)
+        )
+    ]
+    meeting_point_filters = [MeetingPoint.conductor_id == user_id]
+
+    bookings_version = (
+        db.query(func.count(CartBooking.id), func.max(CartBooking.created_at), func.max(Cart.updated_at))
+        .join(Cart, Cart.id == CartBooking.cart_id)
+        .filter(*booking_filters)
+        .one()
+    )
+    meeting_points_version = (
+        db.query(func.count(MeetingPoint.id), func.max(MeetingPoint.updated_at))
+        .filter(*meeting_point_filters)
+        .one()
+    )
+
+    stamps = [t for t in (*bookings_version[1:], meeting_points_version[1]) if t]
+    return _feed_response(
+        request,
+        _feed_etag("user", user_id, *bookings_version, *meeting_points_version),
+        max(stamps) if stamps else None,
+        "bookings.ics",
+        _booking_feed("Cart", booking_filters, meeting_point_filters),
+    )
+
+
+@router.get("/cart/{cart_id}.ics")
+def get_cart_ical_feed(cart_id: UUID, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of all bookings of one cart"""
+    cart = db.query(Cart).filter(Cart.id == cart_id).first()
+    if not cart:
+        raise HTTPException(status_code=404, detail="Cart not found")
+
+    booking_filters = [CartBooking.cart_id == cart_id]
+    count, last_created = (
+        db.query(func.count(CartBooking.id), func.max(CartBooking.created_at))
+        .filter(*booking_filters)
+        .one()
+    )
+
+    stamps = [t for t in (last_created, cart.updated_at) if t]
+    return _feed_response(
+        request,
+        _feed_etag("cart", cart_id, count, last_created, cart.updated_at),
+        max(stamps) if stamps else None,
+        f"cart-{cart_id}.ics",
+        _booking_feed(cart.name, booking_filters),
+    )
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def _encode_cursor(booking: CartBooking) -> str:
+    raw = f"{booking.start_datetime.isoformat()}|{booking.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        start, booking_id = raw.split("|", 1)
+        return datetime.fromisoformat(start), UUID(booking_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _paginate_bookings(query, response: Response, from_, to, cursor, limit):
+    """
+    Apply from/to bounds (on start_datetime) and a keyset cursor on
+    (start_datetime, id), load participants in one extra query and set
+    X-Next-Cursor when there are more rows. Without `from_` the list
+    starts now; history needs an explicit earlier `from_`.
+    """
+    if from_ is None:
+        from_ = datetime.now(timezone.utc)
+    query = query.filter(CartBooking.start_datetime >= from_)
+    if to:
+        query = query.filter(CartBooking.start_datetime < to)
+    if cursor:
+        after_start, after_id = _decode_cursor(cursor)
+        query = query.filter(
+            tuple_(CartBooking.start_datetime, CartBooking.id) > tuple_(after_start, after_id)
+        )
+
+    bookings = (
+        query.options(selectinload(CartBooking.participants))
+        .order_by(CartBooking.start_datetime, CartBooking.id)
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(bookings[-1])
+
+    return bookings
 
 
 @router.get("/cart/{cart_id}", response_model=list[BookingOut])
-def list_cart_bookings(cart_id: UUID, db: Session = Depends(get_db)):
-    """Get all bookings for a specific cart"""
-    return db.query(CartBooking).filter(CartBooking.cart_id == cart_id).all()
+def list_cart_bookings(
+    cart_id: UUID,
+    response: Response,
+    from_: datetime | None = Query(None, alias="from", description="Only bookings starting at or after (default: now)"),
+    to: datetime | None = Query(None, description="Only bookings starting before"),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Get upcoming bookings for a specific cart (or from `from` on), oldest first, page by page"""
+    query = db.query(CartBooking).filter(CartBooking.cart_id == cart_id)
+    return _paginate_bookings(query, response, from_, to, cursor, limit)
 
 
 @router.get("/my-bookings", response_model=list[BookingOut])
 def get_my_bookings(
+    response: Response,
     user_id: UUID = Query(..., description="Current user ID"),
+    from_: datetime | None = Query(None, alias="from", description="Only bookings starting at or after (default: now)"),
+    to: datetime | None = Query(None, description="Only bookings starting before"),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
-    """Get all bookings where the user is a participant"""
-    bookings = (
+    """Get upcoming bookings where the user is a participant (or from `from` on), oldest first, page by page"""
+    query = (
         db.query(CartBooking)
         .join(BookingParticipant)
         .filter(BookingParticipant.user_id == user_id)
-        .all()
     )
-    return bookings
+    return _paginate_bookings(query, response, from_, to, cursor, limit)
 
 
 @router.post("", response_model=BookingOut, status_code=201)
@@ -93,35 +431,67 @@ def create_booking(data: BookingCreate, db: Session = Depends(get_db)):
     - Cart exists and is active
     - Max 2 overlapping bookings per cart
     - All participants exist
+    - No participant is booked on another cart at the same time
     """
     
-    # 1. Check cart exists and is active
-    cart = db.query(Cart).filter(Cart.id == data.cart_id).first()
+    # 1. Check cart exists and is active.
+    # The cart row is locked until commit, so concurrent bookings for the
+    # same cart queue up behind each other and the overlap count below
+    # can't go stale. Bookings on other carts are not affected.
+    cart = (
+        db.query(Cart)
+        .filter(Cart.id == data.cart_id)
+        .with_for_update()
+        .first()
+    )
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
     if not cart.active:
         raise HTTPException(status_code=400, detail="Cart is not active")
     
-    # 2. Validate participants exist
-    participants = db.query(User).filter(User.id.in_(data.participant_ids)).all()
+    # 2. Validate participants exist (locked, so the conflict check below holds across carts).
+    # FOR NO KEY UPDATE still serializes bookings of the same user, but does not
+    # block the FOR KEY SHARE locks of inserts referencing users (logins, meeting points)
+    participants = (
+        db.query(User)
+        .filter(User.id.in_(data.participant_ids))
+        .order_by(User.id)
+        .with_for_update(key_share=True)
+        .all()
+    )
     if len(participants) != len(data.participant_ids):
         raise HTTPException(status_code=404, detail="One or more participants not found")
+
+    busy = (
+        db.query(User.firstname, User.lastname)
+        .join(BookingParticipant, BookingParticipant.user_id == User.id)
+        .join(CartBooking, CartBooking.id == BookingParticipant.booking_id)
+        .filter(
+            BookingParticipant.user_id.in_(data.participant_ids),
+            overlaps(data.start_datetime, data.end_datetime),
+        )
+        .distinct()
+        .all()
+    )
+    if busy:
+        raise HTTPException(
+            status_code=409,
+            detail="Already booked at this time: " + ", ".join(f"{u.firstname} {u.lastname}" for u in busy)
+        )
     
     # 3. Check for overlapping bookings (max 2 concurrent bookings per cart)
     overlapping_count = db.query(CartBooking).filter(
         CartBooking.cart_id == data.cart_id,
         overlaps(
-            CartBooking.start_datetime,
-            CartBooking.end_datetime,
             data.start_datetime,
             data.end_datetime,
         )
     ).count()
 
-    if overlapping_count >= 2:
+    if overlapping_count >= MAX_CONCURRENT_BOOKINGS:
         raise HTTPException(
             status_code=409,
-            detail="This cart is fully booked during this time (max 2 concurrent bookings)"
+            detail=f"This cart is fully booked during this time (max {MAX_CONCURRENT_BOOKINGS} concurrent bookings)"
         )
     
     # 4. Create booking
@@ -141,13 +511,349 @@ def create_booking(data: BookingCreate, db: Session = Depends(get_db)):
             user_id=participant_id
         )
         db.add(participant)
+
+    publish_booking_events(db, [{
+        "type": "created",
+        "id": booking.id,
+        "cart_id": booking.cart_id,
+        "cart_name": cart.name,
+        "participant_names": [f"{p.firstname} {p.lastname}" for p in participants],
+        "start_datetime": booking.start_datetime,
+        "end_datetime": booking.end_datetime,
+    }])
     
     db.commit()
     db.refresh(booking)
+
+    booking_index.add(booking.id, booking.cart_id, booking.start_datetime, booking.end_datetime)
     
     return booking
 
 
+def _check_bookings(db: Session, items: list[BookingCreate]):
+    """
+    Validate many bookings with set-based queries: carts and users (locked),
+    existing overlaps for every window in one grouped query, and participants
+    busy on any cart in one more. Items that pass count against later items
+    of the same list.
+    Returns (carts, user_names, rejections) where rejections[i] is the reason
+    item i was rejected, or None if it was accepted.
+    """
+    if not items:
+        # An empty VALUES list is not valid SQL
+        return {}, {}, []
+
+    # 1. Carts, locked in a fixed order so concurrent bulk requests can't deadlock
+    cart_ids = {item.cart_id for item in items}
+    carts = {
+        cart.id: cart
+        for cart in (
+            db.query(Cart)
+            .filter(Cart.id.in_(cart_ids))
+            .order_by(Cart.id)
+            .with_for_update()
+            .all()
+        )
+    }
+
+    # 2. Participants, locked like in create_booking (FOR NO KEY UPDATE)
+    participant_ids = {pid for item in items for pid in item.participant_ids}
+    user_names = {
+        row.id: f"{row.firstname} {row.lastname}"
+        for row in (
+            db.query(User.id, User.firstname, User.lastname)
+            .filter(User.id.in_(participant_ids))
+            .order_by(User.id)
+            .with_for_update(key_share=True)
+            .all()
+        )
+    }
+
+    # 3. Existing overlapping bookings for every requested window, in one query
+    window_table = values(
+        column("idx", Integer),
+        column("cart_id", PG_UUID(as_uuid=True)),
+        column("start", DateTime(timezone=True)),
+        column("end", DateTime(timezone=True)),
+        name="requested",
+    ).data([
+        (i, item.cart_id, item.start_datetime, item.end_datetime)
+        for i, item in enumerate(items)
+    ])
+
+    existing_counts = dict(
+        db.query(window_table.c.idx, func.count(CartBooking.id))
+        .select_from(window_table)
+        .join(
+            CartBooking,
+            and_(
+                CartBooking.cart_id == window_table.c.cart_id,
+                overlaps(window_table.c.start, window_table.c.end),
+            ),
+        )
+        .group_by(window_table.c.idx)
+        .all()
+    )
+
+    # 4. Participants already booked (on any cart) during a requested window
+    participant_windows = values(
+        column("idx", Integer),
+        column("user_id", PG_UUID(as_uuid=True)),
+        column("start", DateTime(timezone=True)),
+        column("end", DateTime(timezone=True)),
+        name="requested_participants",
+    ).data([
+        (i, pid, item.start_datetime, item.end_datetime)
+        for i, item in enumerate(items)
+        for pid in item.participant_ids
+    ])
+
+    busy_items = {
+        row.idx
+        for row in (
+            db.query(participant_windows.c.idx)
+            .select_from(participant_windows)
+            .join(BookingParticipant, BookingParticipant.user_id == participant_windows.c.user_id)
+            .join(
+                CartBooking,
+                and_(
+                    CartBooking.id == BookingParticipant.booking_id,
+                    overlaps(participant_windows.c.start, participant_windows.c.end),
+                ),
+            )
+            .distinct()
+            .all()
+        )
+    }
+
+    # 5. Decide per item
+    rejections = []
+    accepted = {}  # cart_id -> [(start, end)]
+    accepted_by_user = {}  # user_id -> [(start, end)]
+
+    for i, item in enumerate(items):
+        cart = carts.get(item.cart_id)
+        detail = None
+
+        if not cart:
+            detail = "Cart not found"
+        elif not cart.active:
+            detail = "Cart is not active"
+        elif any(pid not in user_names for pid in item.participant_ids):
+            detail = "One or more participants not found"
+        elif i in busy_items or any(
+            start < item.end_datetime and end > item.start_datetime
+            for pid in item.participant_ids
+            for start, end in accepted_by_user.get(pid, [])
+        ):
+            detail = "A participant is already booked at this time"
+        else:
+            in_batch = sum(
+                1
+                for start, end in accepted.get(item.cart_id, [])
+                if start < item.end_datetime and end > item.start_datetime
+            )
+            if existing_counts.get(i, 0) + in_batch >= MAX_CONCURRENT_BOOKINGS:
+                detail = f"This cart is fully booked during this time (max {MAX_CONCURRENT_BOOKINGS} concurrent bookings)"
+
+        if not detail:
+            accepted.setdefault(item.cart_id, []).append((item.start_datetime, item.end_datetime))
+            for pid in item.participant_ids:
+                accepted_by_user.setdefault(pid, []).append((item.start_datetime, item.end_datetime))
+        rejections.append(detail)
+
+    return carts, user_names, rejections
+
+
+def _insert_bookings(db: Session, items: list[BookingCreate], carts, user_names, series_id=None):
+    """
+    Insert already checked bookings and their participants with two
+    multi-row INSERTs and queue their created events. Returns the new ids
+    and the inserted rows (for the booking index, after commit).
+    """
+    booking_rows = []
+    participant_rows = []
+    events = []
+
+    for item in items:
+        booking_id = uuid.uuid4()
+        booking_rows.append({
+            "id": booking_id,
+            "cart_id": item.cart_id,
+            "series_id": series_id,
+            "start_datetime": item.start_datetime,
+            "end_datetime": item.end_datetime,
+            "user_id": item.participant_ids[0],  # Keep for backward compatibility
+        })
+        participant_rows.extend(
+            {"id": uuid.uuid4(), "booking_id": booking_id, "user_id": pid}
+            for pid in item.participant_ids
+        )
+        events.append({
+            "type": "created",
+            "id": booking_id,
+            "cart_id": item.cart_id,
+            "cart_name": carts[item.cart_id].name,
+            "participant_names": [user_names[pid] for pid in item.participant_ids],
+            "start_datetime": item.start_datetime,
+            "end_datetime": item.end_datetime,
+        })
+
+    if not booking_rows:
+        return [], []
+
+    inserted = db.execute(
+        insert(CartBooking)
+        .values(booking_rows)
+        .returning(CartBooking.id, CartBooking.cart_id, CartBooking.start_datetime, CartBooking.end_datetime)
+    ).all()
+    db.execute(insert(BookingParticipant).values(participant_rows))
+    publish_booking_events(db, events)
+
+    return [row["id"] for row in booking_rows], inserted
+
+
+@router.post("/bulk", response_model=BulkBookingOut)
+def create_bookings_bulk(data: BookingBulkCreate, db: Session = Depends(get_db)):
+    """
+    Create many bookings in one transaction.
+    Every item is checked like POST /bookings (cart active, participants
+    exist, max 2 concurrent bookings per cart, counting earlier items of
+    the same request). Valid items are inserted, invalid ones are reported
+    as rejected - one bad shift does not fail the whole week.
+    """
+    items = data.bookings
+    carts, user_names, rejections = _check_bookings(db, items)
+
+    accepted_items = [item for item, detail in zip(items, rejections) if not detail]
+    booking_ids, inserted = _insert_bookings(db, accepted_items, carts, user_names)
+    db.commit()
+
+    for row in inserted:
+        booking_index.add(row.id, row.cart_id, row.start_datetime, row.end_datetime)
+
+    new_ids = iter(booking_ids)
+    results = [
+        {"index": i, "accepted": False, "detail": detail}
+        if detail
+        else {"index": i, "accepted": True, "booking_id": next(new_ids)}
+        for i, detail in enumerate(rejections)
+    ]
+
+    return {
+        "accepted": len(booking_ids),
+        "rejected": len(items) - len(booking_ids),
+        "results": results,
+    }
+
+
+def _generate_series_windows(data: BookingSeriesCreate):
+    """
+    Occurrences of a booking series. Steps are taken in the series'
+    timezone so a 10:00 shift stays at 10:00 across DST changes.
+    Stops after MAX_BULK_BOOKINGS + 1 occurrences, enough for the caller
+    to reject the series without walking to a far away `until`.
+    """
+    tz = ZoneInfo(data.timezone)
+    step = timedelta(weeks=2 if data.recurrence == BookingRecurrenceType.biweekly else 1)
+    start = data.start_datetime.astimezone(tz)
+    end = data.end_datetime.astimezone(tz)
+
+    windows = []
+    while start.date() <= data.until and len(windows) <= MAX_BULK_BOOKINGS:
+        windows.append((start, end))
+        start += step
+        end += step
+    return windows
+
+
+@router.post("/series", response_model=list[BookingOut], status_code=201)
+def create_booking_series(data: BookingSeriesCreate, db: Session = Depends(get_db)):
+    """
+    Create a recurring cart booking (weekly or biweekly until `until`).
+    All occurrences are checked with one overlap query and created
+    together - if any occurrence is not possible, nothing is created.
+    """
+    windows = _generate_series_windows(data)
+    if len(windows) > MAX_BULK_BOOKINGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A series can have at most {MAX_BULK_BOOKINGS} occurrences"
+        )
+
+    items = [
+        BookingCreate(
+            cart_id=data.cart_id,
+            participant_ids=data.participant_ids,
+            start_datetime=start,
+            end_datetime=end,
+        )
+        for start, end in windows
+    ]
+    carts, user_names, rejections = _check_bookings(db, items)
+
+    conflicts = [
+        f"{item.start_datetime.date().isoformat()}: {detail}"
+        for item, detail in zip(items, rejections)
+        if detail
+    ]
+    if conflicts:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=conflicts)
+
+    series_id = uuid.uuid4()
+    _, inserted = _insert_bookings(db, items, carts, user_names, series_id=series_id)
+    db.commit()
+
+    for row in inserted:
+        booking_index.add(row.id, row.cart_id, row.start_datetime, row.end_datetime)
+
+    return (
+        db.query(CartBooking)
+        .options(selectinload(CartBooking.participants))
+        .filter(CartBooking.series_id == series_id)
+        .order_by(CartBooking.start_datetime)
+        .all()
+    )
+
+
+@router.delete("/series/{series_id}")
+def delete_booking_series(
+    series_id: UUID,
+    user_id: UUID = Query(..., description="Current user ID for authorization"),
+    from_date: date | None = Query(None, description="Only delete occurrences on or after this date"),
+    tz_name: str = Query("UTC", alias="timezone", description="Timezone in which from_date is meant (as used for the series)"),
+    db: Session = Depends(get_db)
+):
+    """Delete a booking series, or the part of it from `from_date` on (only if user is a participant)"""
+    try:
+        tz = ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz_name}")
+
+    is_participant = (
+        db.query(BookingParticipant.id)
+        .join(CartBooking, CartBooking.id == BookingParticipant.booking_id)
+        .filter(CartBooking.series_id == series_id, BookingParticipant.user_id == user_id)
+        .first()
+    )
+    if not is_participant:
+        raise HTTPException(status_code=404, detail="Series not found")
+
+    criteria = [CartBooking.series_id == series_id]
+    if from_date:
+        # Midnight of from_date in the series' timezone, a plain timestamptz bound
+        criteria.append(CartBooking.start_datetime >= datetime.combine(from_date, time.min, tzinfo=tz))
+
+    deleted = delete_bookings(db, *criteria)
+    db.commit()
+
+    for row in deleted:
+        booking_index.remove(row.id, row.cart_id)
+
+    return {"ok": True, "deleted": len(deleted)}
+
+
 @router.delete("/{booking_id}")
 def delete_booking(
     booking_id: UUID,
@@ -171,12 +877,282 @@ def delete_booking(
             detail="You can only delete your own bookings"
         )
     
+    cart_id = booking.cart_id
+    publish_booking_events(db, [{
+        "type": "deleted",
+        "id": booking.id,
+        "cart_id": booking.cart_id,
+        "start_datetime": booking.start_datetime,
+        "end_datetime": booking.end_datetime,
+    }])
     db.delete(booking)
     db.commit()
+
+    booking_index.remove(booking_id, cart_id)
     
     return {"ok": True, "message": "Booking deleted"}
 
 
+@router.get("/conflicts", response_model=list[BookingConflictOut])
+def get_participant_conflicts(
+    from_: datetime = Query(..., alias="from", description="Start of range"),
+    to: datetime = Query(..., description="End of range"),
+    db: Session = Depends(get_db),
+    _admin=Depends(require_admin),
+):
+    """
+    Participants booked on two overlapping bookings (usually on different
+    carts) whose overlap falls within the range, found with one self-join
+    in the database.
+    """
+    window = func.tstzrange(from_, to, "[)")
+    bp_a = aliased(BookingParticipant)
+    bp_b = aliased(BookingParticipant)
+    cb_a = aliased(CartBooking)
+    cb_b = aliased(CartBooking)
+
+    rows = (
+        db.query(
+            User.id.label("user_id"),
+            User.firstname,
+            User.lastname,
+            cb_a.id.label("booking_id"),
+            cb_a.cart_id.label("cart_id"),
+            cb_a.start_datetime.label("start_datetime"),
+            cb_a.end_datetime.label("end_datetime"),
+            cb_b.id.label("other_booking_id"),
+            cb_b.cart_id.label("other_cart_id"),
+            cb_b.start_datetime.label("other_start_datetime"),
+            cb_b.end_datetime.label("other_end_datetime"),
+        )
+        .select_from(cb_a)
+        .join(bp_a, bp_a.booking_id == cb_a.id)
+        .join(bp_b, and_(bp_b.user_id == bp_a.user_id, bp_b.booking_id != bp_a.booking_id))
+        .join(cb_b, cb_b.id == bp_b.booking_id)
+        .join(User, User.id == bp_a.user_id)
+        .filter(
+            # Intervals meeting pairwise share a point, so with both sides
+            # in the range the overlap is too, and each side can use the index
+            cb_a.during.op("&&")(window),
+            cb_b.during.op("&&")(window),
+            cb_a.during.op("&&")(cb_b.during),
+            # report each pair once
+            tuple_(cb_a.start_datetime, cb_a.id) < tuple_(cb_b.start_datetime, cb_b.id),
+        )
+        .order_by(cb_a.start_datetime, User.lastname, User.firstname)
+        .all()
+    )
+
+    return [
+        {
+            "user_id": row.user_id,
+            "user_name": f"{row.firstname} {row.lastname}",
+            "booking": {
+                "id": row.booking_id,
+                "cart_id": row.cart_id,
+                "start_datetime": row.start_datetime,
+                "end_datetime": row.end_datetime,
+            },
+            "other_booking": {
+                "id": row.other_booking_id,
+                "cart_id": row.other_cart_id,
+                "start_datetime": row.other_start_datetime,
+                "end_datetime": row.other_end_datetime,
+            },
+        }
+        for row in rows
+    ]
+
+
+HEARTBEAT_SECONDS = 15
+
+
+@router.get("/stream")
+async def stream_booking_events(
+    request: Request,
+    cart_id: list[UUID] | None = Query(None, description="Only these carts (repeatable)"),
+    start_date: datetime | None = Query(None, description="Only bookings ending after"),
+    end_date: datetime | None = Query(None, description="Only bookings starting before"),
+):
+    """
+    Server-Sent Events stream of booking deltas ("created" / "deleted").
+    Created events carry the same fields as /bookings/calendar, so clients
+    can patch their view instead of reloading the whole range.
+    """
+    subscriber = booking_event_hub.subscribe(cart_id, start_date, end_date)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: booking\ndata: {json.dumps(event)}\n\n"
+        finally:
+            booking_event_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/index/check")
+def check_booking_index(
+    db: Session = Depends(get_db),
+    _admin=Depends(require_admin),
+):
+    """Diff the in-memory booking index of this worker against the database."""
+    if not booking_index.ready:
+        raise HTTPException(status_code=409, detail="Booking index is not enabled")
+
+    diff = booking_index.diff(db)
+    return {"consistent": not diff["missing"] and not diff["stale"], **diff}
+
+
+def _availability_matrix(db: Session, windows):
+    """
+    Count overlapping bookings for every (active cart, window) pair with a
+    single grouped aggregate: carts x windows LEFT JOIN cart_bookings.
+    When the in-memory booking index is enabled and covers all windows,
+    only the carts are read from the database.
+    `windows` is a list of (start, end) tuples. Returns (carts, counts) where
+    counts[(cart_id, window_index)] is the number of overlapping bookings.
+    """
+    if not windows or all(booking_index.covers(start) for start, _ in windows):
+        carts = db.query(Cart).filter(Cart.active == True).order_by(Cart.name, Cart.id).all()
+        counts = {
+            (c.id, j): booking_index.overlap_count(c.id, start, end)
+            for c in carts
+            for j, (start, end) in enumerate(windows)
+        }
+        return [(c.id, c.name, c.location) for c in carts], counts
+
+    window_table = values(
+        column("idx", Integer),
+        column("start", DateTime(timezone=True)),
+        column("end", DateTime(timezone=True)),
+        name="windows",
+    ).data([(i, start, end) for i, (start, end) in enumerate(windows)])
+
+    rows = (
+        db.query(
+            Cart.id,
+            Cart.name,
+            Cart.location,
+            window_table.c.idx,
+            func.count(CartBooking.id).label("booked"),
+        )
+        .select_from(Cart)
+        .join(window_table, true())
+        .outerjoin(
+            CartBooking,
+            and_(
+                CartBooking.cart_id == Cart.id,
+                overlaps(
+                    window_table.c.start,
+                    window_table.c.end,
+                ),
+            ),
+        )
+        .filter(Cart.active == True)
+        .group_by(Cart.id, Cart.name, Cart.location, window_table.c.idx)
+        .order_by(Cart.name, Cart.id, window_table.c.idx)
+        .all()
+    )
+
+    carts = {}
+    counts = {}
+    for row in rows:
+        carts.setdefault(row.id, (row.id, row.name, row.location))
+        counts[(row.id, row.idx)] = row.booked
+
+    return list(carts.values()), counts
+
+
+@router.post("/availability", response_model=AvailabilityMatrixOut)
+def get_availability_matrix(data: AvailabilityRequest, db: Session = Depends(get_db)):
+    """
+    Remaining capacity of every active cart for many time windows at once.
+    Pass either explicit `windows` or a `day` split into `slot_minutes` slots.
+    """
+    windows = data.resolve_windows()
+    carts, counts = _availability_matrix(
+        db, [(w.start_datetime, w.end_datetime) for w in windows]
+    )
+
+    return AvailabilityMatrixOut(
+        capacity=MAX_CONCURRENT_BOOKINGS,
+        windows=windows,
+        carts=[
+            {"cart_id": cart_id, "cart_name": name, "location": location}
+            for cart_id, name, location in carts
+        ],
+        remaining=[
+            [
+                max(MAX_CONCURRENT_BOOKINGS - counts.get((cart_id, j), 0), 0)
+                for j in range(len(windows))
+            ]
+            for cart_id, _, _ in carts
+        ],
+    )
+
+
+MAX_HEATMAP_BUCKETS = 40_000
+
+
+@router.get("/heatmap")
+def get_occupancy_heatmap(
+    from_: datetime = Query(..., alias="from", description="Start of range"),
+    to: datetime = Query(..., description="End of range"),
+    bucket: str = Query("30m", description="Bucket size, e.g. 15m, 30m, 1h"),
+    db: Session = Depends(get_db),
+    _admin=Depends(require_admin),
+):
+    """
+    Carts x time-buckets matrix of the peak number of concurrent bookings
+    within each bucket (0..2) for spotting under-used carts and hours.
+    occupancy[i][j] belongs to carts[i] and the bucket starting at
+    from + j * bucket_minutes.
+    """
+    from utils.occupancy_heatmap import parse_bucket, build_occupancy_matrix
+
+    try:
+        bucket_size = parse_bucket(bucket)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if to <= from_:
+        raise HTTPException(status_code=400, detail="to must be after from")
+    if (to - from_) / bucket_size > MAX_HEATMAP_BUCKETS:
+        raise HTTPException(status_code=400, detail="Range too large for this bucket size")
+
+    carts = db.query(Cart.id, Cart.name).order_by(Cart.name, Cart.id).all()
+
+    intervals = (
+        db.query(CartBooking.cart_id, CartBooking.start_datetime, CartBooking.end_datetime)
+        .filter(overlaps(from_, to))
+        .execution_options(stream_results=True)
+        .yield_per(10_000)
+    )
+
+    matrix = build_occupancy_matrix(
+        intervals, [c.id for c in carts], from_, to, bucket_size
+    )
+
+    return {
+        "from": from_,
+        "to": to,
+        "bucket_minutes": int(bucket_size / timedelta(minutes=1)),
+        "carts": [{"cart_id": c.id, "cart_name": c.name} for c in carts],
+        "occupancy": matrix.tolist(),
+    }
+
+
 @router.get("/available-slots")
 def get_available_slots(
     start_datetime: datetime = Query(...),
@@ -187,31 +1163,18 @@ def get_available_slots(
     Get carts that have availability (less than 2 bookings) in the given time slot.
     Returns list of carts with their current booking count.
     """
-    
-    # Get all active carts
-    active_carts = db.query(Cart).filter(Cart.active == True).all()
-    
+    carts, counts = _availability_matrix(db, [(start_datetime, end_datetime)])
+
     result = []
-    for cart in active_carts:
-        # Count overlapping bookings for this cart
-        overlapping_count = db.query(CartBooking).filter(
-            CartBooking.cart_id == cart.id,
-            overlaps(
-                CartBooking.start_datetime,
-                CartBooking.end_datetime,
-                start_datetime,
-                end_datetime
-            )
-        ).count()
-        
-        available_slots = 2 - overlapping_count
-        
+    for cart_id, name, location in carts:
+        available_slots = MAX_CONCURRENT_BOOKINGS - counts.get((cart_id, 0), 0)
+
         if available_slots > 0:
             result.append({
-                "cart_id": cart.id,
-                "cart_name": cart.name,
-                "location": cart.location,
+                "cart_id": cart_id,
+                "cart_name": name,
+                "location": location,
                 "available_slots": available_slots
             })
-    
+
     return result
@@ -4,6 +4,9 @@ from uuid import UUID
 
 from db.database import get_db
 from models.cart import Cart
+from models.cart_booking import CartBooking
+from utils.booking_events import delete_bookings
+from utils.booking_index import booking_index
 from schemas.cart import CartCreate, CartOut, CartUpdate
 
 router = APIRouter(prefix="/carts", tags=["Carts"])
@@ -41,8 +44,13 @@ def delete_cart(cart_id: UUID, db: Session = Depends(get_db)):
     if not cart:
         raise HTTPException(status_code=404, detail="Cart not found")
 
+    # The cart's bookings go first, announced to the streams and every worker's index
+    deleted = delete_bookings(db, CartBooking.cart_id == cart_id)
     db.delete(cart)
     db.commit()
+
+    for row in deleted:
+        booking_index.remove(row.id, row.cart_id)
     return {"ok": True}
 
 
@@ -1,27 +1,173 @@
+import hashlib
+import os
+import re
 import uuid
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy import func as sa_func
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse
+from sqlalchemy import func as sa_func, insert, select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from db.database import get_db
+from config import settings
 from models.meeting_point import MeetingPoint
+from models.meeting_point_version import MeetingPointVersion
+from models.conductor_stat import ConductorStat
 from models.user import User
 from schemas.meeting_point import (
     MeetingPointOut,
     MeetingPointCreate,
     MeetingPointSeriesCreate,
+    MeetingPointSeriesUpdate,
     MeetingPointUpdate,
     ConductorStatsOut,
     MonthlyStatsOut,
+    ConductorSuggestionOut,
+    MeetingPointSuggestionOut,
     RecurrenceType,
+    ExportJobCreate,
+    ExportJobOut,
 )
 from auth.deps import get_current_user, require_fieldserviceplanner
 
+from utils.conductor_stats import apply_conductor_changes
+from utils.conductor_suggestions import ConductorPlanner, RECENCY_WINDOW_DAYS
+from utils.months import month_bounds, month_of, months_between
+from utils.pdf_cache import PdfCache
+from utils.pdf_jobs import PdfJobQueue, PdfJobQueueFull
+
 router = APIRouter(prefix="/meeting-points", tags=["Meeting Points"])
 
+pdf_cache = PdfCache(max_bytes=settings.pdf_cache_max_mb * 1024 * 1024)
+pdf_jobs = PdfJobQueue(
+    directory=settings.pdf_export_dir,
+    max_workers=settings.pdf_render_workers,
+    max_pending=settings.pdf_render_max_pending,
+    max_age_hours=settings.pdf_export_max_age_hours,
+    max_files=settings.pdf_export_max_files,
+)
+
+def _bump_versions(db: Session, months):
+    """Bump the content version of every touched month, in the caller's transaction."""
+    rows = [{"month": m, "version": 1} for m in sorted(set(months))]
+    if not rows:
+        return
+    stmt = pg_insert(MeetingPointVersion).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[MeetingPointVersion.month],
+            set_={"version": MeetingPointVersion.version + 1},
+        )
+    )
+
+
+def _meeting_points_changed(db: Session, before=(), after=()):
+    """
+    Keep the per-month version and the conductor rollup in step with a
+    meeting point write. `before` and `after` are the (conductor_id, date)
+    pairs of the written meeting points before and after it.
+    """
+    _bump_versions(db, [month_of(day) for _, day in [*before, *after]])
+    apply_conductor_changes(db, removed=before, added=after)
+
+
+def _content_version(db: Session, month: str) -> int:
+    row = db.query(MeetingPointVersion.version).filter(MeetingPointVersion.month == month).first()
+    return row.version if row else 0
+
+
+MAX_SUGGESTIONS = 20
+
+
+def _conductor_planner(db: Session, year: int, start: date, end: date, exclude_id=None) -> ConductorPlanner:
+    """
+    Planner for dates in [start, end): yearly counts from the conductor_stats
+    rollup plus the assignments within the recency window around the range.
+    """
+    conductors = {
+        row.id: (row.firstname, row.lastname)
+        for row in db.query(User.id, User.firstname, User.lastname)
+        .filter(User.active == True)
+        .order_by(User.lastname, User.firstname)
+    }
+    counts = dict(
+        db.query(ConductorStat.conductor_id, sa_func.sum(ConductorStat.count))
+        .filter(ConductorStat.year == year)
+        .group_by(ConductorStat.conductor_id)
+        .all()
+    )
+
+    window = timedelta(days=RECENCY_WINDOW_DAYS)
+    assignments = db.query(MeetingPoint.conductor_id, MeetingPoint.date).filter(
+        MeetingPoint.date >= start - window,
+        MeetingPoint.date < end + window,
+        MeetingPoint.conductor_id.isnot(None),
+    )
+    if exclude_id:
+        assignments = assignments.filter(MeetingPoint.id != exclude_id)
+
+    return ConductorPlanner(conductors, counts, assignments.all())
+
+
+MONTH_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+MAX_EXPORT_MONTHS = 36
+
+
+def _export_range(month, from_month, to_month) -> tuple[str, str]:
+    """Resolve ?month= or ?from=&to= into an inclusive (first, last) month range."""
+    if month:
+        from_month = to_month = month
+    if not from_month or not to_month:
+        raise HTTPException(status_code=400, detail="Provide month or from and to")
+    for value in (from_month, to_month):
+        if not MONTH_PATTERN.match(value):
+            raise HTTPException(status_code=400, detail=f"Invalid month: {value}, expected YYYY-MM")
+    if from_month > to_month:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if len(months_between(from_month, to_month)) > MAX_EXPORT_MONTHS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_EXPORT_MONTHS} months per export")
+    return from_month, to_month
+
+
+def _export_key(db: Session, from_month: str, to_month: str) -> str:
+    """Content key of an export: changes whenever any month in the range changes."""
+    if from_month == to_month:
+        return f"{from_month}-v{_content_version(db, from_month)}"
+
+    versions = (
+        db.query(MeetingPointVersion.month, MeetingPointVersion.version)
+        .filter(MeetingPointVersion.month >= from_month, MeetingPointVersion.month <= to_month)
+        .order_by(MeetingPointVersion.month)
+        .all()
+    )
+    digest = hashlib.sha256(repr([tuple(v) for v in versions]).encode()).hexdigest()[:16]
+    return f"{from_month}..{to_month}-{digest}"
+
+
+def _submit_export(from_month: str, to_month: str, key: str):
+    """Render job for this content key; reuses a running or finished one."""
+    job = pdf_jobs.get(pdf_jobs.job_id_for(key))
+    if job and job.status != "failed":
+        return job
+
+    # The render process streams the rows itself, nothing is loaded here
+    try:
+        return pdf_jobs.submit(key, from_month, to_month)
+    except PdfJobQueueFull:
+        raise HTTPException(status_code=503, detail="Too many exports in progress, try again shortly")
+
+
+def _job_out(job) -> ExportJobOut:
+    return ExportJobOut(
+        job_id=job.id,
+        status=job.status,
+        error=job.error,
+        download_url=f"/meeting-points/export-jobs/{job.id}/pdf" if job.status == "done" else None,
+    )
+
 
 def _to_out(mp: MeetingPoint) -> dict:
     """Convert a MeetingPoint ORM instance to a dict with conductor_name."""
@@ -46,13 +192,28 @@ def _to_out(mp: MeetingPoint) -> dict:
 
 @router.get("", response_model=list[MeetingPointOut])
 def list_meeting_points(
-    month: str = Query(..., description="Month in YYYY-MM format"),
+    month: str | None = Query(None, description="Month in YYYY-MM format"),
+    from_date: date | None = Query(None, alias="from", description="First day of the range (inclusive)"),
+    to_date: date | None = Query(None, alias="to", description="Last day of the range (inclusive)"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
+    """Meeting points of one month (?month=) or of any date range (?from=&to=)."""
+    if month:
+        if not MONTH_PATTERN.match(month):
+            raise HTTPException(status_code=400, detail=f"Invalid month: {month}, expected YYYY-MM")
+        start, end = month_bounds(month)
+    elif from_date and to_date:
+        if from_date > to_date:
+            raise HTTPException(status_code=400, detail="from must not be after to")
+        start, end = from_date, to_date + timedelta(days=1)
+    else:
+        raise HTTPException(status_code=400, detail="Provide month or from and to")
+
+    # Range scan on (date, time), already in the requested order
     items = (
         db.query(MeetingPoint)
-        .filter(MeetingPoint.month == month)
+        .filter(MeetingPoint.date >= start, MeetingPoint.date < end)
         .order_by(MeetingPoint.date, MeetingPoint.time)
         .all()
     )
@@ -61,24 +222,93 @@ def list_meeting_points(
 
 @router.get("/export")
 def export_meeting_points_pdf(
-    month: str = Query(..., description="Month in YYYY-MM format"),
+    request: Request,
+    month: str | None = Query(None, description="Month in YYYY-MM format"),
+    from_month: str | None = Query(None, alias="from", description="First month (YYYY-MM) of a multi-month export"),
+    to_month: str | None = Query(None, alias="to", description="Last month (YYYY-MM) of a multi-month export"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    from utils.meeting_point_pdf import generate_meeting_points_pdf
+    """
+    PDF of one month (?month=) or of a range of months (?from=&to=, one
+    section per month). Rendered once per content version on the render
+    process pool; single months are then served from memory, ranges are
+    streamed from the rendered file. While a version is still rendering
+    the answer is 202 with its export job (poll it, then download).
+    Clients that already have this version get a 304.
+    """
+    from_month, to_month = _export_range(month, from_month, to_month)
+    key = _export_key(db, from_month, to_month)
+
+    name = from_month if from_month == to_month else f"{from_month}_{to_month}"
+    etag = f'"{key}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f"attachment; filename=puntos_encuentro_{name}.pdf",
+    }
 
-    items = (
-        db.query(MeetingPoint)
-        .filter(MeetingPoint.month == month)
-        .order_by(MeetingPoint.date, MeetingPoint.time)
-        .all()
-    )
-    pdf_buffer = generate_meeting_points_pdf(items, month)
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename=puntos_encuentro_{month}.pdf"},
-    )
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    pdf = pdf_cache.get(key) if from_month == to_month else None
+    if pdf is not None:
+        return Response(content=pdf, media_type="application/pdf", headers=headers)
+
+    job = _submit_export(from_month, to_month, key)
+    if job.status != "done":
+        # Not rendered yet: hand out the job instead of holding a worker thread
+        return JSONResponse(
+            status_code=202,
+            content=jsonable_encoder(_job_out(job)),
+            headers={"Location": f"/meeting-points/export-jobs/{job.id}", "Retry-After": "1"},
+        )
+
+    if from_month != to_month:
+        if not os.path.exists(job.path):
+            raise HTTPException(status_code=503, detail="PDF export expired, try again")
+        return FileResponse(job.path, media_type="application/pdf", headers=headers)
+
+    try:
+        with open(job.path, "rb") as f:
+            pdf = f.read()
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="PDF export expired, try again")
+    pdf_cache.put(key, pdf)
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
+
+
+@router.post("/export-jobs", response_model=ExportJobOut, status_code=202)
+def create_export_job(
+    data: ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Start rendering a PDF in the background; identical requests share one job."""
+    from_month, to_month = _export_range(data.month, data.from_month, data.to_month)
+    key = _export_key(db, from_month, to_month)
+    return _job_out(_submit_export(from_month, to_month, key))
+
+
+@router.get("/export-jobs/{job_id}", response_model=ExportJobOut)
+def get_export_job(job_id: str, current_user=Depends(get_current_user)):
+    job = pdf_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return _job_out(job)
+
+
+@router.get("/export-jobs/{job_id}/pdf")
+def download_export_job(job_id: str, current_user=Depends(get_current_user)):
+    job = pdf_jobs.get(job_id)
+    if not job or job.status != "done" or not os.path.exists(job.path):
+        raise HTTPException(status_code=404, detail="Export not ready")
+    return FileResponse(job.path, media_type="application/pdf", filename="puntos_encuentro.pdf")
+
+
+@router.get("/export/cache-stats")
+def get_export_cache_stats(current_user=Depends(require_fieldserviceplanner)):
+    return pdf_cache.stats()
 
 
 @router.get("/stats", response_model=list[ConductorStatsOut])
@@ -87,43 +317,43 @@ def get_conductor_stats(
     db: Session = Depends(get_db),
     current_user=Depends(require_fieldserviceplanner),
 ):
-    year_prefix = f"{year}-"
+    # At most twelve rollup rows per conductor, read via (year, conductor_id)
+    yearly = (
+        db.query(
+            ConductorStat.conductor_id,
+            sa_func.sum(ConductorStat.count).label("count"),
+            sa_func.max(ConductorStat.last_date).label("last_date"),
+        )
+        .filter(ConductorStat.year == year)
+        .group_by(ConductorStat.conductor_id)
+        .subquery()
+    )
 
-    # Count per conductor
+    count = sa_func.coalesce(yearly.c.count, 0)
     rows = (
         db.query(
-            MeetingPoint.conductor_id,
-            sa_func.count().label("count"),
-            sa_func.max(MeetingPoint.date).label("last_date"),
-        )
-        .filter(
-            MeetingPoint.month.like(f"{year_prefix}%"),
-            MeetingPoint.conductor_id.isnot(None),
+            User.id,
+            User.firstname,
+            User.lastname,
+            count.label("count"),
+            yearly.c.last_date,
         )
-        .group_by(MeetingPoint.conductor_id)
+        .outerjoin(yearly, yearly.c.conductor_id == User.id)
+        .filter(User.active == True)
+        .order_by(count, User.lastname, User.firstname)
         .all()
     )
 
-    stats_map = {row.conductor_id: {"count": row.count, "last_date": row.last_date} for row in rows}
-
-    # All active users
-    active_users = db.query(User).filter(User.active == True).all()
-
-    result = []
-    for u in active_users:
-        info = stats_map.get(u.id, {"count": 0, "last_date": None})
-        result.append(
-            ConductorStatsOut(
-                user_id=u.id,
-                firstname=u.firstname,
-                lastname=u.lastname,
-                count=info["count"],
-                last_date=info["last_date"],
-            )
+    return [
+        ConductorStatsOut(
+            user_id=row.id,
+            firstname=row.firstname,
+            lastname=row.lastname,
+            count=row.count,
+            last_date=row.last_date,
         )
-
-    result.sort(key=lambda x: (x.count, x.lastname, x.firstname))
-    return result
+        for row in rows
+    ]
 
 
 @router.get("/stats/monthly", response_model=list[MonthlyStatsOut])
@@ -132,43 +362,91 @@ def get_monthly_stats(
     db: Session = Depends(get_db),
     current_user=Depends(require_fieldserviceplanner),
 ):
-    year_prefix = f"{year}-"
-
     rows = (
         db.query(
-            MeetingPoint.month,
-            MeetingPoint.conductor_id,
-            sa_func.count().label("count"),
+            ConductorStat.month,
+            ConductorStat.conductor_id,
+            ConductorStat.count,
+            User.firstname,
+            User.lastname,
         )
+        .join(User, User.id == ConductorStat.conductor_id)
+        .filter(ConductorStat.year == year, ConductorStat.count > 0)
+        .order_by(ConductorStat.month)
+        .all()
+    )
+
+    return [
+        MonthlyStatsOut(
+            month=f"{year}-{row.month:02d}",
+            user_id=row.conductor_id,
+            firstname=row.firstname,
+            lastname=row.lastname,
+            count=row.count,
+        )
+        for row in rows
+    ]
+
+
+@router.get("/suggest-conductor", response_model=list[ConductorSuggestionOut])
+def suggest_conductor(
+    on_date: date = Query(..., alias="date", description="Date of the meeting point"),
+    limit: int = Query(5, ge=1, le=MAX_SUGGESTIONS),
+    meeting_point_id: UUID | None = Query(None, description="Meeting point being edited, ignored as a conflict"),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_fieldserviceplanner),
+):
+    """Ranked shortlist of conductors for one date (fewest this year, longest rest, free that day)."""
+    planner = _conductor_planner(
+        db, on_date.year, on_date, on_date + timedelta(days=1), exclude_id=meeting_point_id
+    )
+    return planner.top(on_date, limit)
+
+
+@router.get("/suggest-conductor/month", response_model=list[MeetingPointSuggestionOut])
+def suggest_conductors_for_month(
+    month: str = Query(..., description="Month in YYYY-MM format"),
+    limit: int = Query(3, ge=1, le=MAX_SUGGESTIONS),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_fieldserviceplanner),
+):
+    """
+    Proposed conductors for every unassigned meeting point of a month, in
+    date order. Each proposal already counts for the following ones, so the
+    month is spread out. Nothing is saved.
+    """
+    if not MONTH_PATTERN.match(month):
+        raise HTTPException(status_code=400, detail=f"Invalid month: {month}, expected YYYY-MM")
+
+    start, end = month_bounds(month)
+    slots = (
+        db.query(MeetingPoint.id, MeetingPoint.date, MeetingPoint.time, MeetingPoint.location)
         .filter(
-            MeetingPoint.month.like(f"{year_prefix}%"),
-            MeetingPoint.conductor_id.isnot(None),
+            MeetingPoint.date >= start,
+            MeetingPoint.date < end,
+            MeetingPoint.conductor_id.is_(None),
         )
-        .group_by(MeetingPoint.month, MeetingPoint.conductor_id)
-        .order_by(MeetingPoint.month)
+        .order_by(MeetingPoint.date, MeetingPoint.time)
         .all()
     )
+    if not slots:
+        return []
 
-    # Collect user IDs and fetch names
-    user_ids = {row.conductor_id for row in rows}
-    users = db.query(User).filter(User.id.in_(user_ids)).all() if user_ids else []
-    user_map = {u.id: u for u in users}
-
+    planner = _conductor_planner(db, start.year, start, end)
     result = []
-    for row in rows:
-        u = user_map.get(row.conductor_id)
-        if not u:
-            continue
+    for slot in slots:
+        suggestions = planner.top(slot.date, limit)
+        if suggestions:
+            planner.assign(suggestions[0]["user_id"], slot.date)
         result.append(
-            MonthlyStatsOut(
-                month=row.month,
-                user_id=row.conductor_id,
-                firstname=u.firstname,
-                lastname=u.lastname,
-                count=row.count,
+            MeetingPointSuggestionOut(
+                meeting_point_id=slot.id,
+                date=slot.date,
+                time=slot.time,
+                location=slot.location,
+                suggestions=suggestions,
             )
         )
-
     return result
 
 
@@ -197,9 +475,9 @@ def create_meeting_point(
         conductor_id=data.conductor_id,
         outline=data.outline,
         link=data.link,
-        month=data.date.strftime("%Y-%m"),
     )
     db.add(mp)
+    _meeting_points_changed(db, after=[(mp.conductor_id, mp.date)])
     db.commit()
     db.refresh(mp)
     return _to_out(mp)
@@ -239,26 +517,39 @@ def create_meeting_point_series(
     series_id = uuid.uuid4()
     dates = _generate_series_dates(data.start_date, data.end_date, data.recurrence)
 
-    created = []
-    for d in dates:
-        mp = MeetingPoint(
-            date=d,
-            time=data.time,
-            location=data.location,
-            conductor_id=data.conductor_id,
-            outline=data.outline,
-            link=data.link,
-            month=d.strftime("%Y-%m"),
-            series_id=series_id,
-        )
-        db.add(mp)
-        created.append(mp)
-
+    conductor_name = None
+    if data.conductor_id:
+        conductor = db.query(User.firstname, User.lastname).filter(User.id == data.conductor_id).first()
+        if not conductor:
+            raise HTTPException(status_code=404, detail="Conductor not found")
+        conductor_name = f"{conductor.firstname} {conductor.lastname}"
+
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "date": d,
+            "time": data.time,
+            "location": data.location,
+            "conductor_id": data.conductor_id,
+            "outline": data.outline,
+            "link": data.link,
+            "series_id": series_id,
+        }
+        for d in dates
+    ]
+
+    # One multi-row INSERT ... RETURNING instead of add + refresh per row
+    created = db.execute(
+        insert(MeetingPoint).values(rows).returning(*MeetingPoint.__table__.c)
+    ).all()
+
+    _meeting_points_changed(db, after=[(data.conductor_id, d) for d in dates])
     db.commit()
-    for mp in created:
-        db.refresh(mp)
 
-    return [_to_out(mp) for mp in created]
+    return [
+        {**row._mapping, "month": month_of(row.date), "conductor_name": conductor_name}
+        for row in created
+    ]
 
 
 @router.put("/{meeting_point_id}", response_model=MeetingPointOut)
@@ -272,14 +563,12 @@ def update_meeting_point(
     if not mp:
         raise HTTPException(status_code=404, detail="Meeting point not found")
 
+    before = (mp.conductor_id, mp.date)
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(mp, key, value)
 
-    # Recompute month if date changed
-    if "date" in update_data:
-        mp.month = mp.date.strftime("%Y-%m")
-
+    _meeting_points_changed(db, before=[before], after=[(mp.conductor_id, mp.date)])
     db.commit()
     db.refresh(mp)
     return _to_out(mp)
@@ -295,23 +584,67 @@ def delete_meeting_point(
     if not mp:
         raise HTTPException(status_code=404, detail="Meeting point not found")
 
+    before = (mp.conductor_id, mp.date)
     db.delete(mp)
+    _meeting_points_changed(db, before=[before])
     db.commit()
     return {"ok": True}
 
 
+@router.patch("/series/{series_id}")
+def update_meeting_point_series(
+    series_id: UUID,
+    data: MeetingPointSeriesUpdate,
+    from_date: date | None = Query(None, description="Only change occurrences on or after this date"),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_fieldserviceplanner),
+):
+    """Change time, location, conductor, outline or link of a whole series (or this and following) in one UPDATE."""
+    values = data.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+
+    if values.get("conductor_id") and not db.query(User.id).filter(User.id == values["conductor_id"]).first():
+        raise HTTPException(status_code=404, detail="Conductor not found")
+
+    criteria = [MeetingPoint.series_id == series_id]
+    if from_date:
+        criteria.append(MeetingPoint.date >= from_date)
+
+    before = None
+    if "conductor_id" in values:
+        # RETURNING only sees the new conductor; the rollup also needs the old one
+        before = db.execute(
+            select(MeetingPoint.conductor_id, MeetingPoint.date).where(*criteria).with_for_update()
+        ).all()
+
+    updated = db.execute(
+        update(MeetingPoint).where(*criteria).values(**values)
+        .returning(MeetingPoint.conductor_id, MeetingPoint.date)
+    ).all()
+    if not updated:
+        raise HTTPException(status_code=404, detail="Series not found")
+
+    _meeting_points_changed(db, before=updated if before is None else before, after=updated)
+    db.commit()
+    return {"ok": True, "updated": len(updated)}
+
+
 @router.delete("/series/{series_id}")
 def delete_meeting_point_series(
     series_id: UUID,
+    from_date: date | None = Query(None, description="Only delete occurrences on or after this date"),
     db: Session = Depends(get_db),
     current_user=Depends(require_fieldserviceplanner),
 ):
-    items = db.query(MeetingPoint).filter(MeetingPoint.series_id == series_id).all()
-    if not items:
-        raise HTTPException(status_code=404, detail="Series not found")
+    stmt = delete(MeetingPoint).where(MeetingPoint.series_id == series_id)
+    if from_date:
+        stmt = stmt.where(MeetingPoint.date >= from_date)
 
-    for mp in items:
-        db.delete(mp)
+    deleted = db.execute(stmt.returning(MeetingPoint.conductor_id, MeetingPoint.date)).all()
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Series not found")
 
+    _meeting_points_changed(db, before=deleted)
     db.commit()
-    return {"ok": True, "deleted": len(items)}
+    return {"ok": True, "deleted": len(deleted)}
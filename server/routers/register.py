@@ -1,13 +1,14 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from db.database import get_db
 from models.user import User
 from models.invite_token import InviteToken
 from schemas.user import RegisterRequest, TokenValidationResponse
-from auth.security import hash_password
+from auth.security import PasswordHasherBusy, password_hasher
 
 router = APIRouter(prefix="/register", tags=["Registration"])
 
@@ -57,14 +58,7 @@ def validate_token(
     )
 
 
-@router.post("/{token}")
-def complete_registration(
-    token: str,
-    data: RegisterRequest,
-    db: Session = Depends(get_db),
-):
-    """Complete user registration by setting password."""
-
+def _pending_registration(db: Session, token: str):
     invite = (
         db.query(InviteToken)
         .filter(InviteToken.token == token)
@@ -89,12 +83,37 @@ def complete_registration(
     if user.password_hash is not None:
         raise HTTPException(status_code=400, detail="User has already registered")
 
+    return invite, user
+
+
+def _save_registration(db: Session, invite: InviteToken, user: User, password_hash: str):
     # Set the password
-    user.password_hash = hash_password(data.password)
+    user.password_hash = password_hash
 
     # Mark token as used
     invite.used_at = datetime.now(timezone.utc)
 
     db.commit()
 
+
+@router.post("/{token}")
+async def complete_registration(
+    token: str,
+    data: RegisterRequest,
+    db: Session = Depends(get_db),
+):
+    """Complete user registration by setting password (hashed off the request threadpool)."""
+    invite, user = await run_in_threadpool(_pending_registration, db, token)
+
+    try:
+        password_hash = await password_hasher.hash(data.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many requests in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    await run_in_threadpool(_save_registration, db, invite, user, password_hash)
+
     return {"message": "Registration complete. You can now log in."}
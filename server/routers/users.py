@@ -3,11 +3,15 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import exists, func, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from db.database import get_db
 from models.user import User
 from models.invite_token import InviteToken
+from models.cart_booking import CartBooking
+from models.booking_participant import BookingParticipant
 from schemas.user import (
     UserOut,
     UserCreate,
@@ -22,7 +26,9 @@ from utils.usernames import (
     slugify_username,
     get_suggested_username,
 )
-from auth.deps import require_admin, get_current_user
+from utils.booking_events import delete_bookings
+from utils.booking_index import booking_index
+from auth.deps import require_admin, get_current_user, user_status
 
 
 
@@ -118,7 +124,7 @@ def create_user(
 
     # Check if email already exists (only if email is provided)
     if data.email:
-        if db.query(User).filter(User.email == data.email).first():
+        if db.query(User).filter(func.lower(User.email) == data.email.lower()).first():
             raise HTTPException(status_code=400, detail="Email already registered")
 
     # Generate or validate username
@@ -152,7 +158,12 @@ def create_user(
         expires_at=datetime.now(timezone.utc) + timedelta(days=INVITE_TOKEN_EXPIRY_DAYS),
     )
     db.add(invite)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent insert won the case-insensitive unique index
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email or username already registered")
     db.refresh(user)
 
     # Build invite URL (frontend will be at /register/{token})
@@ -256,7 +267,9 @@ def update_user(
     if active is not None:
         user.active = active
 
+    user_status.publish(db, user.id)
     db.commit()
+    user_status.invalidate(user.id)
     db.refresh(user)
 
     return user_to_out(user)
@@ -279,7 +292,9 @@ def update_user_roles(
         raise HTTPException(status_code=403, detail="Cannot modify the main admin account")
 
     user.roles = data.roles
+    user_status.publish(db, user.id)
     db.commit()
+    user_status.invalidate(user.id)
     db.refresh(user)
 
     return user_to_out(user)
@@ -303,9 +318,29 @@ def delete_user(
     # Delete invite tokens first (foreign key constraint)
     db.query(InviteToken).filter(InviteToken.user_id == user_id).delete()
 
+    # Bookings the user had alone are deleted (and announced to the streams and
+    # every worker's index); shared ones keep the other participant
+    def participant(*criteria):
+        return exists().where(BookingParticipant.booking_id == CartBooking.id, *criteria)
+
+    deleted = delete_bookings(
+        db,
+        or_(CartBooking.user_id == user_id, participant(BookingParticipant.user_id == user_id)),
+        ~participant(BookingParticipant.user_id != user_id),
+    )
+    db.query(BookingParticipant).filter(BookingParticipant.user_id == user_id).delete(synchronize_session=False)
+    db.query(CartBooking).filter(CartBooking.user_id == user_id).update(
+        {CartBooking.user_id: None}, synchronize_session=False
+    )
+
     # Delete user
     db.delete(user)
+    user_status.publish(db, user_id)
     db.commit()
+    user_status.invalidate(user_id)
+
+    for row in deleted:
+        booking_index.remove(row.id, row.cart_id)
 
     return {"message": "User deleted"}
 
@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field, field_validator
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from uuid import UUID
 
 
@@ -17,6 +19,66 @@ class BookingCreate(BaseModel):
         return v
 
 
+MAX_BULK_BOOKINGS = 500
+
+
+class BookingBulkCreate(BaseModel):
+    bookings: list[BookingCreate] = Field(..., min_length=1, max_length=MAX_BULK_BOOKINGS)
+
+
+class BookingRecurrenceType(str, Enum):
+    weekly = "weekly"
+    biweekly = "biweekly"
+
+
+class BookingSeriesCreate(BaseModel):
+    """First occurrence plus a recurrence rule, repeated until `until` (inclusive)"""
+    cart_id: UUID
+    participant_ids: list[UUID] = Field(..., min_length=1, max_length=2)
+    start_datetime: datetime
+    end_datetime: datetime
+    recurrence: BookingRecurrenceType
+    until: date
+    timezone: str = "UTC"
+
+    @field_validator('end_datetime')
+    @classmethod
+    def end_after_start(cls, v, info):
+        if 'start_datetime' in info.data and v <= info.data['start_datetime']:
+            raise ValueError('end_datetime must be after start_datetime')
+        return v
+
+    @field_validator('timezone')
+    @classmethod
+    def known_timezone(cls, v):
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f'Unknown timezone: {v}')
+        return v
+
+    @model_validator(mode='after')
+    def until_not_before_start(self):
+        # Compared in the series timezone, like the occurrence generator does
+        first_day = self.start_datetime.astimezone(ZoneInfo(self.timezone)).date()
+        if self.until < first_day:
+            raise ValueError('until must not be before the date of start_datetime')
+        return self
+
+
+class BulkBookingItemOut(BaseModel):
+    index: int  # position in the request list
+    accepted: bool
+    booking_id: UUID | None = None
+    detail: str | None = None
+
+
+class BulkBookingOut(BaseModel):
+    accepted: int
+    rejected: int
+    results: list[BulkBookingItemOut]
+
+
 class ParticipantOut(BaseModel):
     id: UUID
     firstname: str
@@ -30,6 +92,7 @@ class ParticipantOut(BaseModel):
 class BookingOut(BaseModel):
     id: UUID
     cart_id: UUID
+    series_id: UUID | None = None
     participants: list[ParticipantOut]
     start_datetime: datetime
     end_datetime: datetime
@@ -50,3 +113,93 @@ class CalendarBookingOut(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+MAX_AVAILABILITY_WINDOWS = 500
+
+
+class TimeWindow(BaseModel):
+    start_datetime: datetime
+    end_datetime: datetime
+
+    @field_validator('end_datetime')
+    @classmethod
+    def end_after_start(cls, v, info):
+        if 'start_datetime' in info.data and v <= info.data['start_datetime']:
+            raise ValueError('end_datetime must be after start_datetime')
+        return v
+
+
+class AvailabilityRequest(BaseModel):
+    """
+    Either an explicit list of windows, or a day split into equal slots
+    (day + slot_minutes, optionally limited by day_start/day_end).
+    """
+    windows: list[TimeWindow] | None = None
+
+    day: date | None = None
+    slot_minutes: int | None = Field(None, ge=5, le=24 * 60)
+    day_start: time = time(0, 0)
+    day_end: time | None = None  # None = end of day
+    timezone: str = "UTC"
+
+    @model_validator(mode='after')
+    def check_mode(self):
+        if self.windows is None and (self.day is None or self.slot_minutes is None):
+            raise ValueError('Provide either windows or day + slot_minutes')
+        if self.windows is not None and self.day is not None:
+            raise ValueError('Provide either windows or day + slot_minutes, not both')
+        try:
+            ZoneInfo(self.timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f'Unknown timezone: {self.timezone}')
+        if len(self.resolve_windows()) > MAX_AVAILABILITY_WINDOWS:
+            raise ValueError(f'At most {MAX_AVAILABILITY_WINDOWS} windows per request')
+        return self
+
+    def resolve_windows(self) -> list[TimeWindow]:
+        if self.windows is not None:
+            return self.windows
+
+        tz = ZoneInfo(self.timezone)
+        current = datetime.combine(self.day, self.day_start, tzinfo=tz)
+        if self.day_end is None:
+            day_end = datetime.combine(self.day + timedelta(days=1), time(0, 0), tzinfo=tz)
+        else:
+            day_end = datetime.combine(self.day, self.day_end, tzinfo=tz)
+
+        step = timedelta(minutes=self.slot_minutes)
+        windows = []
+        while current + step <= day_end:
+            windows.append(TimeWindow(start_datetime=current, end_datetime=current + step))
+            current += step
+        return windows
+
+
+class AvailabilityCartOut(BaseModel):
+    cart_id: UUID
+    cart_name: str
+    location: str | None = None
+
+
+class AvailabilityMatrixOut(BaseModel):
+    """remaining[i][j] = free places on carts[i] during windows[j]"""
+    capacity: int
+    windows: list[TimeWindow]
+    carts: list[AvailabilityCartOut]
+    remaining: list[list[int]]
+
+
+class ConflictBookingOut(BaseModel):
+    id: UUID
+    cart_id: UUID
+    start_datetime: datetime
+    end_datetime: datetime
+
+
+class BookingConflictOut(BaseModel):
+    """One participant booked on two overlapping bookings"""
+    user_id: UUID
+    user_name: str
+    booking: ConflictBookingOut
+    other_booking: ConflictBookingOut
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
+import datetime as dt
 from datetime import date, time, datetime
 from typing import Optional
 from enum import Enum
@@ -50,14 +51,31 @@ class MeetingPointSeriesCreate(BaseModel):
 
 
 class MeetingPointUpdate(BaseModel):
-    date: Optional[date] = None
-    time: Optional[time] = None
+    # dt.* because a field named like its type shadows it once it has a default
+    date: Optional[dt.date] = None
+    time: Optional[dt.time] = None
     location: Optional[str] = None
     conductor_id: Optional[UUID] = None
     outline: Optional[str] = None
     link: Optional[str] = None
 
 
+class MeetingPointSeriesUpdate(BaseModel):
+    time: Optional[dt.time] = None
+    location: Optional[str] = None
+    conductor_id: Optional[UUID] = None  # null unassigns the conductor
+    outline: Optional[str] = None
+    link: Optional[str] = None
+
+    @field_validator('time', 'location')
+    @classmethod
+    def not_null(cls, v, info):
+        # Only validated when sent; these columns are NOT NULL
+        if v is None:
+            raise ValueError(f'{info.field_name} cannot be null')
+        return v
+
+
 class ConductorStatsOut(BaseModel):
     user_id: UUID
     firstname: str
@@ -78,3 +96,39 @@ class MonthlyStatsOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ConductorSuggestionOut(BaseModel):
+    user_id: UUID
+    firstname: str
+    lastname: str
+    count: int  # meeting points conducted this year
+    gap_days: Optional[int] = None  # days to the nearest other assignment
+    same_day: int  # other meeting points conducted on the same day
+    score: int
+
+
+class MeetingPointSuggestionOut(BaseModel):
+    """Proposed conductor (first suggestion) plus alternatives for one unassigned meeting point"""
+    meeting_point_id: UUID
+    date: date
+    time: dt.time
+    location: str
+    suggestions: list[ConductorSuggestionOut]
+
+
+class ExportJobCreate(BaseModel):
+    """Either month, or from/to for a multi-month export (all "YYYY-MM")"""
+    month: Optional[str] = None
+    from_month: Optional[str] = Field(None, alias="from")
+    to_month: Optional[str] = Field(None, alias="to")
+
+    class Config:
+        populate_by_name = True
+
+
+class ExportJobOut(BaseModel):
+    job_id: str
+    status: str  # queued | running | done | failed
+    error: Optional[str] = None
+    download_url: Optional[str] = None
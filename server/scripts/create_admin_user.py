@@ -1,5 +1,6 @@
 import os
 import re
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from db.database import SessionLocal
@@ -46,7 +47,10 @@ def main():
         # If admin already exists -> do nothing
         existing = (
             db.query(User)
-            .filter((User.email == email) | (User.username == username))
+            .filter(
+                (func.lower(User.email) == email.lower())
+                | (func.lower(User.username) == username.lower())
+            )
             .first()
         )
         if existing:
@@ -0,0 +1,27 @@
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from db.database import SessionLocal
+from models.conductor_stat import ConductorStat
+from utils.conductor_stats import rebuild_conductor_stats
+
+load_dotenv()
+
+
+def main():
+    db: Session = SessionLocal()
+    try:
+        rebuild_conductor_stats(db)
+        db.commit()
+        rows = db.query(ConductorStat).count()
+        print(f"✅ Conductor statistics rebuilt ({rows} rows).")
+    except Exception as e:
+        db.rollback()
+        print("❌ Failed to rebuild conductor statistics:", e)
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from db.database import SessionLocal
@@ -22,9 +23,9 @@ def main():
         query = db.query(User)
 
         if admin_username:
-            user = query.filter(User.username == admin_username).first()
+            user = query.filter(func.lower(User.username) == admin_username.lower()).first()
         else:
-            user = query.filter(User.email == admin_email).first()
+            user = query.filter(func.lower(User.email) == admin_email.lower()).first()
 
         if not user:
             print("❌ Admin user not found.")
@@ -0,0 +1,61 @@
+import uuid
+from datetime import datetime, timedelta
+
+from models.booking_participant import BookingParticipant
+from models.cart_booking import CartBooking
+from routers.bookings import MAX_CONCURRENT_BOOKINGS
+
+
+def _item(cart, participant_ids, start, end):
+    return {
+        "cart_id": str(cart.id),
+        "participant_ids": [str(pid) for pid in participant_ids],
+        "start_datetime": start,
+        "end_datetime": end,
+    }
+
+
+def test_bulk_accepts_and_rejects_per_item(client, session, make_cart, make_user, shift):
+    cart, other_cart, retired = make_cart(), make_cart(), make_cart()
+    retired.active = False
+    session.commit()
+    users = [make_user() for _ in range(5)]
+    start, end = shift
+    later = (datetime.fromisoformat(start) + timedelta(days=1)).isoformat()
+    later_end = (datetime.fromisoformat(end) + timedelta(days=1)).isoformat()
+
+    # users[4] already stands at another cart during the shift
+    busy = client.post("/bookings", json=_item(other_cart, [users[4].id], start, end))
+    assert busy.status_code == 201
+
+    response = client.post("/bookings/bulk", json={"bookings": [
+        _item(cart, [users[0].id], start, end),
+        _item(cart, [users[1].id, users[2].id], start, end),
+        _item(cart, [users[3].id], start, end),  # third at once on this cart
+        _item(retired, [users[3].id], start, end),
+        _item(cart, [users[3].id, uuid.uuid4()], later, later_end),
+        _item(cart, [users[0].id], later, later_end),
+        _item(cart, [users[4].id], later, later_end),
+        _item(make_cart(), [users[4].id], start, end),
+        _item(cart, [users[0].id], later, later_end),  # users[0] got this slot two items ago
+    ]})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [(r["index"], r["accepted"], r["detail"]) for r in body["results"]] == [
+        (0, True, None),
+        (1, True, None),
+        (2, False, f"This cart is fully booked during this time (max {MAX_CONCURRENT_BOOKINGS} concurrent bookings)"),
+        (3, False, "Cart is not active"),
+        (4, False, "One or more participants not found"),
+        (5, True, None),
+        (6, True, None),
+        (7, False, "A participant is already booked at this time"),
+        (8, False, "A participant is already booked at this time"),
+    ]
+    assert (body["accepted"], body["rejected"]) == (4, 5)
+
+    accepted_ids = {uuid.UUID(r["booking_id"]) for r in body["results"] if r["accepted"]}
+    stored = session.query(CartBooking.id).filter(CartBooking.cart_id == cart.id).all()
+    assert {row.id for row in stored} == accepted_ids
+    assert session.query(BookingParticipant).filter(BookingParticipant.booking_id.in_(accepted_ids)).count() == 5
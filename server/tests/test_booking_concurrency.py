@@ -0,0 +1,118 @@
+"""
+Row locks taken by POST /bookings: the cart row serializes bookings of one
+cart, the participant rows (FOR NO KEY UPDATE) serialize bookings of one
+person across carts without blocking inserts that reference users.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from models.cart_booking import CartBooking
+from models.user import User
+from routers.bookings import MAX_CONCURRENT_BOOKINGS
+
+
+def _post_in_parallel(client, bodies):
+    """POST every body at the same moment, return the status codes."""
+    barrier = threading.Barrier(len(bodies))
+
+    def post(body):
+        barrier.wait()
+        return client.post("/bookings", json=body).status_code
+
+    with ThreadPoolExecutor(max_workers=len(bodies)) as pool:
+        return list(pool.map(post, bodies))
+
+
+def test_parallel_bookings_on_one_cart_respect_the_limit(client, session, make_cart, make_user, shift):
+    cart = make_cart()
+    users = [make_user() for _ in range(10)]
+    start, end = shift
+
+    codes = _post_in_parallel(client, [
+        {"cart_id": str(cart.id), "participant_ids": [str(u.id)], "start_datetime": start, "end_datetime": end}
+        for u in users
+    ])
+
+    assert codes.count(201) == MAX_CONCURRENT_BOOKINGS
+    assert codes.count(409) == len(users) - MAX_CONCURRENT_BOOKINGS
+    assert session.query(CartBooking).filter(CartBooking.cart_id == cart.id).count() == MAX_CONCURRENT_BOOKINGS
+
+
+def test_parallel_bookings_of_one_participant_on_different_carts(client, session, make_cart, make_user, shift):
+    carts = [make_cart() for _ in range(6)]
+    user = make_user()
+    start, end = shift
+
+    codes = _post_in_parallel(client, [
+        {"cart_id": str(c.id), "participant_ids": [str(user.id)], "start_datetime": start, "end_datetime": end}
+        for c in carts
+    ])
+
+    assert codes.count(201) == 1
+    assert codes.count(409) == len(carts) - 1
+    assert session.query(CartBooking).count() == 1
+
+
+def test_cart_lock_does_not_block_other_carts(client, engine, make_cart, make_user, shift):
+    locked_cart, other_cart = make_cart(), make_cart()
+    first, second = make_user(), make_user()
+    start, end = shift
+
+    def book(cart, user):
+        return client.post("/bookings", json={
+            "cart_id": str(cart.id),
+            "participant_ids": [str(user.id)],
+            "start_datetime": start,
+            "end_datetime": end,
+        }).status_code
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with engine.connect() as holder:
+            tx = holder.begin()
+            holder.execute(text("SELECT 1 FROM carts WHERE id = :id FOR UPDATE"), {"id": locked_cart.id})
+
+            blocked = pool.submit(book, locked_cart, first)
+            assert pool.submit(book, other_cart, second).result(timeout=10) == 201
+            time.sleep(0.5)
+            assert not blocked.done()
+
+            tx.rollback()
+
+        assert blocked.result(timeout=10) == 201
+
+
+@pytest.mark.parametrize("lock, blocks", [("FOR NO KEY UPDATE", False), ("FOR UPDATE", True)])
+def test_participant_lock_and_inserts_referencing_the_user(engine, session, make_user, lock, blocks):
+    """
+    The booking lock on a participant must not stall a login of that user
+    (refresh token insert takes FOR KEY SHARE on users). FOR UPDATE would.
+    """
+    user = make_user()
+
+    with engine.connect() as holder, engine.connect() as login:
+        holder_tx = holder.begin()
+        query = session.query(User.id).filter(User.id == user.id)
+        if lock == "FOR NO KEY UPDATE":
+            query = query.with_for_update(key_share=True)  # what the booking endpoints take
+        else:
+            query = query.with_for_update()
+        holder.execute(query.statement)
+
+        login_tx = login.begin()
+        login.execute(text("SET LOCAL lock_timeout = '1s'"))
+        insert = text(
+            "INSERT INTO refresh_tokens (id, user_id, token, expires_at, revoked) "
+            "VALUES (gen_random_uuid(), :user_id, gen_random_uuid(), now() + interval '1 day', false)"
+        )
+        if blocks:
+            with pytest.raises(OperationalError, match="lock timeout"):
+                login.execute(insert, {"user_id": user.id})
+        else:
+            login.execute(insert, {"user_id": user.id})
+        login_tx.rollback()
+        holder_tx.rollback()
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+from models.booking_participant import BookingParticipant
+from models.cart_booking import CartBooking
+
+DAY = datetime(2026, 6, 6, tzinfo=timezone.utc)
+
+
+def _at(hour, minute=0):
+    return DAY + timedelta(hours=hour, minutes=minute)
+
+
+def _book(session, cart, user, start, end):
+    """Insert a booking directly; the API would refuse to create a conflict."""
+    booking = CartBooking(cart_id=cart.id, user_id=user.id, start_datetime=start, end_datetime=end)
+    session.add(booking)
+    session.flush()
+    session.add(BookingParticipant(booking_id=booking.id, user_id=user.id))
+    session.commit()
+    return booking
+
+
+def _conflicts(client, headers, start, end):
+    response = client.get(
+        "/bookings/conflicts", headers=headers, params={"from": start.isoformat(), "to": end.isoformat()},
+    )
+    assert response.status_code == 200, response.text
+    return [(c["booking"]["id"], c["other_booking"]["id"]) for c in response.json()]
+
+
+def test_conflicts_are_reported_where_the_overlap_falls_in_the_range(client, session, make_cart, make_user, auth_headers):
+    headers = auth_headers(make_user(roles=["admin"]))
+    user = make_user()
+    early = _book(session, make_cart(), user, _at(8), _at(12))
+    late = _book(session, make_cart(), user, _at(10), _at(14))
+    pair = [(str(early.id), str(late.id))]
+
+    assert _conflicts(client, headers, _at(11), _at(11, 30)) == pair
+    # Both bookings reach into these ranges, their overlap (10-12) does not
+    assert _conflicts(client, headers, _at(7), _at(9)) == []
+    assert _conflicts(client, headers, _at(13), _at(15)) == []
+
+
+def _post(client, cart, participants, start, end):
+    return client.post("/bookings", json={
+        "cart_id": str(cart.id),
+        "participant_ids": [str(u.id) for u in participants],
+        "start_datetime": start.isoformat(),
+        "end_datetime": end.isoformat(),
+    })
+
+
+def test_booking_rejects_a_participant_busy_on_another_cart(client, session, make_cart, make_user):
+    busy, partner, other = make_user(firstname="Ana", lastname="Busy"), make_user(), make_user()
+    assert _post(client, make_cart(), [busy], _at(10), _at(12)).status_code == 201
+
+    response = _post(client, make_cart(), [partner, busy], _at(11), _at(13))
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Already booked at this time: Ana Busy"
+    # Back to back is not a conflict, and other people are not affected
+    assert _post(client, make_cart(), [busy], _at(12), _at(14)).status_code == 201
+    assert _post(client, make_cart(), [partner, other], _at(11), _at(13)).status_code == 201
+    assert session.query(CartBooking).count() == 3
+
+
+def test_conflicts_lists_each_pair_once_across_carts(client, session, make_cart, make_user, auth_headers):
+    headers = auth_headers(make_user(roles=["admin"]))
+    user, bystander = make_user(firstname="Ana", lastname="Twice"), make_user()
+    first = _book(session, make_cart(), user, _at(10), _at(12))
+    second = _book(session, make_cart(), user, _at(11), _at(13))
+    _book(session, make_cart(), user, _at(13), _at(14))  # touches the second one only
+    _book(session, make_cart(), bystander, _at(10), _at(12))
+
+    response = client.get(
+        "/bookings/conflicts", headers=headers, params={"from": _at(0).isoformat(), "to": _at(24).isoformat()},
+    )
+
+    assert response.status_code == 200, response.text
+    [conflict] = response.json()
+    assert (conflict["user_id"], conflict["user_name"]) == (str(user.id), "Ana Twice")
+    assert (conflict["booking"]["id"], conflict["other_booking"]["id"]) == (str(first.id), str(second.id))
+    assert conflict["booking"]["cart_id"] != conflict["other_booking"]["cart_id"]
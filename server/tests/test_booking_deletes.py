@@ -0,0 +1,48 @@
+"""Deleting a cart or a user takes their bookings along and announces it."""
+from models.booking_participant import BookingParticipant
+from models.cart_booking import CartBooking
+
+
+def _book(client, cart, users, shift):
+    start, end = shift
+    response = client.post("/bookings", json={
+        "cart_id": str(cart.id),
+        "participant_ids": [str(u.id) for u in users],
+        "start_datetime": start,
+        "end_datetime": end,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _deleted_ids(booking_events):
+    return {e["id"] for e in booking_events.events if e["type"] == "deleted"}
+
+
+def test_delete_cart_deletes_and_announces_its_bookings(client, session, make_cart, make_user, shift, booking_events):
+    cart = make_cart()
+    booking_id = _book(client, cart, [make_user()], shift)
+
+    assert client.delete(f"/carts/{cart.id}").status_code == 200
+
+    assert session.query(CartBooking).count() == 0
+    booking_events.wait(lambda: booking_id in _deleted_ids(booking_events))
+
+
+def test_delete_user_deletes_only_their_own_bookings(
+    client, session, make_cart, make_user, shift, auth_headers, booking_events
+):
+    admin = make_user(roles=["admin"])
+    leaving, staying = make_user(), make_user()
+    alone = _book(client, make_cart(), [leaving], shift)
+    shared = _book(client, make_cart(), [leaving, staying], shift)
+
+    response = client.delete(f"/users/{leaving.id}", headers=auth_headers(admin))
+    assert response.status_code == 200, response.text
+
+    assert [str(b.id) for b in session.query(CartBooking).all()] == [shared]
+    participants = session.query(BookingParticipant.user_id).all()
+    assert [p.user_id for p in participants] == [staying.id]
+    assert session.query(CartBooking.user_id).scalar() is None
+    booking_events.wait(lambda: alone in _deleted_ids(booking_events))
+    assert shared not in _deleted_ids(booking_events)
@@ -0,0 +1,114 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from utils.booking_index import BookingIndex
+
+
+# Ahead of the wall clock, so the horizon set by listening() can be moved here
+NOW = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+
+
+class _FakeSession:
+    """warm() on an empty table."""
+
+    def query(self, *columns):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def all(self):
+        return []
+
+    def close(self):
+        pass
+
+
+def _live_index():
+    index = BookingIndex()
+    index._session_factory = _FakeSession
+    index.listening()
+    index.prune(NOW)
+    return index
+
+
+def _event(kind, booking_id, cart_id, start, end):
+    return {
+        "type": kind,
+        "id": str(booking_id),
+        "cart_id": str(cart_id),
+        "start_datetime": start.isoformat(),
+        "end_datetime": end.isoformat(),
+    }
+
+
+def test_applies_events_of_other_workers():
+    index = _live_index()
+    cart_id, booking_id = uuid.uuid4(), uuid.uuid4()
+    start = NOW + timedelta(days=1)
+
+    index.apply(_event("created", booking_id, cart_id, start, start + timedelta(hours=2)))
+    # Our own write arrives twice (local add + notify) and must count once
+    index.add(booking_id, cart_id, start, start + timedelta(hours=2))
+    assert index.overlap_count(cart_id, start, start + timedelta(hours=1)) == 1
+
+    index.apply(_event("deleted", booking_id, cart_id, start, start + timedelta(hours=2)))
+    assert index.overlap_count(cart_id, start, start + timedelta(hours=1)) == 0
+
+
+def test_only_covers_while_listening():
+    index = _live_index()
+    assert index.covers(NOW + timedelta(hours=1))
+
+    index.disconnected()
+    assert not index.covers(NOW + timedelta(hours=1))
+
+
+def test_prune_moves_horizon_and_drops_ended_bookings():
+    index = _live_index()
+    cart_id = uuid.uuid4()
+    ended, upcoming = uuid.uuid4(), uuid.uuid4()
+    index.add(ended, cart_id, NOW + timedelta(hours=1), NOW + timedelta(hours=2))
+    index.add(upcoming, cart_id, NOW + timedelta(hours=3), NOW + timedelta(hours=5))
+
+    index.prune(NOW + timedelta(hours=4))
+
+    assert not index.covers(NOW + timedelta(hours=1))
+    assert index.covers(NOW + timedelta(hours=4))
+    assert index.overlap_count(cart_id, NOW, NOW + timedelta(hours=6)) == 1
+    assert set(index._carts[cart_id].bookings) == {upcoming}
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_follows_bookings_made_through_pg_notify(client, make_cart, make_user, shift):
+    """A separate index only sees the booking through the notify path, like another worker."""
+    from db.database import SessionLocal
+    from utils.booking_events import BookingEventHub
+
+    cart, user = make_cart(), make_user()
+    start, end = shift
+    window = (datetime.fromisoformat(start), datetime.fromisoformat(end))
+
+    index, hub = BookingIndex(), BookingEventHub()
+    index.follow(hub, SessionLocal)
+    try:
+        _wait_for(lambda: index.live)
+
+        response = client.post("/bookings", json={
+            "cart_id": str(cart.id), "participant_ids": [str(user.id)], "start_datetime": start, "end_datetime": end,
+        })
+        assert response.status_code == 201
+        _wait_for(lambda: index.overlap_count(cart.id, *window) == 1)
+
+        deleted = client.delete(f"/bookings/{response.json()['id']}", params={"user_id": str(user.id)})
+        assert deleted.status_code == 200
+        _wait_for(lambda: index.overlap_count(cart.id, *window) == 0)
+    finally:
+        hub.remove_listener(index)
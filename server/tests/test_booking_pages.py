@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+from models.booking_participant import BookingParticipant
+from models.cart_booking import CartBooking
+
+
+def _book(session, cart, user, start):
+    booking = CartBooking(cart_id=cart.id, user_id=user.id, start_datetime=start, end_datetime=start + timedelta(hours=2))
+    session.add(booking)
+    session.flush()
+    session.add(BookingParticipant(booking_id=booking.id, user_id=user.id))
+    return booking
+
+
+def test_lists_start_now_unless_from_is_given(client, session, make_cart, make_user):
+    cart, user = make_cart(), make_user()
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    past = [_book(session, cart, user, now - timedelta(days=d)) for d in (30, 2)]
+    upcoming = [_book(session, cart, user, now + timedelta(days=d)) for d in (1, 3, 8)]
+    session.commit()
+
+    for path, params in ((f"/bookings/cart/{cart.id}", {}), ("/bookings/my-bookings", {"user_id": str(user.id)})):
+        response = client.get(path, params=params)
+        assert [b["id"] for b in response.json()] == [str(b.id) for b in upcoming]
+
+        history = client.get(path, params={**params, "from": (now - timedelta(days=60)).isoformat()})
+        assert [b["id"] for b in history.json()] == [str(b.id) for b in past + upcoming]
+
+
+def test_cursor_walks_the_pages(client, session, make_cart, make_user):
+    cart, user = make_cart(), make_user()
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    # Equal start times: the cursor's id tie-break must neither skip nor repeat
+    bookings = [_book(session, cart, user, start + timedelta(days=d // 2)) for d in range(5)]
+    session.commit()
+    expected = [str(b.id) for b in sorted(bookings, key=lambda b: (b.start_datetime, b.id))]
+
+    seen, cursor = [], None
+    while True:
+        response = client.get(f"/bookings/cart/{cart.id}", params={"limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen += [b["id"] for b in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert seen == expected
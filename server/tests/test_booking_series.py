@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+from models.cart_booking import CartBooking
+from schemas.booking import MAX_BULK_BOOKINGS
+
+
+def _series(cart, user, **fields):
+    return {
+        "cart_id": str(cart.id),
+        "participant_ids": [str(user.id)],
+        "start_datetime": "2027-06-05T10:00:00+02:00",
+        "end_datetime": "2027-06-05T12:00:00+02:00",
+        "recurrence": "weekly",
+        "until": "2027-06-26",
+        "timezone": "Europe/Madrid",
+        **fields,
+    }
+
+
+def test_series_ending_before_its_first_day_is_rejected(client, session, make_cart, make_user):
+    # 00:30 in Madrid is still the previous day in UTC
+    response = client.post("/bookings/series", json=_series(
+        make_cart(), make_user(),
+        start_datetime="2027-06-05T00:30:00+02:00", end_datetime="2027-06-05T02:00:00+02:00", until="2027-06-04",
+    ))
+
+    assert response.status_code == 422
+    assert session.query(CartBooking).count() == 0
+
+
+def test_runaway_series_is_rejected(client, session, make_cart, make_user):
+    response = client.post("/bookings/series", json=_series(make_cart(), make_user(), until="2999-12-31"))
+
+    assert response.status_code == 400
+    assert str(MAX_BULK_BOOKINGS) in response.json()["detail"]
+    assert session.query(CartBooking).count() == 0
+
+
+def test_series_delete_from_date_is_midnight_in_the_series_timezone(client, session, make_cart, make_user):
+    user = make_user()
+    created = client.post("/bookings/series", json=_series(
+        make_cart(), user, start_datetime="2027-06-05T00:30:00+02:00", end_datetime="2027-06-05T02:00:00+02:00",
+    ))
+    assert created.status_code == 201, created.text
+    assert len(created.json()) == 4
+    series_id = created.json()[0]["series_id"]
+
+    # The 12 June occurrence starts at 22:30 UTC on the 11th; a UTC bound would keep it
+    response = client.delete(f"/bookings/series/{series_id}", params={
+        "user_id": str(user.id), "from_date": "2027-06-12", "timezone": "Europe/Madrid",
+    })
+
+    assert response.status_code == 200, response.text
+    assert response.json()["deleted"] == 3
+    remaining = session.query(CartBooking.start_datetime).filter(CartBooking.series_id == series_id).all()
+    assert [row.start_datetime for row in remaining] == [datetime(2027, 6, 4, 22, 30, tzinfo=timezone.utc)]
@@ -0,0 +1,57 @@
+"""
+The write paths move conductor_stats by +1/-1; after any sequence of writes
+the rollup must equal a full rebuild from meeting_points.
+"""
+from models.conductor_stat import ConductorStat
+from utils.conductor_stats import rebuild_conductor_stats
+
+
+def _rollup(session):
+    session.expire_all()
+    return sorted(
+        (row.year, row.month, str(row.conductor_id), row.count, row.last_date)
+        for row in session.query(ConductorStat)
+    )
+
+
+def _rebuilt(session):
+    rebuild_conductor_stats(session)
+    rows = _rollup(session)
+    session.rollback()
+    return rows
+
+
+def test_incremental_rollup_matches_a_rebuild(client, session, make_user, auth_headers):
+    planner = make_user(roles=["fieldserviceplanner"])
+    ana, ben = make_user(), make_user()
+    headers = auth_headers(planner)
+
+    series = client.post("/meeting-points/series", headers=headers, json={
+        "start_date": "2026-01-05", "end_date": "2026-03-30", "recurrence": "weekly",
+        "time": "10:00", "location": "Plaza Mayor", "conductor_id": str(ana.id),
+    })
+    assert series.status_code == 200, series.text
+    series_id = series.json()[0]["series_id"]
+    single = client.post("/meeting-points", headers=headers, json={
+        "date": "2026-01-31", "time": "17:00", "location": "Estación", "conductor_id": str(ana.id),
+    })
+    assert single.status_code == 200, single.text
+    assert _rollup(session) == _rebuilt(session)
+
+    # Hand the series over from February on, move and reassign the single one
+    assert client.patch(
+        f"/meeting-points/series/{series_id}", headers=headers,
+        params={"from_date": "2026-02-01"}, json={"conductor_id": str(ben.id)},
+    ).status_code == 200
+    assert client.put(
+        f"/meeting-points/{single.json()['id']}", headers=headers,
+        json={"date": "2026-01-02", "conductor_id": str(ben.id)},
+    ).status_code == 200
+    assert _rollup(session) == _rebuilt(session)
+
+    # Dropping the last meeting point of a month takes its row and last_date along
+    assert client.delete(
+        f"/meeting-points/series/{series_id}", headers=headers, params={"from_date": "2026-03-20"},
+    ).status_code == 200
+    assert client.delete(f"/meeting-points/{single.json()['id']}", headers=headers).status_code == 200
+    assert _rollup(session) == _rebuilt(session)
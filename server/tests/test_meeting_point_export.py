@@ -0,0 +1,98 @@
+import time as clock
+from datetime import date, time
+
+from models.meeting_point import MeetingPoint
+from utils.pdf_jobs import render_pdf_file, stream_sections
+
+
+def _meeting_point(session, day, conductor=None):
+    mp = MeetingPoint(date=day, time=time(10, 0), location="Plaza Mayor", conductor_id=conductor and conductor.id)
+    session.add(mp)
+    return mp
+
+
+def test_stream_sections_yields_every_month_in_order(session, make_user):
+    conductor = make_user(firstname="Ana", lastname="García")
+    _meeting_point(session, date(2026, 1, 5), conductor)
+    _meeting_point(session, date(2026, 1, 20))
+    _meeting_point(session, date(2026, 3, 2))
+    _meeting_point(session, date(2026, 5, 1))  # outside the range
+    session.commit()
+
+    sections = list(stream_sections(session, "2026-01", "2026-04"))
+
+    assert [month for month, _ in sections] == ["2026-01", "2026-02", "2026-03", "2026-04"]
+    assert [len(rows) for _, rows in sections] == [2, 0, 1, 0]
+    first = sections[0][1][0]
+    assert (first.conductor.firstname, first.conductor.lastname) == ("Ana", "García")
+    assert sections[0][1][1].conductor is None
+
+
+def test_render_pdf_file_reads_the_range_itself(session, tmp_path):
+    _meeting_point(session, date(2026, 2, 10))
+    session.commit()
+
+    path = render_pdf_file("2026-01", "2026-03", str(tmp_path / "export.pdf"))
+
+    with open(path, "rb") as f:
+        assert f.read(5) == b"%PDF-"
+    assert [p.name for p in tmp_path.iterdir()] == ["export.pdf"]
+
+
+def test_export_answers_202_with_the_job_until_rendered(client, session, make_user, auth_headers):
+    user = make_user()
+    _meeting_point(session, date(2026, 2, 10))
+    session.commit()
+
+    response = client.get("/meeting-points/export", params={"month": "2026-02"}, headers=auth_headers(user))
+    assert response.status_code == 202, response.text
+    job = response.json()
+    assert response.headers["location"] == f"/meeting-points/export-jobs/{job['job_id']}"
+
+    deadline = clock.monotonic() + 60
+    while job["status"] != "done":
+        assert job["status"] != "failed", job["error"]
+        assert clock.monotonic() < deadline, "export did not finish"
+        clock.sleep(0.2)
+        job = client.get(f"/meeting-points/export-jobs/{job['job_id']}", headers=auth_headers(user)).json()
+
+    response = client.get("/meeting-points/export", params={"month": "2026-02"}, headers=auth_headers(user))
+    assert response.status_code == 200
+    assert response.content.startswith(b"%PDF-")
+
+
+def _rendered_export(client, headers, month):
+    """GET the export, polling its job while it renders."""
+    deadline = clock.monotonic() + 60
+    while True:
+        response = client.get("/meeting-points/export", params={"month": month}, headers=headers)
+        if response.status_code != 202:
+            return response
+        assert clock.monotonic() < deadline, "export did not finish"
+        clock.sleep(0.2)
+
+
+def test_etag_follows_the_month_content_version(client, session, make_user, auth_headers):
+    planner = make_user(roles=["fieldserviceplanner"])
+    headers = auth_headers(planner)
+    _meeting_point(session, date(2026, 4, 10))
+    session.commit()
+
+    first = _rendered_export(client, headers, "2026-04")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert _rendered_export(client, {**headers, "If-None-Match": etag}, "2026-04").status_code == 304
+
+    def add(day):
+        response = client.post("/meeting-points", headers=headers, json={"date": day, "time": "10:00", "location": "Estación"})
+        assert response.status_code == 200
+
+    # An edit in another month keeps the tag, one in this month changes it
+    add("2026-05-02")
+    assert _rendered_export(client, {**headers, "If-None-Match": etag}, "2026-04").status_code == 304
+    add("2026-04-20")
+    changed = _rendered_export(client, {**headers, "If-None-Match": etag}, "2026-04")
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.content.startswith(b"%PDF-")
@@ -0,0 +1,67 @@
+import gc
+import io
+import re
+import weakref
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+from utils.meeting_point_pdf import generate_meeting_points_range_pdf
+
+
+def _rows(month: str, per_day: int):
+    first = date.fromisoformat(f"{month}-01")
+    return [
+        SimpleNamespace(
+            date=first + timedelta(days=d),
+            time=time(9 + i, 0),
+            location=f"Plaza {i}",
+            conductor=SimpleNamespace(firstname="Ana", lastname="García") if i else None,
+            outline="Tema",
+            link="https://example.org" if i else None,
+        )
+        for d in range(28)
+        for i in range(per_day)
+    ]
+
+
+def _page_count(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+def test_months_start_on_new_pages_and_long_tables_continue():
+    one_page = io.BytesIO()
+    generate_meeting_points_range_pdf([("2026-02", [])], one_page)
+    assert _page_count(one_page.getvalue()) == 1
+
+    long_month = io.BytesIO()
+    generate_meeting_points_range_pdf([("2026-02", _rows("2026-02", 3))], long_month)
+    pages_per_month = _page_count(long_month.getvalue())
+    assert pages_per_month > 1
+
+    three = io.BytesIO()
+    generate_meeting_points_range_pdf(
+        [("2026-02", _rows("2026-02", 3)), ("2026-03", []), ("2026-04", _rows("2026-04", 3))],
+        three,
+    )
+    assert _page_count(three.getvalue()) == 2 * pages_per_month + 1
+
+
+class _Month(list):
+    """A list that can be weakly referenced."""
+
+
+def test_sections_are_consumed_lazily():
+    """Only the current month's rows (and the one just finished) stay alive."""
+    alive = []
+
+    def sections():
+        for n, month in enumerate(["2026-01", "2026-02", "2026-03", "2026-04"]):
+            gc.collect()
+            # Two months back must be gone by the time the next month is read
+            assert all(ref() is None for ref in alive[:max(0, n - 1)])
+            rows = _Month(_rows(month, 2))
+            alive.append(weakref.ref(rows))
+            yield month, rows
+
+    generate_meeting_points_range_pdf(sections(), io.BytesIO())
+    assert len(alive) == 4
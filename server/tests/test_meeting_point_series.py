@@ -0,0 +1,72 @@
+import uuid
+from datetime import date, time
+
+from models.meeting_point import MeetingPoint
+
+
+def _create_series(client, headers):
+    response = client.post("/meeting-points/series", headers=headers, json={
+        "start_date": "2026-01-03", "end_date": "2026-01-31", "recurrence": "weekly",
+        "time": "10:00", "location": "Plaza Mayor",
+    })
+    assert response.status_code == 200, response.text
+    return response.json()[0]["series_id"]
+
+
+def _occurrences(session, series_id):
+    session.expire_all()
+    return [
+        (row.date, row.time, row.location)
+        for row in session.query(MeetingPoint.date, MeetingPoint.time, MeetingPoint.location)
+        .filter(MeetingPoint.series_id == series_id)
+        .order_by(MeetingPoint.date)
+    ]
+
+
+def test_patch_series_from_date_changes_this_and_following(client, session, make_user, auth_headers):
+    headers = auth_headers(make_user(roles=["fieldserviceplanner"]))
+    series_id = _create_series(client, headers)
+
+    response = client.patch(
+        f"/meeting-points/series/{series_id}", headers=headers,
+        params={"from_date": "2026-01-17"}, json={"time": "17:30", "location": "Estación"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"ok": True, "updated": 3}
+    assert _occurrences(session, series_id) == [
+        (date(2026, 1, 3), time(10, 0), "Plaza Mayor"),
+        (date(2026, 1, 10), time(10, 0), "Plaza Mayor"),
+        (date(2026, 1, 17), time(17, 30), "Estación"),
+        (date(2026, 1, 24), time(17, 30), "Estación"),
+        (date(2026, 1, 31), time(17, 30), "Estación"),
+    ]
+
+
+def test_patch_series_rejects_bad_input(client, session, make_user, auth_headers):
+    headers = auth_headers(make_user(roles=["fieldserviceplanner"]))
+    series_id = _create_series(client, headers)
+
+    assert client.patch(f"/meeting-points/series/{series_id}", headers=headers, json={}).status_code == 400
+    assert client.patch(f"/meeting-points/series/{series_id}", headers=headers, json={"location": None}).status_code == 422
+    assert client.patch(
+        f"/meeting-points/series/{series_id}", headers=headers, json={"conductor_id": str(uuid.uuid4())},
+    ).status_code == 404
+    assert client.patch(
+        f"/meeting-points/series/{uuid.uuid4()}", headers=headers, json={"location": "Estación"},
+    ).status_code == 404
+    assert {location for _, _, location in _occurrences(session, series_id)} == {"Plaza Mayor"}
+
+
+def test_delete_series_from_date_keeps_earlier_occurrences(client, session, make_user, auth_headers):
+    headers = auth_headers(make_user(roles=["fieldserviceplanner"]))
+    series_id = _create_series(client, headers)
+
+    response = client.delete(f"/meeting-points/series/{series_id}", headers=headers, params={"from_date": "2026-01-24"})
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"ok": True, "deleted": 2}
+    assert [day for day, _, _ in _occurrences(session, series_id)] == [date(2026, 1, 3), date(2026, 1, 10), date(2026, 1, 17)]
+
+    assert client.delete(f"/meeting-points/series/{series_id}", headers=headers).json()["deleted"] == 3
+    assert client.delete(f"/meeting-points/series/{series_id}", headers=headers).status_code == 404
@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from utils.occupancy_heatmap import build_occupancy_matrix
+
+START = datetime(2026, 3, 2, 8, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+def _at(minutes):
+    return START + timedelta(minutes=minutes)
+
+
+def test_back_to_back_bookings_in_one_bucket_count_once():
+    cart = uuid.uuid4()
+    intervals = [(cart, _at(0), _at(20)), (cart, _at(20), _at(40)), (cart, _at(40), _at(60))]
+
+    matrix = build_occupancy_matrix(intervals, [cart], START, START + 2 * HOUR, HOUR)
+
+    assert matrix.tolist() == [[1, 0]]
+
+
+def test_peak_inside_a_bucket_and_carried_over_buckets():
+    cart, idle = uuid.uuid4(), uuid.uuid4()
+    intervals = [
+        (cart, _at(-30), _at(150)),  # started before the range, runs into the third bucket
+        (cart, _at(10), _at(20)),
+        (cart, _at(70), _at(80)),
+    ]
+
+    matrix = build_occupancy_matrix(intervals, [cart, idle], START, START + 4 * HOUR, HOUR)
+
+    assert matrix.tolist() == [[2, 2, 1, 0], [0, 0, 0, 0]]
+
+
+def test_booking_ending_on_a_bucket_start_does_not_reach_into_it():
+    cart = uuid.uuid4()
+    intervals = [(cart, _at(0), _at(60)), (cart, _at(60), _at(90))]
+
+    matrix = build_occupancy_matrix(intervals, [cart], START, START + 3 * HOUR, HOUR)
+
+    assert matrix.tolist() == [[1, 1, 0]]
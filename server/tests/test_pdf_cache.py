@@ -0,0 +1,47 @@
+from utils.pdf_cache import PdfCache
+
+
+def test_least_recently_used_pdfs_are_evicted_by_size():
+    cache = PdfCache(max_bytes=10)
+    cache.put("2026-01-v1", b"aaaa")
+    cache.put("2026-02-v1", b"bbbb")
+    assert cache.get("2026-01-v1") == b"aaaa"  # now February is the least recently used
+
+    cache.put("2026-03-v1", b"cccc")
+
+    assert cache.get("2026-02-v1") is None
+    assert cache.get("2026-01-v1") == b"aaaa"
+    assert cache.stats()["size_bytes"] == 8
+
+
+def test_replacing_a_key_keeps_the_size_right():
+    cache = PdfCache(max_bytes=10)
+    cache.put("2026-01-v1", b"aaaa")
+    cache.put("2026-01-v1", b"aaaaaa")
+
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["size_bytes"] == 6
+
+
+def test_pdf_larger_than_the_cache_is_not_stored():
+    cache = PdfCache(max_bytes=10)
+    cache.put("2026-01-v1", b"aaaa")
+    cache.put("2026-02-v1", b"x" * 11)
+
+    assert cache.get("2026-02-v1") is None
+    assert cache.get("2026-01-v1") == b"aaaa"
+
+
+def test_new_content_version_never_gets_the_old_pdf():
+    """Keys carry the month's version: a bump is a miss, the old entry just ages out."""
+    cache = PdfCache(max_bytes=10)
+    cache.put("2026-01-v1", b"old1")
+
+    assert cache.get("2026-01-v2") is None
+    cache.put("2026-01-v2", b"new1")
+    cache.put("2026-02-v1", b"feb1")
+
+    assert cache.get("2026-01-v1") is None
+    assert cache.get("2026-01-v2") == b"new1"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
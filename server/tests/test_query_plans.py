@@ -0,0 +1,83 @@
+"""
+Query plans of the hot lookups on seeded tables. The tables are ANALYZEd
+after seeding, so these check what the planner really picks at that size.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, text
+
+from models.cart_booking import CartBooking
+from routers.auth import _login_user_query
+from routers.bookings import overlaps
+
+pytestmark = pytest.mark.slow
+
+
+def _plan_nodes(session, statement):
+    """EXPLAIN the statement and return its plan nodes, flattened."""
+    compiled = statement.compile(dialect=session.bind.dialect)
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    nodes, todo = [], [plan[0]["Plan"]]
+    while todo:
+        node = todo.pop()
+        nodes.append(node)
+        todo.extend(node.get("Plans", []))
+    return nodes
+
+
+def _index_names(nodes):
+    return {node["Index Name"] for node in nodes if "Index Name" in node}
+
+
+def _seq_scans(nodes):
+    return {node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"}
+
+
+def test_cart_overlap_count_uses_gist_index(session, make_cart):
+    carts = [make_cart() for _ in range(50)]
+    # A million past bookings, one hour each, every half hour round-robin over the carts
+    session.execute(
+        text(
+            "INSERT INTO cart_bookings (id, cart_id, start_datetime, end_datetime) "
+            "SELECT gen_random_uuid(), (CAST(:cart_ids AS uuid[]))[1 + g % :carts], "
+            "       now() - g * interval '30 minutes', now() - g * interval '30 minutes' + interval '1 hour' "
+            "FROM generate_series(1, 1000000) AS g"
+        ),
+        {"cart_ids": [str(c.id) for c in carts], "carts": len(carts)},
+    )
+    session.commit()
+    session.execute(text("ANALYZE cart_bookings"))
+
+    start = datetime.now(timezone.utc) - timedelta(days=90)
+    # The admission check of POST /bookings: overlapping bookings of one cart
+    query = session.query(CartBooking).filter(
+        CartBooking.cart_id == carts[0].id,
+        overlaps(start, start + timedelta(hours=2)),
+    )
+    nodes = _plan_nodes(session, select(func.count()).select_from(query.subquery()))
+
+    assert "ix_cart_bookings_cart_id_during" in _index_names(nodes)
+    assert "cart_bookings" not in _seq_scans(nodes)
+
+
+@pytest.mark.parametrize("identifier, index", [
+    ("user-123@example.org", "uq_users_lower_email"),
+    ("user-123", "uq_users_lower_username"),
+])
+def test_login_lookup_probes_lower_unique_index(session, identifier, index):
+    session.execute(text(
+        "INSERT INTO users (id, firstname, lastname, username, email, roles, active) "
+        "SELECT gen_random_uuid(), 'Seed', 'User ' || g, 'user-' || g, 'User-' || g || '@Example.org', "
+        "       ARRAY['publisher'], true "
+        "FROM generate_series(1, 20000) AS g"
+    ))
+    session.commit()
+    session.execute(text("ANALYZE users"))
+
+    nodes = _plan_nodes(session, _login_user_query(session, identifier).limit(1).statement)
+
+    assert index in _index_names(nodes)
+    assert "users" not in _seq_scans(nodes)
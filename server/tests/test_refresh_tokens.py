@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timedelta
+
+from auth.refresh_tokens import (
+    REUSE_DETECTION_DAYS,
+    ROTATION_GRACE_SECONDS,
+    issue_refresh_token,
+    purge_refresh_tokens,
+)
+from models.refresh_token import RefreshToken
+
+
+def _issue(session, user):
+    token = issue_refresh_token(session, user.id)
+    session.commit()
+    return token
+
+
+def _refresh(client, token):
+    return client.post("/auth/refresh", json={"refresh_token": str(token)})
+
+
+def _live_tokens(session, user):
+    session.expire_all()
+    return session.query(RefreshToken).filter(RefreshToken.user_id == user.id, RefreshToken.revoked == False).count()
+
+
+def _rotated_ago(session, token, seconds):
+    session.query(RefreshToken).filter(RefreshToken.token == token).update(
+        {"revoked_at": datetime.utcnow() - timedelta(seconds=seconds)}
+    )
+    session.commit()
+
+
+def test_rotation_revokes_the_presented_token(client, session, make_user):
+    user = make_user()
+    token = _issue(session, user)
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 200, response.text
+    rotated = session.query(RefreshToken).filter(RefreshToken.token == token).one()
+    assert rotated.revoked and rotated.revoked_at is not None
+    assert response.json()["refresh_token"] != str(token)
+    assert _live_tokens(session, user) == 1
+
+
+def test_reuse_within_the_grace_window_is_a_race(client, session, make_user):
+    user = make_user()
+    token = _issue(session, user)
+    _issue(session, user)  # another device
+    assert _refresh(client, token).status_code == 200
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token already rotated"
+    assert _live_tokens(session, user) == 2
+
+
+def test_reuse_after_the_grace_window_revokes_every_session(client, session, make_user):
+    user, bystander = make_user(), make_user()
+    token = _issue(session, user)
+    _issue(session, user)
+    _issue(session, bystander)
+    assert _refresh(client, token).status_code == 200
+    _rotated_ago(session, token, ROTATION_GRACE_SECONDS + 1)
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token reuse detected"
+    assert _live_tokens(session, user) == 0
+    assert _live_tokens(session, bystander) == 1
+
+
+def test_purge_deletes_stale_tokens_in_batches(session, make_user):
+    user = make_user()
+    now = datetime.utcnow()
+    reuse_window = timedelta(days=REUSE_DETECTION_DAYS)
+
+    def add(count, **fields):
+        for _ in range(count):
+            session.add(RefreshToken(**{
+                "user_id": user.id, "token": uuid.uuid4(), "expires_at": now + timedelta(days=1), "revoked": False,
+                **fields,
+            }))
+
+    add(5, expires_at=now - timedelta(minutes=1))
+    add(4, revoked=True, revoked_at=now - reuse_window - timedelta(minutes=1))
+    add(3, revoked=True, revoked_at=now - timedelta(hours=1))  # still needed for reuse detection
+    add(2)
+    session.commit()
+
+    assert purge_refresh_tokens(session, batch_size=2) == 9
+    assert session.query(RefreshToken).count() == 5
+    assert purge_refresh_tokens(session, batch_size=2) == 0
@@ -0,0 +1,66 @@
+import pytest
+
+from auth import token_cache
+from auth.token_cache import VerifiedTokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now = 1_000_000.0
+
+    monkeypatch.setattr(token_cache.time, "time", lambda: Clock.now)
+    return Clock
+
+
+def test_least_recently_used_token_is_evicted(clock):
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", {"sub": "a"})
+    cache.put("b", {"sub": "b"})
+    assert cache.get("a") == {"sub": "a"}  # now b is the least recently used
+
+    cache.put("c", {"sub": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"sub": "a"}
+    assert cache.get("c") == {"sub": "c"}
+    assert cache.stats()["entries"] == 2
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    cache.put("a", {"sub": "a"})
+
+    clock.now += 59
+    assert cache.get("a") == {"sub": "a"}
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_entry_never_outlives_the_token_exp(clock):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    cache.put("a", {"sub": "a", "exp": clock.now + 5})
+
+    clock.now += 4
+    assert cache.get("a") is not None
+    clock.now += 1
+    assert cache.get("a") is None
+
+
+def test_callers_get_copies_of_the_claims(clock):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    claims = {"sub": "a", "roles": ["admin"]}
+    cache.put("a", claims)
+    claims["sub"] = "changed"
+
+    cache.get("a")["sub"] = "changed too"
+
+    assert cache.get("a")["sub"] == "a"
+
+
+def test_disabled_cache_stores_nothing(clock):
+    cache = VerifiedTokenCache(max_entries=0, ttl_seconds=60)
+    cache.put("a", {"sub": "a"})
+    assert cache.get("a") is None
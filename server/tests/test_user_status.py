@@ -0,0 +1,131 @@
+import threading
+import time
+import uuid
+
+from auth.user_status import UserStatusCache
+
+
+class _Rows:
+    """Stands in for the session: serves the user row from a dict, counts queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+        self.before_read = None
+
+    def query(self, *columns):
+        return self
+
+    def filter(self, criterion):
+        self.key = str(criterion.right.value)
+        return self
+
+    def first(self):
+        self.queries += 1
+        if self.before_read:
+            self.before_read()
+        return self.rows.get(self.key)
+
+
+class _Row:
+    def __init__(self, active, roles):
+        self.active, self.roles = active, roles
+
+
+def _live_cache():
+    cache = UserStatusCache(ttl_seconds=60)
+    cache.listening()
+    return cache
+
+
+def test_caches_while_listening_only():
+    user_id = str(uuid.uuid4())
+    db = _Rows({user_id: _Row(True, ["admin"])})
+    cache = UserStatusCache(ttl_seconds=60)
+
+    cache.get(db, user_id)
+    cache.get(db, user_id)
+    assert db.queries == 2
+
+    cache.listening()
+    cache.get(db, user_id)
+    cache.get(db, user_id)
+    assert db.queries == 3
+
+    cache.disconnected()
+    cache.get(db, user_id)
+    assert db.queries == 4
+
+
+def test_invalidation_from_another_worker_applies_at_once():
+    user_id = str(uuid.uuid4())
+    db = _Rows({user_id: _Row(True, ["admin"])})
+    cache = _live_cache()
+    assert cache.get(db, user_id) == (True, ["admin"])
+
+    db.rows[user_id] = _Row(True, [])
+    cache.apply({"user_id": user_id})
+
+    assert cache.get(db, user_id) == (True, [])
+
+
+def test_row_read_before_an_invalidation_is_not_cached():
+    user_id = str(uuid.uuid4())
+    db = _Rows({user_id: _Row(True, ["admin"])})
+    cache = _live_cache()
+
+    def deactivate_meanwhile():
+        db.before_read = None
+        cache.invalidate(user_id)  # lands while our (stale) read is in flight
+
+    db.before_read = deactivate_meanwhile
+    assert cache.get(db, user_id) == (True, ["admin"])
+
+    db.rows[user_id] = _Row(False, [])
+    assert cache.get(db, user_id) == (False, [])
+
+
+def test_load_bookkeeping_is_dropped_after_loads():
+    db = _Rows({})
+    cache = _live_cache()
+    user_ids = [str(uuid.uuid4()) for _ in range(50)]
+
+    threads = [threading.Thread(target=cache.get, args=(db, u)) for u in user_ids]
+    for t in threads:
+        t.start()
+    for u in user_ids:
+        cache.invalidate(u)
+    for t in threads:
+        t.join()
+
+    assert cache._loads == {}
+
+
+def test_deactivation_reaches_other_workers(client, make_user, auth_headers):
+    """Two caches on their own LISTEN connections stand in for two workers."""
+    from db.database import SessionLocal
+    from utils.booking_events import BookingEventHub
+
+    admin, user = make_user(roles=["admin"]), make_user()
+    db = SessionLocal()
+    workers = [(UserStatusCache(ttl_seconds=3600), BookingEventHub()) for _ in range(2)]
+    try:
+        for cache, hub in workers:
+            cache.follow(hub)
+        deadline = time.monotonic() + 10
+        while not all(cache.live for cache, _ in workers):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        assert all(cache.get(db, str(user.id)) == (True, ["publisher"]) for cache, _ in workers)
+
+        response = client.patch(f"/users/{user.id}", params={"active": False}, headers=auth_headers(admin))
+        assert response.status_code == 200, response.text
+
+        deadline = time.monotonic() + 10
+        while any(cache.get(db, str(user.id))[0] for cache, _ in workers):
+            assert time.monotonic() < deadline, "a worker still sees the user as active"
+            time.sleep(0.05)
+    finally:
+        for cache, hub in workers:
+            hub.remove_listener(cache)
+        db.close()
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+
+from db.database import engine
+from models.cart_booking import CartBooking
+
+
+CHANNEL = "booking_events"
+POLL_SECONDS = 5
+RECONNECT_SECONDS = 5
+
+logger = logging.getLogger(__name__)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def publish_booking_events(db: Session, events: list[dict]):
+    """
+    Queue booking deltas with pg_notify inside the caller's transaction.
+    Postgres only delivers them on commit, and to every worker that is
+    listening, so a rolled back booking never shows up in a stream.
+    """
+    if not events:
+        return
+    payloads = [json.dumps(jsonable_encoder(e)) for e in events]
+    db.execute(
+        text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+        {"channel": CHANNEL, "payloads": payloads},
+    )
+
+
+def delete_bookings(db: Session, *criteria) -> list:
+    """
+    Delete the cart bookings matching `criteria` (participants go with them
+    via ON DELETE CASCADE) and queue a deleted event for each. Returns the
+    deleted (id, cart_id, start_datetime, end_datetime) rows; the caller
+    removes them from its booking index after commit.
+    """
+    deleted = db.execute(
+        delete(CartBooking)
+        .where(*criteria)
+        .returning(CartBooking.id, CartBooking.cart_id, CartBooking.start_datetime, CartBooking.end_datetime)
+    ).all()
+
+    publish_booking_events(db, [
+        {
+            "type": "deleted",
+            "id": row.id,
+            "cart_id": row.cart_id,
+            "start_datetime": row.start_datetime,
+            "end_datetime": row.end_datetime,
+        }
+        for row in deleted
+    ])
+    return deleted
+
+
+class _Subscriber:
+    def __init__(self, loop, cart_ids, start, end):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=1000)
+        self.cart_ids = cart_ids
+        self.start = start
+        self.end = end
+
+    def wants(self, cart_id: str, start: datetime, end: datetime) -> bool:
+        if self.cart_ids and cart_id not in self.cart_ids:
+            return False
+        if self.start and end <= self.start:
+            return False
+        if self.end and start >= self.end:
+            return False
+        return True
+
+    def push(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow client: drop the delta, it will catch up on its next full reload
+            pass
+
+
+class BookingEventHub:
+    """
+    Fans out booking NOTIFY messages to the SSE subscribers of this worker
+    and to in-process listeners (the booking index). One background thread
+    per worker holds a dedicated LISTEN connection; it is started with the
+    first subscriber or listener. While listeners are registered it
+    reconnects after errors and keeps running without subscribers.
+
+    Listeners may follow another channel than the booking one (the user
+    status cache does), the same connection LISTENs to all of them.
+    A listener has three methods, all called on the listen thread:
+    `listening()` once LISTEN on its channel is in place (again after every
+    reconnect, events from the gap were missed), `apply(event)` per JSON
+    payload and `disconnected()` when the connection is lost.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._listeners = []  # (channel, listener)
+        self._thread = None
+
+    def _ensure_thread(self):
+        # Caller holds self._lock
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._listen, daemon=True)
+            self._thread.start()
+
+    def subscribe(self, cart_ids=None, start=None, end=None) -> _Subscriber:
+        subscriber = _Subscriber(
+            asyncio.get_running_loop(),
+            {str(c) for c in cart_ids or []},
+            _utc(start) if start else None,
+            _utc(end) if end else None,
+        )
+        with self._lock:
+            self._subscribers.add(subscriber)
+            self._ensure_thread()
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def add_listener(self, listener, channel: str = CHANNEL):
+        with self._lock:
+            self._listeners.append((channel, listener))
+            self._ensure_thread()
+
+    def remove_listener(self, listener):
+        with self._lock:
+            self._listeners = [(c, l) for c, l in self._listeners if l is not listener]
+
+    def _dispatch(self, channel: str, payload: str):
+        event = json.loads(payload)
+
+        with self._lock:
+            subscribers = list(self._subscribers) if channel == CHANNEL else []
+            listeners = [l for c, l in self._listeners if c == channel]
+
+        for listener in listeners:
+            listener.apply(event)
+
+        if not subscribers:
+            return
+        cart_id = event["cart_id"]
+        start = _utc(datetime.fromisoformat(event["start_datetime"]))
+        end = _utc(datetime.fromisoformat(event["end_datetime"]))
+        for subscriber in subscribers:
+            if subscriber.wants(cart_id, start, end):
+                subscriber.loop.call_soon_threadsafe(subscriber.push, event)
+
+    def _listen(self):
+        while True:
+            try:
+                if self._listen_until_idle():
+                    return
+            except Exception:
+                logger.exception("Booking event listener stopped")
+
+            with self._lock:
+                listeners = [l for _, l in self._listeners]
+                if not listeners:
+                    self._thread = None
+                    return
+            for listener in listeners:
+                listener.disconnected()
+            time.sleep(RECONNECT_SECONDS)
+
+    def _listen_until_idle(self) -> bool:
+        """Returns True once nobody is interested any more (thread ends)."""
+        raw = engine.raw_connection()
+        raw.detach()  # keep the LISTEN session out of the pool
+        conn = raw.driver_connection
+        try:
+            conn.autocommit = True
+            channels, announced = set(), []
+
+            while True:
+                with self._lock:
+                    if not self._subscribers and not self._listeners:
+                        self._thread = None
+                        return True
+                    listeners = list(self._listeners)
+
+                # Listeners added since the last round (all of them after a reconnect)
+                for channel in {CHANNEL, *(c for c, _ in listeners)} - channels:
+                    conn.cursor().execute(f"LISTEN {channel}")
+                    channels.add(channel)
+                for _, listener in listeners:
+                    if not any(listener is seen for seen in announced):
+                        listener.listening()
+                        announced.append(listener)
+
+                if select.select([conn], [], [], POLL_SECONDS) == ([], [], []):
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        self._dispatch(notify.channel, notify.payload)
+                    except (ValueError, KeyError):
+                        logger.warning("Ignoring malformed event on %s: %s", notify.channel, notify.payload)
+        finally:
+            raw.close()
+
+
+booking_event_hub = BookingEventHub()
@@ -0,0 +1,220 @@
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from models.cart_booking import CartBooking
+
+
+PRUNE_INTERVAL_SECONDS = 60
+
+
+def _utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so they compare with timestamptz values."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class _CartIntervals:
+    """Sorted start and end points of one cart's bookings."""
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.bookings = {}  # booking_id -> (start, end)
+
+    def add(self, booking_id, start, end):
+        if booking_id in self.bookings:
+            return
+        self.bookings[booking_id] = (start, end)
+        insort(self.starts, start)
+        insort(self.ends, end)
+
+    def remove(self, booking_id):
+        interval = self.bookings.pop(booking_id, None)
+        if interval is None:
+            return
+        start, end = interval
+        del self.starts[bisect_left(self.starts, start)]
+        del self.ends[bisect_left(self.ends, end)]
+
+    def prune(self, horizon):
+        """Drop bookings that ended by `horizon`."""
+        self.bookings = {b: (s, e) for b, (s, e) in self.bookings.items() if e > horizon}
+        self.starts = sorted(s for s, _ in self.bookings.values())
+        self.ends = sorted(e for _, e in self.bookings.values())
+
+    def overlap_count(self, start, end):
+        # Bookings starting before `end`, minus those already over by `start`
+        return bisect_left(self.starts, end) - bisect_right(self.ends, start)
+
+
+class BookingIndex:
+    """
+    In-memory overlap index over upcoming cart bookings.
+
+    Only bookings ending after the horizon are held, so lookups for windows
+    that start earlier than that must go to the database (`covers()` tells
+    which). The horizon moves up to "now" every PRUNE_INTERVAL_SECONDS and
+    bookings that ended before it are dropped.
+
+    Every worker keeps its own copy. `follow()` keeps it current with the
+    writes of all workers through the booking event hub (pg_notify); the
+    index only answers (`covers()`) while that LISTEN connection is up,
+    after a reconnect it is warmed again since events may have been missed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._carts = {}
+        self._horizon = None
+        self._pruned_at = 0.0
+        self._session_factory = None
+        self.live = False
+
+    @property
+    def ready(self) -> bool:
+        return self._horizon is not None
+
+    def warm(self, db: Session, now: datetime | None = None):
+        horizon = _utc(now or datetime.now(timezone.utc))
+        rows = (
+            db.query(
+                CartBooking.id,
+                CartBooking.cart_id,
+                CartBooking.start_datetime,
+                CartBooking.end_datetime,
+            )
+            .filter(CartBooking.end_datetime > horizon)
+            .all()
+        )
+
+        carts = {}
+        for row in rows:
+            intervals = carts.setdefault(row.cart_id, _CartIntervals())
+            intervals.add(row.id, _utc(row.start_datetime), _utc(row.end_datetime))
+
+        with self._lock:
+            self._carts = carts
+            self._horizon = horizon
+            self._pruned_at = time.monotonic()
+
+    def follow(self, hub, session_factory):
+        """Apply booking events of every worker; warms on (re)connect."""
+        self._session_factory = session_factory
+        hub.add_listener(self)
+
+    # Booking event hub listener
+
+    def listening(self):
+        self.live = False
+        db = self._session_factory()
+        try:
+            self.warm(db)
+        finally:
+            db.close()
+        self.live = True
+
+    def apply(self, event: dict):
+        booking_id, cart_id = uuid.UUID(event["id"]), uuid.UUID(event["cart_id"])
+        if event["type"] == "created":
+            self.add(
+                booking_id,
+                cart_id,
+                datetime.fromisoformat(event["start_datetime"]),
+                datetime.fromisoformat(event["end_datetime"]),
+            )
+        elif event["type"] == "deleted":
+            self.remove(booking_id, cart_id)
+
+    def disconnected(self):
+        self.live = False
+
+    def prune(self, now: datetime | None = None):
+        """Move the horizon up to `now` and drop the bookings that ended."""
+        horizon = _utc(now or datetime.now(timezone.utc))
+        with self._lock:
+            if not self.ready or horizon <= self._horizon:
+                return
+            for cart_id in list(self._carts):
+                intervals = self._carts[cart_id]
+                intervals.prune(horizon)
+                if not intervals.bookings:
+                    del self._carts[cart_id]
+            self._horizon = horizon
+            self._pruned_at = time.monotonic()
+
+    def covers(self, start: datetime) -> bool:
+        if not (self.live and self.ready):
+            return False
+        if time.monotonic() - self._pruned_at >= PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        return _utc(start) >= self._horizon
+
+    def add(self, booking_id, cart_id, start: datetime, end: datetime):
+        if not self.ready or _utc(end) <= self._horizon:
+            return
+        with self._lock:
+            intervals = self._carts.setdefault(cart_id, _CartIntervals())
+            intervals.add(booking_id, _utc(start), _utc(end))
+
+    def remove(self, booking_id, cart_id):
+        if not self.ready:
+            return
+        with self._lock:
+            intervals = self._carts.get(cart_id)
+            if intervals:
+                intervals.remove(booking_id)
+
+    def overlap_count(self, cart_id, start: datetime, end: datetime) -> int:
+        with self._lock:
+            intervals = self._carts.get(cart_id)
+            if not intervals:
+                return 0
+            return intervals.overlap_count(_utc(start), _utc(end))
+
+    def diff(self, db: Session) -> dict:
+        """
+        Compare the index with the database. Returns the booking ids that
+        are missing from the index and those the index holds but the
+        database no longer has (or holds with different times).
+        """
+        if not self.ready:
+            raise RuntimeError("Booking index has not been warmed")
+
+        rows = (
+            db.query(
+                CartBooking.id,
+                CartBooking.cart_id,
+                CartBooking.start_datetime,
+                CartBooking.end_datetime,
+            )
+            .filter(CartBooking.end_datetime > self._horizon)
+            .all()
+        )
+        expected = {
+            row.id: (row.cart_id, _utc(row.start_datetime), _utc(row.end_datetime))
+            for row in rows
+        }
+
+        with self._lock:
+            actual = {
+                booking_id: (cart_id, start, end)
+                for cart_id, intervals in self._carts.items()
+                for booking_id, (start, end) in intervals.bookings.items()
+            }
+
+        return {
+            "missing": sorted(str(b) for b in expected.keys() - actual.keys()),
+            "stale": sorted(
+                str(b) for b in actual
+                if b not in expected or expected[b] != actual[b]
+            ),
+        }
+
+
+booking_index = BookingIndex()
@@ -0,0 +1,101 @@
+from collections import Counter
+
+from sqlalchemy import Integer, cast, delete, extract, func, insert, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models.conductor_stat import ConductorStat
+from models.meeting_point import MeetingPoint
+
+
+def apply_conductor_changes(db: Session, removed=(), added=()):
+    """
+    Move the conductor_stats rows along with a meeting point write, in the
+    caller's transaction. `removed` and `added` are the (conductor_id, date)
+    pairs of the written meeting points before and after the write; each
+    counts -1 / +1 for its conductor and month, pairs in both cancel out.
+    Costs one upsert over the touched (conductor, month) rows; last_date is
+    only re-read from meeting_points for rows that lost a meeting point.
+    """
+    removed = Counter((conductor_id, day) for conductor_id, day in removed if conductor_id is not None)
+    added = Counter((conductor_id, day) for conductor_id, day in added if conductor_id is not None)
+    unchanged = removed & added
+    removed -= unchanged
+    added -= unchanged
+    if not removed and not added:
+        return
+
+    deltas, latest = Counter(), {}
+    for (conductor_id, day), n in added.items():
+        key = (day.year, day.month, conductor_id)
+        deltas[key] += n
+        latest[key] = max(latest.get(key, day), day)
+    shrunk = set()
+    for (conductor_id, day), n in removed.items():
+        key = (day.year, day.month, conductor_id)
+        deltas[key] -= n
+        shrunk.add(key)
+
+    # Sorted, so concurrent writers lock the rows in the same order
+    rows = [
+        {"year": y, "month": m, "conductor_id": c, "count": deltas[(y, m, c)], "last_date": latest.get((y, m, c))}
+        for y, m, c in sorted(deltas, key=lambda key: (key[0], key[1], str(key[2])))
+    ]
+    stmt = pg_insert(ConductorStat).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ConductorStat.year, ConductorStat.month, ConductorStat.conductor_id],
+            set_={
+                "count": ConductorStat.count + stmt.excluded.count,
+                "last_date": func.greatest(ConductorStat.last_date, stmt.excluded.last_date),
+            },
+        )
+    )
+    if not shrunk:
+        return
+
+    keys = tuple_(ConductorStat.year, ConductorStat.month, ConductorStat.conductor_id).in_(shrunk)
+    db.execute(delete(ConductorStat).where(keys, ConductorStat.count <= 0))
+
+    # Pending ORM changes must be visible to the lookup below
+    db.flush()
+    first_day = func.make_date(ConductorStat.year, ConductorStat.month, 1)
+    last_date = (
+        select(func.max(MeetingPoint.date))
+        .where(
+            MeetingPoint.conductor_id == ConductorStat.conductor_id,
+            MeetingPoint.date >= first_day,
+            MeetingPoint.date < first_day + text("interval '1 month'"),
+        )
+        .scalar_subquery()
+    )
+    db.execute(update(ConductorStat).where(keys).values(last_date=last_date))
+
+
+def rebuild_conductor_stats(db: Session):
+    """
+    Recompute every conductor_stats row from meeting_points, in the caller's
+    transaction. The write paths keep the rollup current incrementally
+    (apply_conductor_changes); this is for scripts/rebuild_conductor_stats.py.
+    """
+    # Pending ORM changes must be visible to the INSERT ... SELECT below
+    db.flush()
+
+    year = cast(extract("year", MeetingPoint.date), Integer)
+    month = cast(extract("month", MeetingPoint.date), Integer)
+
+    db.execute(delete(ConductorStat))
+    db.execute(
+        insert(ConductorStat).from_select(
+            ["year", "month", "conductor_id", "count", "last_date"],
+            select(
+                year,
+                month,
+                MeetingPoint.conductor_id,
+                func.count(),
+                func.max(MeetingPoint.date),
+            )
+            .where(MeetingPoint.conductor_id.isnot(None))
+            .group_by(year, month, MeetingPoint.conductor_id),
+        )
+    )
@@ -0,0 +1,71 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import date
+
+
+COUNT_WEIGHT = 10  # one more meeting point this year outweighs ten days of rest
+SAME_DAY_PENALTY = 100  # per other meeting point conducted on the same day
+RECENCY_WINDOW_DAYS = 56  # gaps longer than this all count the same
+
+
+class ConductorPlanner:
+    """
+    Ranks eligible conductors for a date. Fewer meeting points this year, a
+    longer gap to the nearest other assignment and nothing else on the same
+    day all score higher. Counts and assignment dates are held in memory, so
+    a whole month can be planned greedily: every proposal counts against its
+    conductor for the slots that follow.
+
+    `conductors` is an ordered {user_id: (firstname, lastname)}; on equal
+    scores that order decides. `assignments` are (conductor_id, date) pairs
+    of existing meeting points around the planned dates.
+    """
+
+    def __init__(self, conductors: dict, counts: dict, assignments):
+        self.conductors = conductors
+        self.counts = {c: counts.get(c, 0) for c in conductors}
+        self.dates = {c: [] for c in conductors}
+        for conductor_id, day in assignments:
+            if conductor_id in self.dates:
+                insort(self.dates[conductor_id], day)
+
+    def _gap_and_same_day(self, conductor_id, day: date) -> tuple[int | None, int]:
+        dates = self.dates[conductor_id]
+        i = bisect_left(dates, day)
+        same_day = 0
+        while i + same_day < len(dates) and dates[i + same_day] == day:
+            same_day += 1
+
+        gaps = []
+        if i > 0:
+            gaps.append((day - dates[i - 1]).days)
+        if i + same_day < len(dates):
+            gaps.append((dates[i + same_day] - day).days)
+        return (min(gaps) if gaps else None), same_day
+
+    def score(self, conductor_id, day: date) -> dict:
+        gap, same_day = self._gap_and_same_day(conductor_id, day)
+        count = self.counts[conductor_id]
+        rest = RECENCY_WINDOW_DAYS if gap is None else min(gap, RECENCY_WINDOW_DAYS)
+        firstname, lastname = self.conductors[conductor_id]
+        return {
+            "user_id": conductor_id,
+            "firstname": firstname,
+            "lastname": lastname,
+            "count": count,
+            "gap_days": gap,
+            "same_day": same_day,
+            "score": rest - COUNT_WEIGHT * count - SAME_DAY_PENALTY * same_day,
+        }
+
+    def top(self, day: date, k: int) -> list[dict]:
+        """Best k candidates for `day`, via a k-sized heap instead of sorting everyone."""
+        return heapq.nlargest(
+            k,
+            (self.score(c, day) for c in self.conductors),
+            key=lambda s: s["score"],
+        )
+
+    def assign(self, conductor_id, day: date):
+        self.counts[conductor_id] += 1
+        insort(self.dates[conductor_id], day)
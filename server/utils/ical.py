@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+
+PRODID = "-//Congregation Organizer//Bookings//EN"
+UID_DOMAIN = "congregation-organizer"
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT value (RFC 5545, 3.3.11)."""
+    return (
+        (value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line to 75 octets, continuation lines start with a space."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # don't split inside a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # leading space of continuation lines
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_utc(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_local(value: datetime) -> str:
+    """Floating local time, for meeting points stored without a timezone."""
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def calendar_header(name: str) -> str:
+    return (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        + fold(f"PRODID:{PRODID}")
+        + "CALSCALE:GREGORIAN\r\n"
+        + fold(f"X-WR-CALNAME:{escape_text(name)}")
+    )
+
+
+def calendar_footer() -> str:
+    return "END:VCALENDAR\r\n"
+
+
+def vevent(uid, stamp: datetime, summary: str, start: str, end: str | None = None,
+           duration: str | None = None, location: str | None = None,
+           description: str | None = None, url: str | None = None) -> str:
+    """
+    Render one VEVENT. `start`/`end` are already formatted date-times
+    (see format_utc / format_local); pass `duration` (e.g. PT1H) instead
+    of `end` when there is no end time.
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@{UID_DOMAIN}",
+        f"DTSTAMP:{format_utc(stamp)}",
+        f"DTSTART:{start}",
+        f"DTEND:{end}" if end else f"DURATION:{duration or 'PT1H'}",
+        f"SUMMARY:{escape_text(summary)}",
+    ]
+    if location:
+        lines.append(f"LOCATION:{escape_text(location)}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
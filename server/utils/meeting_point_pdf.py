@@ -1,9 +1,9 @@
-import io
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame, Table, TableStyle, Paragraph, Spacer
 
 
 MONTH_NAMES_ES = {
@@ -18,18 +18,11 @@ DAY_NAMES_ES = {
 }
 
 
-def generate_meeting_points_pdf(meeting_points, month: str) -> io.BytesIO:
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        topMargin=15 * mm,
-        bottomMargin=15 * mm,
-        leftMargin=15 * mm,
-        rightMargin=15 * mm,
-    )
+PAGE_MARGIN = 15 * mm
 
-    styles = getSampleStyleSheet()
+
+def _month_flowables(meeting_points, month: str, styles) -> list:
+    """Title and table for one month."""
     elements = []
 
     cell_style = ParagraphStyle("cell", parent=styles["Normal"], fontSize=9, leading=11)
@@ -118,6 +111,41 @@ def generate_meeting_points_pdf(meeting_points, month: str) -> io.BytesIO:
     table.setStyle(TableStyle(style_cmds))
 
     elements.append(table)
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
+    return elements
+
+
+def generate_meeting_points_range_pdf(sections, output):
+    """
+    Write a multi-month PDF into `output` (a file-like object), one month
+    per section starting on a new page. `sections` is an iterable of
+    (month, meeting_points) and is consumed lazily: the next month is only
+    read once the current one is laid out, so one month's rows and tables
+    are alive at a time. Pages are filled through Frame.add / Frame.split,
+    so the month table continues on as many pages as it needs.
+    """
+    styles = getSampleStyleSheet()
+    width, height = A4
+    pdf = Canvas(output, pagesize=A4)
+
+    for number, (month, meeting_points) in enumerate(sections):
+        if number:
+            pdf.showPage()
+        story = _month_flowables(meeting_points, month, styles)
+        while story:
+            frame = Frame(PAGE_MARGIN, PAGE_MARGIN, width - 2 * PAGE_MARGIN, height - 2 * PAGE_MARGIN)
+            placed = False
+            while story:
+                if frame.add(story[0], pdf):
+                    story.pop(0)
+                    placed = True
+                    continue
+                parts = frame.split(story[0], pdf)
+                if not parts:
+                    break  # rest goes on the next page
+                story[0:1] = parts
+            if story:
+                if not placed:
+                    raise ValueError(f"Content of {month} does not fit on an empty page")
+                pdf.showPage()
+
+    pdf.save()
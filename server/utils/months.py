@@ -0,0 +1,31 @@
+from datetime import date
+
+
+def month_bounds(month: str) -> tuple[date, date]:
+    """
+    Half-open date range [first day, first day of next month) of a "YYYY-MM"
+    month, for range predicates on meeting_points.date.
+    "2026-12" -> (2026-12-01, 2027-01-01)
+    """
+    year, month_number = map(int, month.split("-"))
+    first = date(year, month_number, 1)
+    if month_number == 12:
+        return first, date(year + 1, 1, 1)
+    return first, date(year, month_number + 1, 1)
+
+
+def month_of(value: date) -> str:
+    return value.strftime("%Y-%m")
+
+
+def months_between(from_month: str, to_month: str) -> list[str]:
+    """Every "YYYY-MM" month from `from_month` through `to_month`."""
+    year, month = map(int, from_month.split("-"))
+    months = []
+    while f"{year:04d}-{month:02d}" <= to_month:
+        months.append(f"{year:04d}-{month:02d}")
+        month += 1
+        if month > 12:
+            month = 1
+            year += 1
+    return months
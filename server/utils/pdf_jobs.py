@@ -0,0 +1,250 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from types import SimpleNamespace
+
+
+STREAM_BATCH_ROWS = 500
+
+
+def stream_sections(db, from_month: str, to_month: str):
+    """
+    (month, rows) for every month from `from_month` through `to_month`,
+    empty months included. One date-range query, read in batches of
+    STREAM_BATCH_ROWS with yield_per; a month's rows are only collected
+    when the renderer asks for that month.
+    """
+    from models.meeting_point import MeetingPoint
+    from models.user import User
+    from utils.months import month_bounds, month_of, months_between
+
+    rows = (
+        db.query(
+            MeetingPoint.date,
+            MeetingPoint.time,
+            MeetingPoint.location,
+            MeetingPoint.outline,
+            MeetingPoint.link,
+            User.firstname,
+            User.lastname,
+        )
+        .outerjoin(User, User.id == MeetingPoint.conductor_id)
+        .filter(
+            MeetingPoint.date >= month_bounds(from_month)[0],
+            MeetingPoint.date < month_bounds(to_month)[1],
+        )
+        .order_by(MeetingPoint.date, MeetingPoint.time)
+        .yield_per(STREAM_BATCH_ROWS)
+    )
+
+    by_month = groupby(rows, key=lambda row: month_of(row.date))
+    pending = next(by_month, None)
+    for month in months_between(from_month, to_month):
+        if pending is None or pending[0] != month:
+            yield month, []
+            continue
+        yield month, [_pdf_row(row) for row in pending[1]]
+        pending = next(by_month, None)
+
+
+def _pdf_row(row) -> SimpleNamespace:
+    conductor = None
+    if row.firstname is not None:
+        conductor = SimpleNamespace(firstname=row.firstname, lastname=row.lastname)
+    return SimpleNamespace(
+        date=row.date,
+        time=row.time,
+        location=row.location,
+        conductor=conductor,
+        outline=row.outline,
+        link=row.link,
+    )
+
+
+def render_pdf_file(from_month: str, to_month: str, path: str) -> str:
+    """
+    Runs in a pool process: stream the meeting points of the month range
+    from the database into the PDF, written to a temporary file and moved
+    into place atomically.
+    """
+    from db.database import SessionLocal
+    from utils.meeting_point_pdf import generate_meeting_points_range_pdf
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    db = SessionLocal()
+    try:
+        with open(tmp_path, "wb") as f:
+            generate_meeting_points_range_pdf(stream_sections(db, from_month, to_month), f)
+    finally:
+        db.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+class PdfJob:
+    def __init__(self, job_id: str, key: str, path: str):
+        self.id = job_id
+        self.key = key
+        self.path = path
+        self.status = "queued"
+        self.error = None
+        self.future = None
+        self.finished_at = None
+
+
+class PdfJobQueueFull(Exception):
+    pass
+
+
+class PdfJobQueue:
+    """
+    Renders PDFs on a small process pool, outside the API workers.
+
+    The job id is derived from the content key (e.g. "2026-03-v4"), so
+    identical requests share one job and one file on disk. Finished files
+    are found by id even after a restart or from another API worker.
+
+    Every new content version adds a job and a file, so finished jobs and
+    files unused for `max_age_hours` are pruned, and beyond `max_files`
+    the least recently used files go first.
+    """
+
+    PRUNE_INTERVAL_SECONDS = 60
+
+    def __init__(
+        self,
+        directory: str,
+        max_workers: int = 2,
+        max_pending: int = 20,
+        max_age_hours: float = 24,
+        max_files: int = 200,
+    ):
+        self.directory = directory
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_age_seconds = max_age_hours * 3600
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._executor = None
+        self._last_prune = 0.0
+
+    @staticmethod
+    def job_id_for(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()[:24]
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.pdf")
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _pending(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status in ("queued", "running"))
+
+    def prune(self, now: float | None = None):
+        """Drop old finished jobs and delete old or surplus PDF files."""
+        now = time.time() if now is None else now
+        cutoff = now - self.max_age_seconds
+
+        with self._lock:
+            self._last_prune = now
+            for job_id, job in list(self._jobs.items()):
+                if job.status in ("done", "failed") and (job.finished_at or 0) < cutoff:
+                    del self._jobs[job_id]
+            active = {job.path for job in self._jobs.values() if job.status in ("queued", "running")}
+
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+
+        files = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if path in active or not (name.endswith(".pdf") or name.endswith(".tmp")):
+                continue
+            try:
+                files.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+
+        files.sort(reverse=True)  # most recently used first
+        for position, (mtime, path) in enumerate(files):
+            if mtime < cutoff or position >= self.max_files:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def submit(self, key: str, from_month: str, to_month: str) -> PdfJob:
+        """Render the months from `from_month` through `to_month`, one PDF section each."""
+        job_id = self.job_id_for(key)
+        path = self._path(job_id)
+
+        if time.time() - self._last_prune > self.PRUNE_INTERVAL_SECONDS:
+            self.prune()
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job and job.status in ("queued", "running"):
+                return job
+            if job and job.status == "done" and self._touch(path):
+                return job
+
+            job = PdfJob(job_id, key, path)
+            if self._touch(path):
+                job.status = "done"
+                job.finished_at = time.time()
+                self._jobs[job_id] = job
+                return job
+
+            if self._pending() >= self.max_pending:
+                raise PdfJobQueueFull()
+
+            job.future = self._pool().submit(render_pdf_file, from_month, to_month, path)
+            job.status = "running"
+            self._jobs[job_id] = job
+
+        def _finished(future, job=job):
+            with self._lock:
+                job.finished_at = time.time()
+                if future.exception():
+                    job.status = "failed"
+                    job.error = str(future.exception())
+                else:
+                    job.status = "done"
+
+        job.future.add_done_callback(_finished)
+        return job
+
+    @staticmethod
+    def _touch(path: str) -> bool:
+        """Mark an existing file as recently used (for pruning); False if it is gone."""
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def get(self, job_id: str) -> PdfJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                return job
+        path = self._path(job_id)
+        if os.path.exists(path):
+            job = PdfJob(job_id, None, path)
+            job.status = "done"
+            return job
+        return None
@@ -1,5 +1,6 @@
 import re
 import unicodedata
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from models.user import User
 
@@ -38,21 +39,21 @@ def generate_unique_username(base: str, db: Session) -> str:
     slug = slugify_username(base)
 
     # Check if the base slug is available
-    if not db.query(User).filter(User.username == slug).first():
+    if is_username_available(slug, db):
         return slug
 
     # Find a unique variant by appending numbers
     counter = 1
     while True:
         candidate = f"{slug}{counter}"
-        if not db.query(User).filter(User.username == candidate).first():
+        if is_username_available(candidate, db):
             return candidate
         counter += 1
 
 
 def is_username_available(username: str, db: Session) -> bool:
-    """Check if a username is available."""
-    return not db.query(User).filter(User.username == username).first()
+    """Check if a username is available (case-insensitive, like the unique index)."""
+    return not db.query(User).filter(func.lower(User.username) == username.lower()).first()
 
 
 def get_suggested_username(base: str, db: Session) -> str: